@@ -1,83 +1,181 @@
 from __future__ import annotations
 
+import importlib
 import json
-from argparse import ArgumentParser, BooleanOptionalAction, Namespace
-from collections.abc import Callable, Sequence
-
-from ai_arbitration_dao.commands import (
-    run_agent_health_check,
-    run_bind_resolver,
-    run_bootstrap_arbitration_dao,
-    run_create_ruling_proposal,
-    run_execute_ruling_proposal,
-    run_reconcile_agent_runtime,
-    run_submit_vote,
-    run_verify_ruling_status,
-)
-from ai_arbitration_dao.config import AppSettings, get_settings
+import sys
+from argparse import SUPPRESS, ArgumentParser, ArgumentTypeError, BooleanOptionalAction, Namespace
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from ai_arbitration_dao.types import CommandResult, CommandStatus, SeatProvider
 
-CommandHandler = Callable[[Namespace, AppSettings], CommandResult]
-
-COMMAND_HANDLERS: dict[str, CommandHandler] = {
-    "bootstrap-arbitration-dao": run_bootstrap_arbitration_dao,
-    "bind-resolver": run_bind_resolver,
-    "create-ruling-proposal": run_create_ruling_proposal,
-    "submit-vote": run_submit_vote,
-    "execute-ruling-proposal": run_execute_ruling_proposal,
-    "verify-ruling-status": run_verify_ruling_status,
-    "agent-health-check": run_agent_health_check,
-    "reconcile-agent-runtime": run_reconcile_agent_runtime,
-}
+if TYPE_CHECKING:
+    from ai_arbitration_dao.config import AppSettings
 
+CommandHandler = Callable[[Namespace, "AppSettings"], CommandResult]
 
-def build_parser() -> ArgumentParser:
-    parser = ArgumentParser(prog="ai-arbitration-dao", description="AI Arbitration DAO CLI")
-    parser.add_argument("--json", action="store_true", help="emit machine-readable JSON output")
 
-    subparsers = parser.add_subparsers(dest="command", required=True)
+class LazyCommandRegistry(Mapping[str, CommandHandler]):
+    """Command-name to handler mapping that imports each handler module on first use.
+
+    Targets are ``"module:attribute"`` strings, so listing or membership checks never
+    import command modules (and their solders/pydantic dependencies).
+    """
+
+    def __init__(self, targets: Mapping[str, str]) -> None:
+        self._targets = dict(targets)
+        self._loaded: dict[str, CommandHandler] = {}
+
+    def __getitem__(self, command: str) -> CommandHandler:
+        handler = self._loaded.get(command)
+        if handler is None:
+            module_name, _, attribute = self._targets[command].partition(":")
+            handler = getattr(importlib.import_module(module_name), attribute)
+            self._loaded[command] = handler
+        return handler
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def __contains__(self, command: object) -> bool:
+        return command in self._targets
+
 
-    bootstrap = subparsers.add_parser("bootstrap-arbitration-dao")
+COMMAND_HANDLERS = LazyCommandRegistry(
+    {
+        "bootstrap-arbitration-dao": (
+            "ai_arbitration_dao.commands.bootstrap:run_bootstrap_arbitration_dao"
+        ),
+        "bind-resolver": "ai_arbitration_dao.commands.bind_resolver:run_bind_resolver",
+        "create-ruling-proposal": (
+            "ai_arbitration_dao.commands.create_ruling_proposal:run_create_ruling_proposal"
+        ),
+        "submit-vote": "ai_arbitration_dao.commands.submit_vote:run_submit_vote",
+        "execute-ruling-proposal": (
+            "ai_arbitration_dao.commands.execute_ruling_proposal:run_execute_ruling_proposal"
+        ),
+        "verify-ruling-status": (
+            "ai_arbitration_dao.commands.verify_ruling_status:run_verify_ruling_status"
+        ),
+        "agent-health-check": (
+            "ai_arbitration_dao.commands.agent_health_check:run_agent_health_check"
+        ),
+        "reconcile-agent-runtime": (
+            "ai_arbitration_dao.commands.reconcile_agent_runtime:run_reconcile_agent_runtime"
+        ),
+    }
+)
+
+
+def _add_bootstrap_arguments(bootstrap: ArgumentParser) -> None:
     bootstrap.add_argument("--creator", required=True)
     bootstrap.add_argument("--realm-name", default="ai-arbitration-realm")
     bootstrap.add_argument("--custom-panel", default="")
 
-    bind = subparsers.add_parser("bind-resolver")
+
+def _add_bind_arguments(bind: ArgumentParser) -> None:
     bind.add_argument("--governance-address", required=True)
-    bind.add_argument("--resolver-address", required=True)
-
-    create = subparsers.add_parser("create-ruling-proposal")
-    create.add_argument("--safe", required=True)
-    create.add_argument("--payout-id", required=True, type=int)
-    create.add_argument("--dispute-id", required=True)
-    create.add_argument("--round", required=True, type=int)
-    create.add_argument("--outcome", required=True, choices=["Allow", "Deny"])
+    bind.add_argument("--resolver-address")
+    bind.add_argument(
+        "--safe",
+        action="append",
+        dest="safes",
+        help="SafePolicy address whose on-chain resolver is checked; may be repeated",
+    )
+    bind.add_argument(
+        "--all",
+        action="store_true",
+        help="check every SafePolicy account of the safe-treasury program",
+    )
+
+
+# Required for a single proposal; supplied per row instead when --input is given.
+CREATE_SNAPSHOT_OPTIONS: dict[str, str] = {
+    "safe": "--safe",
+    "payout_id": "--payout-id",
+    "dispute_id": "--dispute-id",
+    "round": "--round",
+    "outcome": "--outcome",
+}
+
+
+def _add_create_arguments(create: ArgumentParser) -> None:
+    create.add_argument("--safe")
+    create.add_argument("--payout-id", type=int)
+    create.add_argument("--dispute-id")
+    create.add_argument("--round", type=int)
+    create.add_argument("--outcome", choices=["Allow", "Deny"])
     create.add_argument("--is-final", action="store_true")
+    create.add_argument(
+        "--input",
+        default=None,
+        help=(
+            "CSV or NDJSON file of disputes (safe,payout_id,dispute_id,round,outcome,is_final); "
+            "--is-final applies to rows that leave is_final empty"
+        ),
+    )
 
-    vote = subparsers.add_parser("submit-vote")
+
+def _check_create_arguments(parser: ArgumentParser, args: Namespace) -> None:
+    given = [
+        flag for dest, flag in CREATE_SNAPSHOT_OPTIONS.items() if getattr(args, dest) is not None
+    ]
+    if args.input is not None:
+        if given:
+            parser.error(f"--input cannot be combined with: {', '.join(given)}")
+        return
+
+    missing = [flag for flag in CREATE_SNAPSHOT_OPTIONS.values() if flag not in given]
+    if missing:
+        parser.error(f"the following arguments are required: {', '.join(missing)}")
+
+
+def _add_vote_arguments(vote: ArgumentParser) -> None:
     vote.add_argument("--proposal-id", required=True)
     vote.add_argument("--voter", required=True)
     vote_group = vote.add_mutually_exclusive_group(required=False)
     vote_group.add_argument("--approve", dest="approve", action="store_true", default=True)
     vote_group.add_argument("--deny", dest="approve", action="store_false")
 
-    execute = subparsers.add_parser("execute-ruling-proposal")
+
+def _add_execute_arguments(execute: ArgumentParser) -> None:
     execute.add_argument("--proposal-id", required=True)
     execute.add_argument("--already-ruled", action="store_true")
     execute.add_argument("--dispute-id", required=False, default="")
     execute.add_argument("--round", type=int, required=False, default=0)
     execute.add_argument("--proposal-proof", type=json.loads, required=False, default=None)
+    execute.add_argument(
+        "--onchain-proof",
+        action="store_true",
+        help="Read the proposal's executed state from its Realms ProposalV2 account.",
+    )
+    execute.add_argument(
+        "--governance-address",
+        help="Governance the safe's resolver is bound to; required with --onchain-proof.",
+    )
+
 
-    verify = subparsers.add_parser("verify-ruling-status")
-    verify.add_argument("--dispute-id", required=True)
-    verify.add_argument("--round", required=True, type=int)
+def _add_verify_arguments(verify: ArgumentParser) -> None:
+    verify.add_argument("--dispute-id")
+    verify.add_argument("--round", type=int)
+    verify.add_argument(
+        "--dispute",
+        action="append",
+        dest="disputes",
+        metavar="DISPUTE_ID:ROUND",
+        help="Additional dispute/round pair to verify; may be repeated.",
+    )
     verify.add_argument(
         "--expected-status",
-        required=True,
         choices=[status.value for status in CommandStatus],
     )
 
-    health = subparsers.add_parser("agent-health-check")
+
+def _add_health_arguments(health: ArgumentParser) -> None:
     health.add_argument("--seat-id", required=True)
     health.add_argument(
         "--model-provider",
@@ -87,19 +185,126 @@ def build_parser() -> ArgumentParser:
     health.add_argument("--rpc-ok", action=BooleanOptionalAction, default=True)
     health.add_argument("--governance-ok", action=BooleanOptionalAction, default=True)
     health.add_argument("--model-ok", action=BooleanOptionalAction, default=True)
+    health.add_argument(
+        "--probe",
+        action=BooleanOptionalAction,
+        default=False,
+        help="run live RPC, governance and model-provider probes (cached for a TTL)",
+    )
 
-    reconcile = subparsers.add_parser("reconcile-agent-runtime")
-    reconcile.add_argument("--dispute-id", required=True)
-    reconcile.add_argument("--round", required=True, type=int)
+
+def _add_reconcile_arguments(reconcile: ArgumentParser) -> None:
+    reconcile.add_argument("--dispute-id")
+    reconcile.add_argument("--round", type=int)
     reconcile.add_argument(
         "--target-status",
-        required=True,
         choices=[status.value for status in CommandStatus],
     )
+    reconcile.add_argument(
+        "--all",
+        action="store_true",
+        help="scan every on-chain dispute and report rounds that diverged from local state",
+    )
+
+
+def _positive_int(raw_value: str) -> int:
+    value = int(raw_value)
+    if value < 1:
+        raise ArgumentTypeError("must be a positive integer")
+    return value
+
+
+def _add_batch_arguments(batch: ArgumentParser) -> None:
+    batch.add_argument("--input", default="-", help="NDJSON file path, or - for stdin")
+    batch.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="process-pool size for CPU-bound batches (1 runs in-process)",
+    )
+    batch.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=None,
+        help="lines per worker task when --workers is above 1",
+    )
+
+
+def _add_daemon_arguments(daemon: ArgumentParser) -> None:
+    daemon.add_argument("--socket", default="", help="Unix socket path for forwarded commands")
+
+
+SUBPARSER_BUILDERS: dict[str, Callable[[ArgumentParser], None]] = {
+    "bootstrap-arbitration-dao": _add_bootstrap_arguments,
+    "bind-resolver": _add_bind_arguments,
+    "create-ruling-proposal": _add_create_arguments,
+    "submit-vote": _add_vote_arguments,
+    "execute-ruling-proposal": _add_execute_arguments,
+    "verify-ruling-status": _add_verify_arguments,
+    "agent-health-check": _add_health_arguments,
+    "reconcile-agent-runtime": _add_reconcile_arguments,
+    "batch": _add_batch_arguments,
+    "daemon": _add_daemon_arguments,
+}
+
+# Commands that read the caller's stdin/files or serve requests are never forwarded.
+IN_PROCESS_ONLY_COMMANDS: frozenset[str] = frozenset({"batch", "daemon"})
+
+
+def _is_forwardable(argv: Sequence[str]) -> bool:
+    if _selected_command(argv) in IN_PROCESS_ONLY_COMMANDS:
+        return False
+    # Streaming file input must write results incrementally from this process.
+    return not any(token == "--input" or token.startswith("--input=") for token in argv)
+
+
+def build_parser(command: str | None = None) -> ArgumentParser:
+    """Build the CLI parser.
+
+    When ``command`` names a known subcommand only that subparser is constructed;
+    otherwise every subparser is built so help and usage errors list all commands.
+    """
+    parser = ArgumentParser(prog="ai-arbitration-dao", description="AI Arbitration DAO CLI")
+    parser.add_argument("--json", action="store_true", help="emit machine-readable JSON output")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    names = [command] if command in SUBPARSER_BUILDERS else list(SUBPARSER_BUILDERS)
+    for name in names:
+        SUBPARSER_BUILDERS[name](subparsers.add_parser(name))
 
     return parser
 
 
+@lru_cache(maxsize=16)
+def _optional_defaults(command: str) -> tuple[tuple[str, object], ...]:
+    parser = ArgumentParser(add_help=False)
+    SUBPARSER_BUILDERS[command](parser)
+    return tuple(
+        (action.dest, action.default)
+        for action in parser._actions
+        if not action.required and action.default is not SUPPRESS
+    )
+
+
+def command_defaults(command: str) -> dict[str, object]:
+    """Defaults the CLI gives ``command``'s optional arguments; empty for unknown commands.
+
+    Required arguments are left out so handlers still report them as missing.
+    """
+    if command not in SUBPARSER_BUILDERS:
+        return {}
+    return dict(_optional_defaults(command))
+
+
+def _selected_command(argv: Sequence[str]) -> str | None:
+    for token in argv:
+        if token.startswith("-"):
+            continue
+        return token if token in SUBPARSER_BUILDERS else None
+    return None
+
+
 def _emit_result(result: CommandResult, *, as_json: bool) -> None:
     if as_json:
         print(result.to_json())
@@ -110,16 +315,102 @@ def _emit_result(result: CommandResult, *, as_json: bool) -> None:
         print(json.dumps(result.details, indent=2, sort_keys=True))
 
 
-def entrypoint(argv: Sequence[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(list(argv) if argv is not None else None)
+def _emit_batch(lines: Iterable[str], args: Namespace, settings: AppSettings) -> int:
+    from ai_arbitration_dao.orchestration.batch import run_batch
+
+    exit_code = 0
+    results = run_batch(
+        lines,
+        COMMAND_HANDLERS,
+        settings,
+        workers=int(args.workers),
+        chunk_size=args.chunk_size,
+        defaults=command_defaults,
+    )
+    for result in results:
+        print(result.to_json(), flush=True)
+        if result.status == CommandStatus.FAILED:
+            exit_code = 1
+    return exit_code
+
+
+def _run_create_stream(args: Namespace, settings: AppSettings) -> int:
+    from ai_arbitration_dao.commands.create_ruling_proposal import (
+        stream_create_ruling_proposals,
+    )
+
+    exit_code = 0
+    results = stream_create_ruling_proposals(
+        str(args.input), settings, is_final=bool(args.is_final)
+    )
+    for result in results:
+        _emit_result(result, as_json=bool(args.json))
+        sys.stdout.flush()
+        if result.status == CommandStatus.FAILED:
+            exit_code = 1
+    return exit_code
+
+
+def _run_batch(args: Namespace, settings: AppSettings) -> int:
+    input_path = str(args.input)
+    if input_path == "-":
+        return _emit_batch(sys.stdin, args, settings)
+    try:
+        stream = open(input_path, encoding="utf-8")
+    except OSError as exc:
+        result = CommandResult(
+            command="batch",
+            status=CommandStatus.FAILED,
+            details={"error": f"cannot open input {input_path}: {exc.strerror or exc}"},
+        )
+        print(result.to_json(), flush=True)
+        return 1
+    with stream:
+        return _emit_batch(stream, args, settings)
+
+
+def run_command(argv: Sequence[str]) -> int:
+    """Parse and execute ``argv`` in this process."""
+    parser = build_parser(_selected_command(argv))
+    args = parser.parse_args(list(argv))
+    if args.command == "create-ruling-proposal":
+        _check_create_arguments(parser, args)
+
+    # Settings pull in pydantic-settings, so they load only once a command is dispatched.
+    from ai_arbitration_dao.config import get_settings
+
     settings = get_settings()
 
+    if args.command == "batch":
+        return _run_batch(args, settings)
+
+    if args.command == "create-ruling-proposal" and args.input is not None:
+        return _run_create_stream(args, settings)
+
+    if args.command == "daemon":
+        from ai_arbitration_dao.runtime.daemon import default_socket_path, serve_daemon
+
+        serve_daemon(str(args.socket) or default_socket_path(), run_command)
+        return 0
+
     handler = COMMAND_HANDLERS[str(args.command)]
     result = handler(args, settings)
     _emit_result(result, as_json=bool(args.json))
     return 1 if result.status == CommandStatus.FAILED else 0
 
 
+def entrypoint(argv: Sequence[str] | None = None) -> int:
+    raw_argv = list(argv) if argv is not None else sys.argv[1:]
+
+    if _is_forwardable(raw_argv):
+        from ai_arbitration_dao.runtime.daemon import forward_to_daemon
+
+        forwarded_exit_code = forward_to_daemon(raw_argv)
+        if forwarded_exit_code is not None:
+            return forwarded_exit_code
+
+    return run_command(raw_argv)
+
+
 if __name__ == "__main__":
     raise SystemExit(entrypoint())
@@ -1,13 +1,34 @@
-"""Command handlers for the AI Arbitration DAO CLI."""
+"""Command handlers for the AI Arbitration DAO CLI.
 
-from ai_arbitration_dao.commands.agent_health_check import run_agent_health_check
-from ai_arbitration_dao.commands.bind_resolver import run_bind_resolver
-from ai_arbitration_dao.commands.bootstrap import run_bootstrap_arbitration_dao
-from ai_arbitration_dao.commands.create_ruling_proposal import run_create_ruling_proposal
-from ai_arbitration_dao.commands.execute_ruling_proposal import run_execute_ruling_proposal
-from ai_arbitration_dao.commands.reconcile_agent_runtime import run_reconcile_agent_runtime
-from ai_arbitration_dao.commands.submit_vote import run_submit_vote
-from ai_arbitration_dao.commands.verify_ruling_status import run_verify_ruling_status
+Handlers are resolved on first attribute access so that importing one command module
+does not import every other command and its dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ai_arbitration_dao.commands.agent_health_check import run_agent_health_check
+    from ai_arbitration_dao.commands.bind_resolver import run_bind_resolver
+    from ai_arbitration_dao.commands.bootstrap import run_bootstrap_arbitration_dao
+    from ai_arbitration_dao.commands.create_ruling_proposal import run_create_ruling_proposal
+    from ai_arbitration_dao.commands.execute_ruling_proposal import run_execute_ruling_proposal
+    from ai_arbitration_dao.commands.reconcile_agent_runtime import run_reconcile_agent_runtime
+    from ai_arbitration_dao.commands.submit_vote import run_submit_vote
+    from ai_arbitration_dao.commands.verify_ruling_status import run_verify_ruling_status
+
+_HANDLER_MODULES: dict[str, str] = {
+    "run_agent_health_check": "ai_arbitration_dao.commands.agent_health_check",
+    "run_bind_resolver": "ai_arbitration_dao.commands.bind_resolver",
+    "run_bootstrap_arbitration_dao": "ai_arbitration_dao.commands.bootstrap",
+    "run_create_ruling_proposal": "ai_arbitration_dao.commands.create_ruling_proposal",
+    "run_execute_ruling_proposal": "ai_arbitration_dao.commands.execute_ruling_proposal",
+    "run_reconcile_agent_runtime": "ai_arbitration_dao.commands.reconcile_agent_runtime",
+    "run_submit_vote": "ai_arbitration_dao.commands.submit_vote",
+    "run_verify_ruling_status": "ai_arbitration_dao.commands.verify_ruling_status",
+}
 
 __all__ = [
     "run_agent_health_check",
@@ -19,3 +40,10 @@ __all__ = [
     "run_submit_vote",
     "run_verify_ruling_status",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _HANDLER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from argparse import Namespace
 
 from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.observability.metrics import cache_metrics_snapshot
+from ai_arbitration_dao.runtime.health_probes import ProbeCache, probe_seat_dependencies
 from ai_arbitration_dao.types import CommandResult, CommandStatus, SeatProvider
 
 
@@ -23,7 +25,20 @@ def _coerce_bool(raw_value: object) -> bool | None:
     return None
 
 
-def run_agent_health_check(args: Namespace, _: AppSettings) -> CommandResult:
+def run_agent_health_check(
+    args: Namespace,
+    settings: AppSettings,
+    *,
+    probe_cache: ProbeCache | None = None,
+) -> CommandResult:
+    """Report seat readiness from the operator flags and, with ``probe``, live probes.
+
+    Probing is opt-in so the default check stays offline. Live probes (RPC
+    ``getHealth``/``getSlot``, a fetch of the configured governance account and a
+    model-provider ping) run concurrently and are cached for
+    ``health_cache_ttl_seconds``; each probe's latency is reported under ``probes``.
+    The process's cache hit/miss/eviction counters are reported under ``cache_metrics``.
+    """
     seat_id = str(getattr(args, "seat_id", "")).strip()
     if not seat_id:
         return CommandResult(
@@ -81,6 +96,28 @@ def run_agent_health_check(args: Namespace, _: AppSettings) -> CommandResult:
             },
         )
 
+    probe = _coerce_bool(getattr(args, "probe", False))
+    if probe is None:
+        return CommandResult(
+            command="agent-health-check",
+            status=CommandStatus.FAILED,
+            details={
+                "error": "probe must be a boolean value",
+                "si": ["SI-017", "SI-022", "SI-023"],
+            },
+        )
+
+    probe_details: dict[str, object] = {}
+    if probe:
+        probes, cache_hit = probe_seat_dependencies(settings, model_provider, cache=probe_cache)
+        rpc_ok = rpc_ok and probes["rpc"].ok
+        governance_ok = governance_ok and probes["governance"].ok
+        model_ok = model_ok and probes["model"].ok
+        probe_details = {
+            "probes": {name: result.as_dict() for name, result in probes.items()},
+            "probe_cache_hit": cache_hit,
+        }
+
     healthy = rpc_ok and governance_ok and model_ok
     status = CommandStatus.EXECUTED if healthy else CommandStatus.FAILED
 
@@ -94,6 +131,8 @@ def run_agent_health_check(args: Namespace, _: AppSettings) -> CommandResult:
             "rpc_status": "ok" if rpc_ok else "failed",
             "governance_status": "ok" if governance_ok else "failed",
             "model_status": "ok" if model_ok else "failed",
+            **probe_details,
+            "cache_metrics": cache_metrics_snapshot(),
             "si": ["SI-017", "SI-022", "SI-023"],
         },
     )
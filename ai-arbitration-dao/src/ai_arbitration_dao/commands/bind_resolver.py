@@ -1,19 +1,203 @@
 from __future__ import annotations
 
+import asyncio
 from argparse import Namespace
+from collections.abc import Sequence
+from typing import Any
+
+from solana.exceptions import SolanaExceptionBase
+from solana.rpc.core import RPCException
+from solders.pubkey import Pubkey
 
 from ai_arbitration_dao.config import AppSettings
-from ai_arbitration_dao.solana.pubkeys import normalize_pubkey
+from ai_arbitration_dao.solana.account_loader import (
+    BulkAccountLoader,
+    RawAccount,
+)
+from ai_arbitration_dao.solana.accounts import (
+    SAFE_POLICY_DISCRIMINATOR,
+    AccountDecodeError,
+    safe_policy_resolver,
+)
+from ai_arbitration_dao.solana.pubkeys import normalize_pubkey, normalize_pubkeys, resolve_pubkey
+from ai_arbitration_dao.solana.rpc_client import RpcClientFactory
 from ai_arbitration_dao.types import CommandResult, CommandStatus
 
 
+def _coerce_bool(raw_value: object) -> bool | None:
+    if isinstance(raw_value, bool):
+        return raw_value
+
+    if isinstance(raw_value, int):
+        return raw_value != 0
+
+    if isinstance(raw_value, str):
+        normalized = raw_value.strip().lower()
+        if normalized in {"true", "1", "yes"}:
+            return True
+        if normalized in {"false", "0", "no"}:
+            return False
+
+    return None
+
+
 def _normalized_string(raw_value: object) -> str:
     if raw_value is None:
         return ""
     return str(raw_value).strip()
 
 
-def run_bind_resolver(args: Namespace, _: AppSettings) -> CommandResult:
+async def _load_safe_policies(
+    loader: BulkAccountLoader,
+    safes: Sequence[str],
+    program_id: str,
+) -> list[tuple[str, RawAccount | None]]:
+    if safes:
+        return list(zip(safes, await loader.load_accounts(safes), strict=True))
+    return list(await loader.load_program_accounts(program_id, SAFE_POLICY_DISCRIMINATOR))
+
+
+async def _load_with_rpc(
+    settings: AppSettings,
+    safes: Sequence[str],
+) -> list[tuple[str, RawAccount | None]]:
+    async with RpcClientFactory(settings) as factory:
+        return await _load_safe_policies(factory.reader(), safes, settings.safe_treasury_program_id)
+
+
+def _resolver_mismatch(
+    safe: str,
+    account: RawAccount | None,
+    expected_resolver: bytes,
+    program_id: str,
+) -> dict[str, Any] | None:
+    if account is None:
+        return {"safe": safe, "error": "safe policy account not found"}
+    if account.owner != program_id:
+        return {"safe": safe, "error": "safe policy is not owned by the safe-treasury program"}
+    try:
+        resolver = safe_policy_resolver(account.data)
+    except AccountDecodeError as exc:
+        return {"safe": safe, "error": str(exc)}
+    if resolver == expected_resolver:
+        return None
+    return {
+        "safe": safe,
+        "error": "resolver mismatch",
+        "actual_resolver_address": str(Pubkey.from_bytes(bytes(resolver))),
+    }
+
+
+def _verify_bound_safes(
+    args: Namespace,
+    settings: AppSettings,
+    governance_address: str,
+    loader: BulkAccountLoader | None,
+) -> CommandResult:
+    normalized_safes = normalize_pubkeys(
+        [_normalized_string(safe) for safe in getattr(args, "safes", None) or []],
+        field_name="safe",
+    )
+    if normalized_safes.errors:
+        return CommandResult(
+            command="bind-resolver",
+            status=CommandStatus.FAILED,
+            details={
+                "error": next(iter(normalized_safes.errors.values())),
+                "invalid_safes": [
+                    {"index": index, "error": error}
+                    for index, error in normalized_safes.errors.items()
+                ],
+                "si": ["SI-004", "SI-005", "SI-021"],
+            },
+        )
+    safes = normalized_safes.addresses
+
+    try:
+        if loader is None:
+            policies = asyncio.run(_load_with_rpc(settings, safes))
+        else:
+            policies = asyncio.run(
+                _load_safe_policies(loader, safes, settings.safe_treasury_program_id)
+            )
+    except (SolanaExceptionBase, RPCException) as exc:
+        return CommandResult(
+            command="bind-resolver",
+            status=CommandStatus.FAILED,
+            details={
+                "error": f"safe policy fetch failed: {exc}",
+                "si": ["SI-004", "SI-005", "SI-021"],
+            },
+        )
+
+    expected_resolver = resolve_pubkey(governance_address, field_name="governance_address").raw
+    mismatches: list[dict[str, Any]] = []
+    for safe, account in policies:
+        mismatch = _resolver_mismatch(
+            safe, account, expected_resolver, settings.safe_treasury_program_id
+        )
+        if mismatch is not None:
+            mismatches.append(mismatch)
+
+    if mismatches:
+        return CommandResult(
+            command="bind-resolver",
+            status=CommandStatus.FAILED,
+            details={
+                "error": "resolver mismatch",
+                "expected_governance_address": governance_address,
+                "checked": len(policies),
+                "mismatches": mismatches,
+                "si": ["SI-005"],
+            },
+        )
+
+    return CommandResult(
+        command="bind-resolver",
+        status=CommandStatus.EXECUTED,
+        details={
+            "governance_address": governance_address,
+            "checked": len(policies),
+            "verified": True,
+            "si": ["SI-004", "SI-005", "SI-021"],
+        },
+    )
+
+
+def run_bind_resolver(
+    args: Namespace,
+    settings: AppSettings,
+    *,
+    loader: BulkAccountLoader | None = None,
+) -> CommandResult:
+    """Check a resolver binding, or with ``safes``/``all`` every on-chain ``SafePolicy``.
+
+    Bulk mode loads the listed safe policies (or scans every ``SafePolicy`` account of the
+    safe-treasury program), compares each resolver field in place against the governance
+    address, and reports every mismatch in one result.
+    """
+    scan_all = _coerce_bool(getattr(args, "all", False))
+    if scan_all is None:
+        return CommandResult(
+            command="bind-resolver",
+            status=CommandStatus.FAILED,
+            details={"error": "all must be a boolean value", "si": ["SI-004", "SI-005", "SI-021"]},
+        )
+
+    if getattr(args, "safes", None) or scan_all:
+        try:
+            governance_address = normalize_pubkey(
+                _normalized_string(getattr(args, "governance_address", "")),
+                field_name="governance_address",
+            )
+        except ValueError as exc:
+            return CommandResult(
+                command="bind-resolver",
+                status=CommandStatus.FAILED,
+                details={"error": str(exc), "si": ["SI-004", "SI-005", "SI-021"]},
+            )
+        return _verify_bound_safes(args, settings, governance_address, loader)
+
     try:
         governance_address = normalize_pubkey(
             _normalized_string(getattr(args, "governance_address", "")),
@@ -1,17 +1,52 @@
 from __future__ import annotations
 
-import hashlib
 from argparse import Namespace
+from typing import Any
 
 from ai_arbitration_dao.agents.base import fixed_panel_template
 from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.solana.pda import (
+    MAX_SEED_LENGTH,
+    PdaCache,
+    account_governance_seeds,
+    challenge_bond_vault_seeds,
+    default_pda_cache,
+    native_vault_seeds,
+    realm_seeds,
+    safe_policy_seeds,
+)
 from ai_arbitration_dao.solana.pubkeys import normalize_pubkey
 from ai_arbitration_dao.types import CommandResult, CommandStatus
 
 
-def _derive_deterministic_address(seed: str) -> str:
-    digest = hashlib.sha256(seed.encode("utf-8")).hexdigest()
-    return f"pda_{digest[:32]}"
+def _derive_addresses(
+    cache: PdaCache,
+    settings: AppSettings,
+    creator: str,
+    realm_name: str,
+) -> dict[str, tuple[str, int]]:
+    treasury_program = settings.safe_treasury_program_id
+    governance_program = settings.governance_program_id
+    (safe_policy, realm, bond_vault) = cache.derive_many(
+        [
+            (safe_policy_seeds(creator), treasury_program),
+            (realm_seeds(realm_name), governance_program),
+            (challenge_bond_vault_seeds(), treasury_program),
+        ]
+    )
+    (native_vault, governance) = cache.derive_many(
+        [
+            (native_vault_seeds(safe_policy[0]), treasury_program),
+            (account_governance_seeds(realm[0], safe_policy[0]), governance_program),
+        ]
+    )
+    return {
+        "realm_address": realm,
+        "governance_address": governance,
+        "safe_policy_address": safe_policy,
+        "treasury_address": native_vault,
+        "challenge_bond_vault_address": bond_vault,
+    }
 
 
 def _normalized_string(raw_value: object) -> str:
@@ -58,14 +93,40 @@ def run_bootstrap_arbitration_dao(args: Namespace, settings: AppSettings) -> Com
             },
         )
 
+    if len(realm_name.encode("utf-8")) > MAX_SEED_LENGTH:
+        return CommandResult(
+            command="bootstrap-arbitration-dao",
+            status=CommandStatus.FAILED,
+            details={
+                "error": f"realm_name must be at most {MAX_SEED_LENGTH} bytes",
+                "si": ["SI-001"],
+            },
+        )
+
+    cache = default_pda_cache(settings.pda_cache_path)
+    try:
+        derived = _derive_addresses(cache, settings, creator, realm_name)
+    except ValueError as exc:
+        return CommandResult(
+            command="bootstrap-arbitration-dao",
+            status=CommandStatus.FAILED,
+            details={
+                "error": f"address derivation failed: {exc}",
+                "si": ["SI-001", "SI-021"],
+            },
+        )
+    if settings.pda_cache_path:
+        cache.save()
+
     panel = [seat.as_dict() for seat in fixed_panel_template(settings)]
 
-    manifest = {
+    manifest: dict[str, Any] = {
         "realm_name": realm_name,
         "creator": creator,
-        "governance_address": _derive_deterministic_address(f"{creator}:{realm_name}:governance"),
-        "resolver_candidate": _derive_deterministic_address(f"{creator}:{realm_name}:resolver"),
-        "treasury_address": _derive_deterministic_address(f"{creator}:{realm_name}:treasury"),
+        **{name: address for name, (address, _) in derived.items()},
+        # The safe's resolver must be the governance account that executes ruling proposals.
+        "resolver_candidate": derived["governance_address"][0],
+        "bumps": {name: bump for name, (_, bump) in derived.items()},
         "panel": panel,
     }
 
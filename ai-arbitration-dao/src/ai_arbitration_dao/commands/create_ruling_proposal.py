@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import csv
 import hashlib
+import json
 from argparse import Namespace
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import TextIO
 
 from ai_arbitration_dao.config import AppSettings
 from ai_arbitration_dao.domain.dispute_snapshot import DisputeSnapshot, RulingOutcome
-from ai_arbitration_dao.domain.ruling_payload import compile_ruling_payload
+from ai_arbitration_dao.domain.payload_cache import compile_ruling_payload_cached
 from ai_arbitration_dao.types import CommandResult, CommandStatus
 
 
@@ -68,7 +73,7 @@ def run_create_ruling_proposal(args: Namespace, _: AppSettings) -> CommandResult
             round=int(raw_round),
             outcome=RulingOutcome(str(getattr(args, "outcome", "")).strip()),
         )
-        payload = compile_ruling_payload(snapshot, is_final=is_final)
+        payload = compile_ruling_payload_cached(snapshot, is_final=is_final)
     except (TypeError, ValueError) as exc:
         return CommandResult(
             command="create-ruling-proposal",
@@ -91,3 +96,91 @@ def run_create_ruling_proposal(args: Namespace, _: AppSettings) -> CommandResult
             "si": ["SI-006", "SI-007", "SI-012"],
         },
     )
+
+
+INPUT_COLUMNS: tuple[str, ...] = ("safe", "payout_id", "dispute_id", "round", "outcome", "is_final")
+REQUIRED_INPUT_COLUMNS: tuple[str, ...] = INPUT_COLUMNS[:-1]
+
+
+def _iter_csv_rows(stream: TextIO) -> Iterator[Mapping[str, object] | str]:
+    yield from csv.DictReader(stream)
+
+
+def _iter_ndjson_rows(stream: TextIO) -> Iterator[Mapping[str, object] | str]:
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield f"invalid JSON: {exc.msg}"
+            continue
+        yield row if isinstance(row, dict) else "row must be a JSON object"
+
+
+def _row_arguments(row: Mapping[str, object], *, is_final: bool) -> Namespace | str:
+    missing = [column for column in REQUIRED_INPUT_COLUMNS if row.get(column) is None]
+    if missing:
+        return f"missing required field(s): {', '.join(missing)}"
+
+    fields = {column: row.get(column) for column in INPUT_COLUMNS}
+    if fields["is_final"] in (None, ""):
+        fields["is_final"] = is_final
+    return Namespace(**fields)
+
+
+def _input_failed(error: str) -> CommandResult:
+    return CommandResult(
+        command="create-ruling-proposal",
+        status=CommandStatus.FAILED,
+        details={"error": error, "si": ["SI-006", "SI-007"]},
+    )
+
+
+def stream_create_ruling_proposals(
+    input_path: str,
+    settings: AppSettings,
+    *,
+    is_final: bool = False,
+) -> Iterator[CommandResult]:
+    """Yield one create-ruling-proposal result per row of a CSV or NDJSON dispute file.
+
+    Rows are read, validated and compiled one at a time; a row that fails validation
+    yields a FAILED result carrying its ``row`` number and the stream continues.
+    ``is_final`` applies to rows that leave ``is_final`` empty. An input file that
+    cannot be opened or read yields a FAILED result instead of raising.
+    """
+    path = Path(input_path)
+    suffix = path.suffix.lower()
+    if suffix not in {".csv", ".ndjson", ".jsonl"}:
+        yield _input_failed("input must be a .csv or .ndjson file")
+        return
+
+    try:
+        stream = path.open(encoding="utf-8", newline="")
+    except OSError as exc:
+        yield _input_failed(f"cannot open input {input_path}: {exc.strerror or exc}")
+        return
+
+    with stream:
+        rows = _iter_csv_rows(stream) if suffix == ".csv" else _iter_ndjson_rows(stream)
+        row_number = 0
+        try:
+            for row_number, row in enumerate(rows, start=1):
+                args = row if isinstance(row, str) else _row_arguments(row, is_final=is_final)
+                if isinstance(args, str):
+                    yield CommandResult(
+                        command="create-ruling-proposal",
+                        status=CommandStatus.FAILED,
+                        details={"row": row_number, "error": args, "si": ["SI-006", "SI-007"]},
+                    )
+                    continue
+
+                result = run_create_ruling_proposal(args, settings)
+                yield CommandResult(
+                    command=result.command,
+                    status=result.status,
+                    details={**result.details, "row": row_number},
+                )
+        except (OSError, UnicodeDecodeError, csv.Error) as exc:
+            yield _input_failed(f"cannot read input {input_path} after row {row_number}: {exc}")
@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import hashlib
 from argparse import Namespace
 from typing import Any
 
+from solana.exceptions import SolanaExceptionBase
+from solana.rpc.core import RPCException
+
 from ai_arbitration_dao.config import AppSettings
 from ai_arbitration_dao.domain import RulingOutcome, create_audit_artifact
 from ai_arbitration_dao.orchestration.proposal_authorization import (
     EXECUTED_GOVERNANCE_PROOF_TYPE,
+    ProposalProof,
     ProposalStore,
+    ProposalStoreBackend,
     authorize_ruling_write,
+    fetch_proposal_proofs,
     parse_proposal_proof,
+    record_onchain_proposals,
 )
+from ai_arbitration_dao.solana.account_loader import AccountLoader
+from ai_arbitration_dao.solana.pubkeys import normalize_pubkey
+from ai_arbitration_dao.solana.realms_proposals import default_proposal_state_cache
+from ai_arbitration_dao.solana.rpc_client import RpcClientFactory
+from ai_arbitration_dao.storage.audit_log import open_audit_log
+from ai_arbitration_dao.storage.proposal_store import open_proposal_store
 from ai_arbitration_dao.types import CommandResult, CommandStatus
 
 
@@ -44,7 +59,55 @@ def _outcome_from_proof(proof: dict[str, Any]) -> RulingOutcome | None:
     return RulingOutcome(normalized)
 
 
-def run_execute_ruling_proposal(args: Namespace, _: AppSettings) -> CommandResult:
+def _durable_proposal_store(settings: AppSettings) -> ProposalStoreBackend | None:
+    if not settings.proposal_store_path:
+        return None
+    return open_proposal_store(settings.proposal_store_path)
+
+
+async def _fetch_onchain_proof(
+    settings: AppSettings,
+    loader: AccountLoader | None,
+    proposal_id: str,
+    governance: str,
+) -> ProposalProof | None:
+    cache = default_proposal_state_cache()
+    if loader is not None:
+        proofs = await fetch_proposal_proofs(
+            loader, [proposal_id], governance=governance, cache=cache
+        )
+    else:
+        async with RpcClientFactory(settings) as factory:
+            proofs = await fetch_proposal_proofs(
+                factory.reader(), [proposal_id], governance=governance, cache=cache
+            )
+    return proofs.get(proposal_id)
+
+
+def _proof_lookup_failed(proposal_id: str, reason: str) -> CommandResult:
+    return CommandResult(
+        command="execute-ruling-proposal",
+        status=CommandStatus.FAILED,
+        details={
+            "proposal_id": proposal_id,
+            "reason": reason,
+            "si": ["SI-008", "SI-009"],
+        },
+    )
+
+
+def run_execute_ruling_proposal(
+    args: Namespace,
+    settings: AppSettings,
+    *,
+    loader: AccountLoader | None = None,
+) -> CommandResult:
+    """Authorize and record a ruling write backed by an executed governance proposal.
+
+    With ``--onchain-proof`` (or an injected ``loader``) the proposal's executed state is
+    read from its Realms ``ProposalV2`` account instead of being taken from the proof, and
+    the proposal must belong to ``governance_address``, the resolver bound to the safe.
+    """
     proposal_id = str(getattr(args, "proposal_id", "")).strip()
     if not proposal_id:
         return CommandResult(
@@ -170,8 +233,37 @@ def run_execute_ruling_proposal(args: Namespace, _: AppSettings) -> CommandResul
             },
         )
 
-    store = ProposalStore()
-    store.add_proposal(parsed_proof)
+    durable_store = _durable_proposal_store(settings)
+    store = durable_store if durable_store is not None else ProposalStore()
+    if loader is not None or getattr(args, "onchain_proof", False):
+        try:
+            normalize_pubkey(proposal_id, field_name="proposal_id")
+            governance = normalize_pubkey(
+                str(getattr(args, "governance_address", None) or ""),
+                field_name="governance_address",
+            )
+        except ValueError as exc:
+            return _proof_lookup_failed(proposal_id, str(exc))
+        try:
+            onchain = asyncio.run(_fetch_onchain_proof(settings, loader, proposal_id, governance))
+        except (SolanaExceptionBase, RPCException) as exc:
+            return _proof_lookup_failed(proposal_id, f"proposal lookup failed: {exc}")
+        if onchain is None:
+            return _proof_lookup_failed(
+                proposal_id,
+                f"proposal not found: {proposal_id} is not a Realms ProposalV2 account "
+                f"of governance {governance}",
+            )
+        # The chain decides whether the proposal passed; the proof only binds dispute and round.
+        proof = {**proof, "executed": onchain.executed}
+        parsed_proof = dataclasses.replace(parsed_proof, executed=onchain.executed)
+        record_onchain_proposals(store, [parsed_proof])
+
+    elif durable_store is None:
+        # No history to check against: the caller's proof is the only record, and it is
+        # discarded with this call. A durable store only ever learns proposals from
+        # recorded history or from chain, never from the caller's claims.
+        store.add_proposal(parsed_proof)
 
     status, error = authorize_ruling_write(store, proof, target_dispute_id, target_round)
 
@@ -211,6 +303,8 @@ def run_execute_ruling_proposal(args: Namespace, _: AppSettings) -> CommandResul
         round=target_round,
         outcome=outcome,
     )
+    if settings.audit_log_path:
+        open_audit_log(settings.audit_log_path).append(audit)
 
     return CommandResult(
         command="execute-ruling-proposal",
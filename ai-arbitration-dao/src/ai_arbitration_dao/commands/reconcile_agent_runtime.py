@@ -1,8 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 from argparse import Namespace
+from typing import Any
+
+from solana.exceptions import SolanaExceptionBase
+from solana.rpc.core import RPCException
 
 from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.orchestration.reconciliation import reconcile_status
+from ai_arbitration_dao.orchestration.round_safety import RoundSafetyStore
+from ai_arbitration_dao.orchestration.ruling_status import challenge_round_status
+from ai_arbitration_dao.solana.account_loader import (
+    ProgramAccountLoader,
+    RawAccount,
+)
+from ai_arbitration_dao.solana.accounts import (
+    CHALLENGE_DISCRIMINATOR,
+    AccountDecodeError,
+    decode_challenge,
+)
+from ai_arbitration_dao.solana.rpc_client import RpcClientFactory
+from ai_arbitration_dao.storage.audit_log import open_audit_log
 from ai_arbitration_dao.types import CommandResult, CommandStatus
 
 
@@ -13,7 +32,129 @@ def _target_status(raw_status: str) -> CommandStatus | None:
         return None
 
 
-def run_reconcile_agent_runtime(args: Namespace, _: AppSettings) -> CommandResult:
+def _diverged_rounds(
+    challenges: list[tuple[str, RawAccount]],
+    store: RoundSafetyStore,
+) -> list[dict[str, Any]]:
+    chain_statuses: dict[tuple[str, int], CommandStatus | None] = {}
+    diverged: list[dict[str, Any]] = []
+    for dispute_id, account in challenges:
+        try:
+            challenge = decode_challenge(account.data)
+        except AccountDecodeError as exc:
+            diverged.append({"dispute_id": dispute_id, "error": str(exc)})
+            continue
+        for round_value in range(challenge.round + 1):
+            chain_statuses[(dispute_id, round_value)] = challenge_round_status(
+                challenge, round_value
+            )
+
+    for dispute_id, round_value, _ in store.rounds():
+        chain_statuses.setdefault((dispute_id, round_value), None)
+
+    for (dispute_id, round_value), chain_status in sorted(chain_statuses.items()):
+        local_status = store.get_status(dispute_id, round_value)
+        if chain_status == local_status:
+            continue
+        entry: dict[str, Any] = {
+            "dispute_id": dispute_id,
+            "round": round_value,
+            "local_status": local_status.value,
+            "chain_status": None if chain_status is None else chain_status.value,
+            "reconciled_status": (
+                local_status
+                if chain_status is None
+                else reconcile_status(local_status, chain_status)
+            ).value,
+        }
+        if chain_status is None:
+            entry["error"] = "challenge account not found"
+        diverged.append(entry)
+    return diverged
+
+
+async def _scan_challenges(settings: AppSettings) -> list[tuple[str, RawAccount]]:
+    async with RpcClientFactory(settings) as factory:
+        return await factory.reader().load_program_accounts(
+            settings.safe_treasury_program_id, CHALLENGE_DISCRIMINATOR
+        )
+
+
+def _local_round_view(settings: AppSettings) -> RoundSafetyStore | None:
+    """Rebuild the executed rounds from the persisted audit log, if one is configured."""
+    if not settings.audit_log_path:
+        return None
+    store = RoundSafetyStore()
+    for record in open_audit_log(settings.audit_log_path).records():
+        artifact = record.artifact
+        store.record_ruling(artifact.dispute_id, artifact.round, artifact.payload_hash)
+    return store
+
+
+def _reconcile_all(
+    settings: AppSettings,
+    loader: ProgramAccountLoader | None,
+    store: RoundSafetyStore,
+) -> CommandResult:
+    try:
+        if loader is None:
+            challenges = asyncio.run(_scan_challenges(settings))
+        else:
+            challenges = asyncio.run(
+                loader.load_program_accounts(
+                    settings.safe_treasury_program_id, CHALLENGE_DISCRIMINATOR
+                )
+            )
+    except (SolanaExceptionBase, RPCException) as exc:
+        return CommandResult(
+            command="reconcile-agent-runtime",
+            status=CommandStatus.FAILED,
+            details={
+                "error": f"program account scan failed: {exc}",
+                "si": ["SI-014", "SI-015", "SI-023"],
+            },
+        )
+
+    diverged = _diverged_rounds(challenges, store)
+    return CommandResult(
+        command="reconcile-agent-runtime",
+        status=CommandStatus.PENDING if diverged else CommandStatus.EXECUTED,
+        details={
+            "scanned": len(challenges),
+            "diverged": diverged,
+            "si": ["SI-014", "SI-015", "SI-023"],
+        },
+    )
+
+
+def run_reconcile_agent_runtime(
+    args: Namespace,
+    settings: AppSettings,
+    *,
+    loader: ProgramAccountLoader | None = None,
+    store: RoundSafetyStore | None = None,
+) -> CommandResult:
+    """Reconcile one dispute round, or with ``all`` every dispute against chain state.
+
+    The ``all`` mode scans every safe-treasury ``Challenge`` account in one
+    ``getProgramAccounts`` call filtered on the account discriminator, diffs each round
+    against the local round-safety view, and reports only the rounds that diverged. The
+    local view is ``store`` when given, otherwise it is rebuilt from the audit log at
+    ``AUDIT_LOG_PATH``; without either the command fails rather than diff against nothing.
+    """
+    if getattr(args, "all", False) is True:
+        local_view = store if store is not None else _local_round_view(settings)
+        if local_view is None:
+            return CommandResult(
+                command="reconcile-agent-runtime",
+                status=CommandStatus.FAILED,
+                details={
+                    "error": "no local round state: set AUDIT_LOG_PATH to reconcile --all",
+                    "si": ["SI-014", "SI-015", "SI-023"],
+                },
+            )
+        return _reconcile_all(settings, loader, local_view)
+
     dispute_id = str(getattr(args, "dispute_id", "")).strip()
     if not dispute_id:
         return CommandResult(
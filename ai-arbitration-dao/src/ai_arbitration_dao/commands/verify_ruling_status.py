@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 from argparse import Namespace
+from collections.abc import Sequence
+from typing import Any
+
+from solana.exceptions import SolanaExceptionBase
+from solana.rpc.core import RPCException
 
 from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.orchestration.ruling_status import (
+    derive_ruling_status,
+    payout_status_name,
+    ruling_outcome_name,
+)
+from ai_arbitration_dao.solana.account_loader import AccountLoader, RawAccount
+from ai_arbitration_dao.solana.accounts import AccountDecodeError, decode_challenge, decode_payout
+from ai_arbitration_dao.solana.pubkeys import normalize_pubkey
+from ai_arbitration_dao.solana.rpc_client import RpcClientFactory
 from ai_arbitration_dao.types import CommandResult, CommandStatus
 
+SI_REFERENCES = ["SI-013", "SI-015"]
+
 
 def _coerce_status(raw_status: str) -> CommandStatus | None:
     try:
@@ -13,69 +30,218 @@ def _coerce_status(raw_status: str) -> CommandStatus | None:
         return None
 
 
-def run_verify_ruling_status(args: Namespace, _: AppSettings) -> CommandResult:
-    dispute_id = str(getattr(args, "dispute_id", "")).strip()
-    if not dispute_id:
-        return CommandResult(
-            command="verify-ruling-status",
-            status=CommandStatus.FAILED,
-            details={
-                "error": "dispute_id is required",
-                "si": ["SI-013", "SI-015"],
-            },
-        )
+def _failed(error: str) -> CommandResult:
+    return CommandResult(
+        command="verify-ruling-status",
+        status=CommandStatus.FAILED,
+        details={"error": error, "si": SI_REFERENCES},
+    )
 
-    raw_round = getattr(args, "round", None)
-    if isinstance(raw_round, bool):
-        return CommandResult(
-            command="verify-ruling-status",
-            status=CommandStatus.FAILED,
-            details={
-                "error": "round must be an integer",
-                "si": ["SI-013", "SI-015"],
-            },
-        )
 
+def _parse_round(raw_round: Any) -> int:
+    if isinstance(raw_round, bool):
+        raise ValueError("round must be an integer")
     try:
         round_value = int(raw_round)
-    except (TypeError, ValueError):
-        return CommandResult(
-            command="verify-ruling-status",
-            status=CommandStatus.FAILED,
-            details={
-                "error": "round must be an integer",
-                "si": ["SI-013", "SI-015"],
-            },
+    except (TypeError, ValueError) as exc:
+        raise ValueError("round must be an integer") from exc
+    if round_value < 0:
+        raise ValueError("round must be non-negative")
+    return round_value
+
+
+def _parse_dispute_pair(raw_pair: object) -> tuple[str, int]:
+    if isinstance(raw_pair, dict):
+        return (
+            normalize_pubkey(str(raw_pair.get("dispute_id", "")), field_name="dispute_id"),
+            _parse_round(raw_pair.get("round")),
         )
 
-    if round_value < 0:
-        return CommandResult(
-            command="verify-ruling-status",
-            status=CommandStatus.FAILED,
-            details={
-                "error": "round must be non-negative",
-                "si": ["SI-013", "SI-015"],
-            },
+    dispute_id, separator, raw_round = str(raw_pair).strip().rpartition(":")
+    if not separator:
+        raise ValueError("disputes must use the form DISPUTE_ID:ROUND")
+    return normalize_pubkey(dispute_id, field_name="dispute_id"), _parse_round(raw_round)
+
+
+def _requested_rulings(args: Namespace) -> list[tuple[str, int]]:
+    requested = [
+        _parse_dispute_pair(raw_pair) for raw_pair in getattr(args, "disputes", None) or []
+    ]
+
+    raw_dispute_id = getattr(args, "dispute_id", None)
+    if raw_dispute_id is not None or not requested:
+        dispute_id = normalize_pubkey(str(raw_dispute_id or ""), field_name="dispute_id")
+        requested.insert(0, (dispute_id, _parse_round(getattr(args, "round", None))))
+
+    return requested
+
+
+async def _load_rulings(
+    loader: AccountLoader,
+    dispute_ids: Sequence[str],
+) -> tuple[dict[str, RawAccount | None], dict[str, RawAccount | None]]:
+    """Fetch every challenge, then every payout those challenges point at."""
+    unique_dispute_ids = list(dict.fromkeys(dispute_ids))
+    challenges = dict(
+        zip(unique_dispute_ids, await loader.load_accounts(unique_dispute_ids), strict=True)
+    )
+
+    payout_addresses: list[str] = []
+    for account in challenges.values():
+        if account is None:
+            continue
+        try:
+            payout_addresses.append(decode_challenge(account.data).payout)
+        except AccountDecodeError:
+            continue
+    payout_addresses = list(dict.fromkeys(payout_addresses))
+    payouts = dict(zip(payout_addresses, await loader.load_accounts(payout_addresses), strict=True))
+    return challenges, payouts
+
+
+def _verify_ruling(
+    dispute_id: str,
+    round_value: int,
+    challenges: dict[str, RawAccount | None],
+    payouts: dict[str, RawAccount | None],
+    program_id: str,
+) -> tuple[CommandStatus, dict[str, Any]]:
+    entry: dict[str, Any] = {"dispute_id": dispute_id, "round": round_value}
+
+    challenge_account = challenges.get(dispute_id)
+    if challenge_account is None:
+        return CommandStatus.FAILED, {**entry, "error": "challenge account not found"}
+    if challenge_account.owner != program_id:
+        return CommandStatus.FAILED, {
+            **entry,
+            "error": "challenge account is not owned by the safe-treasury program",
+        }
+    try:
+        challenge = decode_challenge(challenge_account.data)
+    except AccountDecodeError as exc:
+        return CommandStatus.FAILED, {**entry, "error": str(exc)}
+
+    payout_account = payouts.get(challenge.payout)
+    if payout_account is None:
+        return CommandStatus.FAILED, {**entry, "error": "payout account not found"}
+    if payout_account.owner != program_id:
+        return CommandStatus.FAILED, {
+            **entry,
+            "error": "payout account is not owned by the safe-treasury program",
+        }
+    try:
+        payout = decode_payout(payout_account.data)
+    except AccountDecodeError as exc:
+        return CommandStatus.FAILED, {**entry, "error": str(exc)}
+
+    if payout.challenge != dispute_id:
+        return CommandStatus.FAILED, {**entry, "error": "payout is not linked to this dispute"}
+
+    status = derive_ruling_status(challenge, payout, round_value)
+    return status, {
+        **entry,
+        "verified_status": status.value,
+        "payout": challenge.payout,
+        "payout_id": payout.payout_id,
+        "payout_status": payout_status_name(payout.status),
+        "challenge_round": challenge.round,
+        "ruling_recorded_for_round": challenge.ruling_recorded_for_round,
+        "current_outcome": ruling_outcome_name(challenge.current_outcome),
+        "finalized": payout.finalized,
+        "final_outcome": ruling_outcome_name(payout.final_outcome),
+    }
+
+
+def _apply_expectation(
+    status: CommandStatus,
+    entry: dict[str, Any],
+    expected_status: CommandStatus | None,
+) -> tuple[CommandStatus, dict[str, Any]]:
+    if expected_status is None or status == CommandStatus.FAILED or status == expected_status:
+        return status, entry
+    return CommandStatus.FAILED, {
+        **entry,
+        "expected_status": expected_status.value,
+        "error": f"status mismatch: expected {expected_status.value}, found {status.value}",
+    }
+
+
+def _aggregate_status(statuses: Sequence[CommandStatus]) -> CommandStatus:
+    if CommandStatus.FAILED in statuses:
+        return CommandStatus.FAILED
+    if len(set(statuses)) == 1:
+        return statuses[0]
+    return CommandStatus.PENDING
+
+
+async def _fetch_with_rpc(
+    settings: AppSettings,
+    dispute_ids: Sequence[str],
+) -> tuple[dict[str, RawAccount | None], dict[str, RawAccount | None]]:
+    async with RpcClientFactory(settings) as factory:
+        return await _load_rulings(factory.reader(), dispute_ids)
+
+
+def run_verify_ruling_status(
+    args: Namespace,
+    settings: AppSettings,
+    *,
+    loader: AccountLoader | None = None,
+) -> CommandResult:
+    """Verify ruling status for one or many ``(dispute_id, round)`` pairs from chain state.
+
+    ``dispute_id`` is the safe-treasury ``Challenge`` account address. Challenge accounts
+    are read first, then the ``Payout`` accounts they reference, each in chunked
+    ``getMultipleAccounts`` requests issued concurrently.
+    """
+    try:
+        requested = _requested_rulings(args)
+    except ValueError as exc:
+        return _failed(str(exc))
+
+    expected_status: CommandStatus | None = None
+    raw_expected = getattr(args, "expected_status", None)
+    if raw_expected is not None:
+        expected_status = _coerce_status(str(raw_expected).strip())
+        if expected_status is None:
+            return _failed("expected_status must be a valid command status")
+
+    dispute_ids = [dispute_id for dispute_id, _ in requested]
+    try:
+        if loader is None:
+            challenges, payouts = asyncio.run(_fetch_with_rpc(settings, dispute_ids))
+        else:
+            challenges, payouts = asyncio.run(_load_rulings(loader, dispute_ids))
+    except (SolanaExceptionBase, RPCException) as exc:
+        return _failed(f"account fetch failed: {exc}")
+
+    results = [
+        _apply_expectation(
+            *_verify_ruling(
+                dispute_id,
+                round_value,
+                challenges,
+                payouts,
+                settings.safe_treasury_program_id,
+            ),
+            expected_status,
         )
+        for dispute_id, round_value in requested
+    ]
 
-    status = _coerce_status(str(getattr(args, "expected_status", "")).strip())
-    if status is None:
+    if len(results) == 1:
+        status, entry = results[0]
         return CommandResult(
             command="verify-ruling-status",
-            status=CommandStatus.FAILED,
-            details={
-                "error": "expected_status must be a valid command status",
-                "si": ["SI-013", "SI-015"],
-            },
+            status=status,
+            details={**entry, "si": SI_REFERENCES},
         )
 
     return CommandResult(
         command="verify-ruling-status",
-        status=status,
+        status=_aggregate_status([status for status, _ in results]),
         details={
-            "dispute_id": dispute_id,
-            "round": round_value,
-            "verified_status": status.value,
-            "si": ["SI-013", "SI-015"],
+            "rulings": [{"status": status.value, **entry} for status, entry in results],
+            "si": SI_REFERENCES,
         },
     )
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+from enum import StrEnum
 from functools import lru_cache
 
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class RpcEndpointRole(StrEnum):
+    READ = "read"
+    SEND = "send"
+
+
+class RpcEndpointSettings(BaseModel):
+    url: str
+    roles: frozenset[RpcEndpointRole] = frozenset(RpcEndpointRole)
+
+
 class AppSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -18,13 +30,42 @@ class AppSettings(BaseSettings):
     dao_name: str = "ai-arbitration-dao"
 
     solana_rpc_url: str = "http://127.0.0.1:8899"
-    governance_program_id: str = "GovER5Lthms1111111111111111111111111111111"
+    solana_ws_url: str = ""
+    # JSON list of {"url": ..., "roles": ["read", "send"]}; empty means SOLANA_RPC_URL alone.
+    solana_rpc_endpoints: list[RpcEndpointSettings] = Field(default_factory=list)
+    governance_program_id: str = "GovER5Lthms3bLBqWub97yVrMmEogzX7xNjdXpPPCVZw"
+    # Realm/governance account the seats act under; the health probe fetches it.
+    governance_address: str = ""
     safe_treasury_program_id: str = "SafeTreasury1111111111111111111111111111111"
 
+    rpc_timeout_seconds: float = 10.0
+    rpc_max_connections: int = 32
+    rpc_max_keepalive_connections: int = 16
+    rpc_keepalive_expiry_seconds: float = 30.0
+    rpc_max_concurrency: int = 16
+    rpc_coalesce_window_seconds: float = 0.002
+    rpc_batch_requests: bool = True
+    rpc_hedge_reads: bool = True
+    rpc_latency_window: int = 128
+    rpc_max_slot_lag: int = 50
+    rpc_slot_check_interval_seconds: float = 5.0
+    account_cache_max_bytes: int = 0
+    account_cache_ttl_seconds: float = 30.0
+
+    proposal_store_path: str = ""
+    pda_cache_path: str = ""
+    audit_log_path: str = ""
+
+    health_probe_timeout_seconds: float = 2.0
+    health_cache_ttl_seconds: float = 10.0
+
     claude_model: str = "claude-3-5-haiku-20241022"
     openai_model: str = "gpt-4o-mini"
     minimax_model: str = "minimax-m2.5"
 
+    def rpc_endpoints(self) -> list[RpcEndpointSettings]:
+        return self.solana_rpc_endpoints or [RpcEndpointSettings(url=self.solana_rpc_url)]
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
@@ -1,14 +1,37 @@
 """Domain models for deterministic arbitration workflows."""
 
 from ai_arbitration_dao.domain.audit_artifact import AuditArtifact, create_audit_artifact
+from ai_arbitration_dao.domain.audit_batch import (
+    AuditBatch,
+    InclusionProof,
+    anchor_audit_artifacts,
+    verify_inclusion,
+    verify_inclusion_batch,
+)
 from ai_arbitration_dao.domain.dispute_snapshot import DisputeSnapshot, RulingOutcome
-from ai_arbitration_dao.domain.ruling_payload import RulingPayload, compile_ruling_payload
+from ai_arbitration_dao.domain.payload_cache import (
+    RulingPayloadCache,
+    compile_ruling_payload_cached,
+)
+from ai_arbitration_dao.domain.ruling_payload import (
+    RulingPayload,
+    compile_ruling_payload,
+    compile_ruling_payloads,
+)
 
 __all__ = [
     "AuditArtifact",
     "create_audit_artifact",
+    "AuditBatch",
+    "InclusionProof",
+    "anchor_audit_artifacts",
+    "verify_inclusion",
+    "verify_inclusion_batch",
     "DisputeSnapshot",
     "RulingOutcome",
+    "RulingPayloadCache",
+    "compile_ruling_payload_cached",
     "RulingPayload",
     "compile_ruling_payload",
+    "compile_ruling_payloads",
 ]
@@ -0,0 +1,192 @@
+"""SHA-256 Merkle anchoring of audit artifact batches.
+
+Leaves are ``sha256(0x00 || payload_hash)`` and interior nodes ``sha256(0x01 || left ||
+right)`` so a leaf can never be replayed as an interior node. An unpaired node at the end
+of a level is promoted unchanged rather than duplicated, which keeps proofs for trailing
+leaves short and avoids the duplicate-leaf ambiguity of Bitcoin-style trees.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from ai_arbitration_dao.domain.audit_artifact import AuditArtifact
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def _leaf_hash(payload_hash: str) -> bytes:
+    try:
+        raw = bytes.fromhex(payload_hash)
+    except ValueError as exc:
+        raise ValueError("payload_hash must be a hex-encoded SHA-256 digest") from exc
+    if len(raw) != 32:
+        raise ValueError("payload_hash must be a hex-encoded SHA-256 digest")
+    return hashlib.sha256(_LEAF_PREFIX + raw).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+@dataclass(slots=True, frozen=True)
+class InclusionProof:
+    leaf_index: int
+    leaf_count: int
+    payload_hash: str
+    siblings: tuple[str, ...]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "leaf_index": self.leaf_index,
+            "leaf_count": self.leaf_count,
+            "payload_hash": self.payload_hash,
+            "siblings": list(self.siblings),
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class AuditMerkleTree:
+    levels: tuple[tuple[bytes, ...], ...]
+
+    @property
+    def leaf_count(self) -> int:
+        return len(self.levels[0])
+
+    @property
+    def root(self) -> str:
+        return self.levels[-1][0].hex()
+
+    def proof(self, leaf_index: int, payload_hash: str) -> InclusionProof:
+        if not 0 <= leaf_index < self.leaf_count:
+            raise IndexError("leaf_index out of range")
+        siblings: list[str] = []
+        index = leaf_index
+        for level in self.levels[:-1]:
+            sibling_index = index ^ 1
+            if sibling_index < len(level):
+                siblings.append(level[sibling_index].hex())
+            index //= 2
+        return InclusionProof(
+            leaf_index=leaf_index,
+            leaf_count=self.leaf_count,
+            payload_hash=payload_hash,
+            siblings=tuple(siblings),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class AuditBatch:
+    """A committed batch: one root plus an inclusion proof per artifact, in input order."""
+
+    tree: AuditMerkleTree
+    proofs: tuple[InclusionProof, ...]
+
+    @property
+    def root(self) -> str:
+        return self.tree.root
+
+
+def build_audit_merkle_tree(payload_hashes: Sequence[str]) -> AuditMerkleTree:
+    if not payload_hashes:
+        raise ValueError("at least one payload hash is required")
+
+    level = tuple(_leaf_hash(payload_hash) for payload_hash in payload_hashes)
+    levels = [level]
+    while len(level) > 1:
+        paired = [
+            _node_hash(level[index], level[index + 1]) for index in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = tuple(paired)
+        levels.append(level)
+    return AuditMerkleTree(levels=tuple(levels))
+
+
+def anchor_audit_artifacts(artifacts: Sequence[AuditArtifact]) -> AuditBatch:
+    payload_hashes = [artifact.payload_hash for artifact in artifacts]
+    tree = build_audit_merkle_tree(payload_hashes)
+    return AuditBatch(
+        tree=tree,
+        proofs=tuple(
+            tree.proof(index, payload_hash) for index, payload_hash in enumerate(payload_hashes)
+        ),
+    )
+
+
+def _sibling_count(leaf_index: int, leaf_count: int) -> int:
+    count = 0
+    while leaf_count > 1:
+        if leaf_index ^ 1 < leaf_count:
+            count += 1
+        leaf_index //= 2
+        leaf_count = (leaf_count + 1) // 2
+    return count
+
+
+# Verified path nodes keyed by (leaf_count, depth, index): the node hash plus the proof
+# siblings that carried it to the root.
+_VerifiedNodes = dict[tuple[int, int, int], tuple[bytes, tuple[str, ...]]]
+
+
+def _verify(proof: InclusionProof, root: bytes, verified: _VerifiedNodes | None) -> bool:
+    leaf_count = proof.leaf_count
+    if not 0 <= proof.leaf_index < leaf_count:
+        return False
+    if len(proof.siblings) != _sibling_count(proof.leaf_index, leaf_count):
+        return False
+    try:
+        node = _leaf_hash(proof.payload_hash)
+    except ValueError:
+        return False
+
+    path: list[tuple[tuple[int, int, int], bytes, int]] = []
+    index = proof.leaf_index
+    width = leaf_count
+    depth = 0
+    position = 0
+    while width > 1:
+        key = (leaf_count, depth, index)
+        if verified is not None:
+            known = verified.get(key)
+            # Same node with the same remaining siblings hashes to the same, verified root.
+            if known is not None and known[0] == node and known[1] == proof.siblings[position:]:
+                break
+        path.append((key, node, position))
+        if index ^ 1 < width:
+            try:
+                sibling = bytes.fromhex(proof.siblings[position])
+            except ValueError:
+                return False
+            position += 1
+            node = _node_hash(sibling, node) if index % 2 else _node_hash(node, sibling)
+        index //= 2
+        width = (width + 1) // 2
+        depth += 1
+    else:
+        if node != root:
+            return False
+
+    if verified is not None:
+        for key, path_node, path_position in path:
+            verified[key] = (path_node, proof.siblings[path_position:])
+    return True
+
+
+def verify_inclusion(proof: InclusionProof, root: str) -> bool:
+    return _verify(proof, bytes.fromhex(root), None)
+
+
+def verify_inclusion_batch(proofs: Iterable[InclusionProof], root: str) -> list[bool]:
+    """Verify many proofs against one root, hashing shared upper path segments once.
+
+    Results are identical to calling ``verify_inclusion`` on each proof.
+    """
+    expected_root = bytes.fromhex(root)
+    verified: _VerifiedNodes = {}
+    return [_verify(proof, expected_root, verified) for proof in proofs]
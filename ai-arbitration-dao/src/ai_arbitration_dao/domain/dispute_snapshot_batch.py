@@ -0,0 +1,138 @@
+"""Columnar (struct-of-arrays) storage for large sets of dispute snapshots.
+
+Requires the optional ``analytics`` extra (NumPy). ``payout_id`` and ``round`` are
+``int64`` columns and ``outcome`` is a ``uint8`` code column. ``safe`` and ``dispute_id``
+are interned: each row stores an ``int32`` code into a table of unique strings, so a
+million rows over a few thousand safes cost a few bytes per row. ``safe_pubkeys`` and
+``dispute_pubkeys`` expand the codes into ``(rows, 32)`` ``uint8`` arrays of raw pubkeys.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+    from numpy.typing import NDArray
+except ImportError as exc:  # pragma: no cover - exercised only without the extra
+    raise ImportError(
+        "DisputeSnapshotBatch requires NumPy; install ai-arbitration-dao[analytics]"
+    ) from exc
+
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.domain.dispute_snapshot import DisputeSnapshot, RulingOutcome
+
+_OUTCOMES = tuple(RulingOutcome)
+_OUTCOME_CODES = {outcome: code for code, outcome in enumerate(_OUTCOMES)}
+
+
+def _intern(values: Sequence[str]) -> tuple[NDArray[np.int32], tuple[str, ...]]:
+    table: dict[str, int] = {}
+    codes = np.fromiter(
+        (table.setdefault(value, len(table)) for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return codes, tuple(table)
+
+
+def _pubkey_table(table: tuple[str, ...]) -> NDArray[np.uint8]:
+    raw = np.zeros((len(table), 32), dtype=np.uint8)
+    for code, value in enumerate(table):
+        try:
+            raw[code] = np.frombuffer(bytes(Pubkey.from_string(value)), dtype=np.uint8)
+        except ValueError as exc:
+            raise ValueError(f"{value!r} is not a base58 pubkey") from exc
+    return raw
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class DisputeSnapshotBatch:
+    payout_id: NDArray[np.int64]
+    round: NDArray[np.int64]
+    outcome: NDArray[np.uint8]
+    safe_codes: NDArray[np.int32]
+    safe_table: tuple[str, ...]
+    dispute_codes: NDArray[np.int32]
+    dispute_table: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return int(self.payout_id.shape[0])
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Iterable[DisputeSnapshot]) -> DisputeSnapshotBatch:
+        """Build a batch; integers outside the ``int64`` range raise ``OverflowError``."""
+        rows = list(snapshots)
+        count = len(rows)
+        safe_codes, safe_table = _intern([row.safe for row in rows])
+        dispute_codes, dispute_table = _intern([row.dispute_id for row in rows])
+        return cls(
+            payout_id=np.fromiter((row.payout_id for row in rows), dtype=np.int64, count=count),
+            round=np.fromiter((row.round for row in rows), dtype=np.int64, count=count),
+            outcome=np.fromiter(
+                (_OUTCOME_CODES[row.outcome] for row in rows), dtype=np.uint8, count=count
+            ),
+            safe_codes=safe_codes,
+            safe_table=safe_table,
+            dispute_codes=dispute_codes,
+            dispute_table=dispute_table,
+        )
+
+    def to_snapshots(self) -> list[DisputeSnapshot]:
+        safe_table = self.safe_table
+        dispute_table = self.dispute_table
+        return [
+            DisputeSnapshot(
+                safe=safe_table[safe_code],
+                payout_id=payout_id,
+                dispute_id=dispute_table[dispute_code],
+                round=round_value,
+                outcome=_OUTCOMES[outcome_code],
+            )
+            for safe_code, payout_id, dispute_code, round_value, outcome_code in zip(
+                self.safe_codes.tolist(),
+                self.payout_id.tolist(),
+                self.dispute_codes.tolist(),
+                self.round.tolist(),
+                self.outcome.tolist(),
+                strict=True,
+            )
+        ]
+
+    def _failure_masks(self) -> tuple[tuple[NDArray[np.bool_], str], ...]:
+        empty_safe = np.fromiter((not value for value in self.safe_table), dtype=np.bool_)
+        empty_dispute = np.fromiter((not value for value in self.dispute_table), dtype=np.bool_)
+        # Same order as DisputeSnapshot.ensure_canonical, so each row reports the same error.
+        return (
+            (empty_safe[self.safe_codes], "safe is required"),
+            (self.payout_id < 0, "payout_id must be non-negative"),
+            (empty_dispute[self.dispute_codes], "dispute_id is required"),
+            (self.round < 0, "round must be non-negative"),
+        )
+
+    def canonical_mask(self) -> NDArray[np.bool_]:
+        """Return a boolean column that is ``True`` for rows that pass ``ensure_canonical``."""
+        valid = np.ones(len(self), dtype=np.bool_)
+        for failed, _ in self._failure_masks():
+            valid &= ~failed
+        return valid
+
+    def ensure_canonical(self) -> None:
+        """Raise ``ValueError`` for the first non-canonical row, naming its index."""
+        masks = self._failure_masks()
+        invalid = np.zeros(len(self), dtype=np.bool_)
+        for failed, _ in masks:
+            invalid |= failed
+        if not invalid.any():
+            return
+        row = int(np.argmax(invalid))
+        reason = next(message for failed, message in masks if failed[row])
+        raise ValueError(f"row {row}: {reason}")
+
+    def safe_pubkeys(self) -> NDArray[np.uint8]:
+        return _pubkey_table(self.safe_table)[self.safe_codes]
+
+    def dispute_pubkeys(self) -> NDArray[np.uint8]:
+        return _pubkey_table(self.dispute_table)[self.dispute_codes]
@@ -0,0 +1,121 @@
+"""Bounded LRU/TTL memo of compiled ruling payloads.
+
+The same dispute round is compiled by each seat, by retries and by reconciliation;
+``DisputeSnapshot`` is frozen and hashable, so ``(snapshot, is_final)`` keys the result.
+Lookups never await, so one lock makes a cache safe to share across threads and across
+asyncio tasks in a worker.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+
+from ai_arbitration_dao.domain.dispute_snapshot import DisputeSnapshot, RulingOutcome
+from ai_arbitration_dao.domain.ruling_payload import RulingPayload, compile_ruling_payload
+from ai_arbitration_dao.observability.metrics import CacheMetrics, cache_metrics
+
+DEFAULT_PAYLOAD_CACHE_SIZE = 4096
+PAYLOAD_CACHE_METRICS = "ruling_payload"
+
+
+def _is_cacheable(snapshot: DisputeSnapshot, is_final: bool) -> bool:
+    # Equal-but-differently-typed values (True == 1, "Allow" == RulingOutcome.ALLOW) hash
+    # alike yet serialize differently, so only exact schema types are memoized.
+    return (
+        type(is_final) is bool
+        and type(snapshot.safe) is str
+        and type(snapshot.dispute_id) is str
+        and type(snapshot.payout_id) is int
+        and type(snapshot.round) is int
+        and type(snapshot.outcome) is RulingOutcome
+    )
+
+
+class RulingPayloadCache:
+    """LRU memo of ``compile_ruling_payload`` with an optional entry TTL."""
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = DEFAULT_PAYLOAD_CACHE_SIZE,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: CacheMetrics | None = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._metrics = metrics if metrics is not None else cache_metrics(PAYLOAD_CACHE_METRICS)
+        self._entries: OrderedDict[tuple[DisputeSnapshot, bool], tuple[float, RulingPayload]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        return self._metrics
+
+    def _lookup(self, key: tuple[DisputeSnapshot, bool]) -> RulingPayload | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, payload = entry
+            if self._ttl_seconds is not None and self._clock() - stored_at >= self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _store(self, key: tuple[DisputeSnapshot, bool], payload: RulingPayload) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._metrics.record_eviction()
+
+    def compile(self, snapshot: DisputeSnapshot, *, is_final: bool = False) -> RulingPayload:
+        if not _is_cacheable(snapshot, is_final):
+            self._metrics.record_miss()
+            return compile_ruling_payload(snapshot, is_final=is_final)
+
+        key = (snapshot, is_final)
+        cached = self._lookup(key)
+        if cached is not None:
+            self._metrics.record_hit()
+            return cached
+        self._metrics.record_miss()
+        payload = compile_ruling_payload(snapshot, is_final=is_final)
+        self._store(key, payload)
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def default_payload_cache() -> RulingPayloadCache:
+    return RulingPayloadCache()
+
+
+def compile_ruling_payload_cached(
+    snapshot: DisputeSnapshot,
+    *,
+    is_final: bool = False,
+    cache: RulingPayloadCache | None = None,
+) -> RulingPayload:
+    """``compile_ruling_payload`` through the process-wide (or given) memo."""
+    if cache is None:
+        cache = default_payload_cache()
+    return cache.compile(snapshot, is_final=is_final)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Iterable
 from dataclasses import dataclass
+from json.encoder import encode_basestring_ascii
 from typing import Any
 
 from ai_arbitration_dao.domain.dispute_snapshot import DisputeSnapshot
@@ -22,11 +24,68 @@ class RulingPayload:
         }
 
 
-def compile_ruling_payload(snapshot: DisputeSnapshot, *, is_final: bool = False) -> RulingPayload:
+def _reference_serialize(snapshot: DisputeSnapshot, is_final: bool) -> str:
     payload_data = {
         **snapshot.canonical_fields(),
         "is_final": is_final,
     }
-    serialized = json.dumps(payload_data, sort_keys=True, separators=(",", ":"))
-    payload_hash = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+    return json.dumps(payload_data, sort_keys=True, separators=(",", ":"))
+
+
+def serialize_ruling_payload(snapshot: DisputeSnapshot, is_final: bool) -> str:
+    """Serialize the fixed payload schema in sorted key order without building a dict.
+
+    Output is byte-identical to ``json.dumps(..., sort_keys=True, separators=(",", ":"))``
+    with default ASCII escaping. Field values of any type other than the schema's exact
+    ``str``/``int``/``bool`` take the generic ``json.dumps`` path so that guarantee holds.
+    """
+    snapshot.ensure_canonical()
+    safe = snapshot.safe
+    dispute_id = snapshot.dispute_id
+    payout_id = snapshot.payout_id
+    round_value = snapshot.round
+    outcome = snapshot.outcome.value
+    if (
+        type(safe) is not str
+        or type(dispute_id) is not str
+        or type(outcome) is not str
+        or type(payout_id) is not int
+        or type(round_value) is not int
+        or type(is_final) is not bool
+    ):
+        return _reference_serialize(snapshot, is_final)
+
+    return (
+        f'{{"dispute_id":{encode_basestring_ascii(dispute_id)},'
+        f'"is_final":{"true" if is_final else "false"},'
+        f'"outcome":{encode_basestring_ascii(outcome)},'
+        f'"payout_id":{payout_id},'
+        f'"round":{round_value},'
+        f'"safe":{encode_basestring_ascii(safe)}}}'
+    )
+
+
+def compile_ruling_payload(snapshot: DisputeSnapshot, *, is_final: bool = False) -> RulingPayload:
+    serialized = serialize_ruling_payload(snapshot, is_final)
+    payload_hash = hashlib.sha256(serialized.encode("ascii")).hexdigest()
     return RulingPayload(serialized=serialized, payload_hash=payload_hash, is_final=is_final)
+
+
+def compile_ruling_payloads(
+    snapshots: Iterable[DisputeSnapshot],
+    *,
+    is_final: bool = False,
+) -> list[RulingPayload]:
+    """Compile many payloads, returning each serialized payload with its hash."""
+    sha256 = hashlib.sha256
+    payloads: list[RulingPayload] = []
+    for snapshot in snapshots:
+        serialized = serialize_ruling_payload(snapshot, is_final)
+        payloads.append(
+            RulingPayload(
+                serialized=serialized,
+                payload_hash=sha256(serialized.encode("ascii")).hexdigest(),
+                is_final=is_final,
+            )
+        )
+    return payloads
@@ -0,0 +1,56 @@
+"""Process-wide cache counters, readable as plain dicts for logs and health output."""
+
+from __future__ import annotations
+
+import threading
+
+
+class CacheMetrics:
+    """Thread-safe hit/miss/eviction counters for one named cache."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self._misses += 1
+
+    def record_eviction(self) -> None:
+        with self._lock:
+            self._evictions += 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "evictions": self._evictions}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hits = self._misses = self._evictions = 0
+
+
+_registry: dict[str, CacheMetrics] = {}
+_registry_lock = threading.Lock()
+
+
+def cache_metrics(name: str) -> CacheMetrics:
+    """Return the shared counters for ``name``, creating them on first use."""
+    with _registry_lock:
+        metrics = _registry.get(name)
+        if metrics is None:
+            metrics = _registry[name] = CacheMetrics(name)
+        return metrics
+
+
+def cache_metrics_snapshot() -> dict[str, dict[str, int]]:
+    """Counters of every registered cache, keyed by cache name."""
+    with _registry_lock:
+        registered = list(_registry.values())
+    return {metrics.name: metrics.snapshot() for metrics in registered}
@@ -0,0 +1,173 @@
+"""NDJSON batch dispatch for running many CLI commands in one interpreter."""
+
+from __future__ import annotations
+
+import json
+from argparse import Namespace
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+
+from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.types import CommandResult, CommandStatus
+
+CommandHandler = Callable[[Namespace, AppSettings], CommandResult]
+# Maps a command name to the defaults its CLI subparser gives optional arguments.
+DefaultsProvider = Callable[[str], Mapping[str, object]]
+
+DEFAULT_CHUNK_SIZE = 256
+
+
+class BatchLineError(ValueError):
+    pass
+
+
+def parse_batch_line(
+    line: str,
+    *,
+    defaults: DefaultsProvider | None = None,
+) -> tuple[str, Namespace]:
+    """Parse one NDJSON batch line into a command name and handler arguments.
+
+    Each line is a JSON object with a ``command`` key; every other key becomes a
+    handler argument. Keys may use either the CLI flag spelling (``payout-id``)
+    or the attribute spelling (``payout_id``). Arguments the line omits take the
+    values from ``defaults``, so a line behaves like the same command on the CLI.
+    """
+    try:
+        raw = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise BatchLineError(f"invalid JSON: {exc.msg}") from exc
+
+    if not isinstance(raw, dict):
+        raise BatchLineError("batch line must be a JSON object")
+
+    command = raw.pop("command", None)
+    if not isinstance(command, str) or not command.strip():
+        raise BatchLineError("command is required")
+
+    command = command.strip()
+    fields = dict(defaults(command)) if defaults is not None else {}
+    fields.update(
+        {str(key).strip().lstrip("-").replace("-", "_"): value for key, value in raw.items()}
+    )
+    return command, Namespace(**fields)
+
+
+def _dispatch_line(
+    line_number: int,
+    line: str,
+    handlers: Mapping[str, CommandHandler],
+    settings: AppSettings,
+    defaults: DefaultsProvider | None = None,
+) -> CommandResult:
+    try:
+        command, args = parse_batch_line(line, defaults=defaults)
+    except BatchLineError as exc:
+        return CommandResult(
+            command="batch",
+            status=CommandStatus.FAILED,
+            details={"line": line_number, "error": str(exc)},
+        )
+
+    handler = handlers.get(command)
+    if handler is None:
+        return CommandResult(
+            command="batch",
+            status=CommandStatus.FAILED,
+            details={"line": line_number, "error": f"unknown command: {command}"},
+        )
+
+    try:
+        return handler(args, settings)
+    except Exception as exc:
+        # One failing line must not abort the rest of the batch (or a worker's chunk).
+        return CommandResult(
+            command=command,
+            status=CommandStatus.FAILED,
+            details={"line": line_number, "error": f"{type(exc).__name__}: {exc}"},
+        )
+
+
+_worker_context: (
+    tuple[Mapping[str, CommandHandler], AppSettings, DefaultsProvider | None] | None
+) = None
+
+
+def _init_worker(
+    handlers: Mapping[str, CommandHandler],
+    settings: AppSettings,
+    defaults: DefaultsProvider | None,
+) -> None:
+    global _worker_context
+    _worker_context = (handlers, settings, defaults)
+
+
+def _dispatch_chunk(chunk: list[tuple[int, str]]) -> list[CommandResult]:
+    if _worker_context is None:
+        raise RuntimeError("batch worker used before initialization")
+    handlers, settings, defaults = _worker_context
+    return [
+        _dispatch_line(line_number, line, handlers, settings, defaults)
+        for line_number, line in chunk
+    ]
+
+
+def _run_batch_parallel(
+    numbered_lines: Iterator[tuple[int, str]],
+    handlers: Mapping[str, CommandHandler],
+    settings: AppSettings,
+    *,
+    workers: int,
+    chunk_size: int,
+    defaults: DefaultsProvider | None,
+) -> Iterator[CommandResult]:
+    # Only ``2 * workers`` chunks are in flight at once, so input is consumed as output is
+    # written and results are yielded strictly in submission (input) order.
+    max_in_flight = workers * 2
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(handlers, settings, defaults),
+    ) as executor:
+        in_flight: deque[Future[list[CommandResult]]] = deque()
+        while chunk := list(islice(numbered_lines, chunk_size)):
+            in_flight.append(executor.submit(_dispatch_chunk, chunk))
+            if len(in_flight) >= max_in_flight:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def run_batch(
+    lines: Iterable[str],
+    handlers: Mapping[str, CommandHandler],
+    settings: AppSettings,
+    *,
+    workers: int = 1,
+    chunk_size: int | None = None,
+    defaults: DefaultsProvider | None = None,
+) -> Iterator[CommandResult]:
+    """Dispatch each non-blank line through ``handlers``, yielding one result per line.
+
+    With ``workers > 1`` lines are fanned out in chunks over a process pool, which suits
+    CPU-bound runs (payload compilation and hashing); results keep input order.
+    """
+    numbered_lines = (
+        (line_number, line) for line_number, line in enumerate(lines, start=1) if line.strip()
+    )
+
+    if workers > 1:
+        yield from _run_batch_parallel(
+            numbered_lines,
+            handlers,
+            settings,
+            workers=workers,
+            chunk_size=max(chunk_size or DEFAULT_CHUNK_SIZE, 1),
+            defaults=defaults,
+        )
+        return
+
+    for line_number, line in numbered_lines:
+        yield _dispatch_line(line_number, line, handlers, settings, defaults)
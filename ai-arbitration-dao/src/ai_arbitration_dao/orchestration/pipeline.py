@@ -3,7 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from ai_arbitration_dao.domain.dispute_snapshot import DisputeSnapshot
-from ai_arbitration_dao.domain.ruling_payload import RulingPayload, compile_ruling_payload
+from ai_arbitration_dao.domain.payload_cache import (
+    RulingPayloadCache,
+    compile_ruling_payload_cached,
+)
+from ai_arbitration_dao.domain.ruling_payload import RulingPayload
 from ai_arbitration_dao.types import CommandStatus
 
 
@@ -15,8 +19,13 @@ class PipelineState:
     payload: RulingPayload
 
 
-def run_deterministic_pipeline(snapshot: DisputeSnapshot, *, is_final: bool) -> PipelineState:
-    payload = compile_ruling_payload(snapshot, is_final=is_final)
+def run_deterministic_pipeline(
+    snapshot: DisputeSnapshot,
+    *,
+    is_final: bool,
+    cache: RulingPayloadCache | None = None,
+) -> PipelineState:
+    payload = compile_ruling_payload_cached(snapshot, is_final=is_final, cache=cache)
     return PipelineState(
         dispute_id=snapshot.dispute_id,
         round=snapshot.round,
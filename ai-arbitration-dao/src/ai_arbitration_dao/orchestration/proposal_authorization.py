@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Protocol
 
+from ai_arbitration_dao.solana.account_loader import AccountLoader
+from ai_arbitration_dao.solana.realms_proposals import (
+    ProposalStateCache,
+    fetch_governance_proposals,
+)
 from ai_arbitration_dao.types import CommandStatus
 
 EXECUTED_GOVERNANCE_PROOF_TYPE = "executed-governance-proposal"
@@ -24,6 +30,18 @@ class ProposalAuthorizationError(Exception):
         super().__init__(message)
 
 
+class ProposalStoreBackend(Protocol):
+    def add_proposal(self, proof: ProposalProof) -> None: ...
+
+    def add_proposals(self, proofs: Iterable[ProposalProof]) -> None: ...
+
+    def get_proposal(self, proposal_id: str) -> ProposalProof | None: ...
+
+    def get_proposals(self, proposal_ids: Iterable[str]) -> dict[str, ProposalProof]: ...
+
+    def mark_executed(self, proposal_id: str) -> bool: ...
+
+
 class ProposalStore:
     def __init__(self) -> None:
         self._proposals: dict[str, ProposalProof] = {}
@@ -31,9 +49,20 @@ class ProposalStore:
     def add_proposal(self, proof: ProposalProof) -> None:
         self._proposals[proof.proposal_id] = proof
 
+    def add_proposals(self, proofs: Iterable[ProposalProof]) -> None:
+        for proof in proofs:
+            self._proposals[proof.proposal_id] = proof
+
     def get_proposal(self, proposal_id: str) -> ProposalProof | None:
         return self._proposals.get(proposal_id)
 
+    def get_proposals(self, proposal_ids: Iterable[str]) -> dict[str, ProposalProof]:
+        return {
+            proposal_id: self._proposals[proposal_id]
+            for proposal_id in proposal_ids
+            if proposal_id in self._proposals
+        }
+
     def mark_executed(self, proposal_id: str) -> bool:
         proposal = self._proposals.get(proposal_id)
         if proposal is None:
@@ -96,8 +125,51 @@ def parse_proposal_proof(proof: dict[str, Any]) -> ProposalProof | None:
     )
 
 
+async def fetch_proposal_proofs(
+    loader: AccountLoader,
+    proposal_ids: Sequence[str],
+    *,
+    governance: str,
+    cache: ProposalStateCache | None = None,
+) -> dict[str, ProposalProof]:
+    """Proofs for Realms proposals read from chain, one chunked account load per call.
+
+    A proposal is ``executed`` once its on-chain state is executable or executed. As in the
+    program's ``record_ruling``, only proposals of ``governance`` (the safe's resolver) count:
+    ids with no valid ``ProposalV2`` account, or whose proposal belongs to another
+    governance, are left out.
+    """
+    proposals = await fetch_governance_proposals(loader, proposal_ids, cache=cache)
+    return {
+        proposal_id: ProposalProof(
+            proposal_id=proposal_id,
+            proof_type=EXECUTED_GOVERNANCE_PROOF_TYPE,
+            executed=proposal.passed,
+        )
+        for proposal_id, proposal in proposals.items()
+        if proposal.governance == governance
+    }
+
+
+def record_onchain_proposals(store: ProposalStoreBackend, proofs: Iterable[ProposalProof]) -> None:
+    """Bring ``store`` up to date with proposal states read from chain.
+
+    Unknown proposals are added and known ones the chain reports as passed are marked
+    executed; recorded history is never downgraded.
+    """
+    proofs = list(proofs)
+    stored = store.get_proposals(proof.proposal_id for proof in proofs)
+    unknown = [proof for proof in proofs if proof.proposal_id not in stored]
+    if unknown:
+        store.add_proposals(unknown)
+    for proof in proofs:
+        current = stored.get(proof.proposal_id)
+        if current is not None and proof.executed and not current.executed:
+            store.mark_executed(proof.proposal_id)
+
+
 def authorize_ruling_write(
-    store: ProposalStore,
+    store: ProposalStoreBackend,
     proof: dict[str, Any] | None,
     target_dispute_id: str,
     target_round: int,
@@ -164,6 +236,21 @@ def authorize_ruling_write(
             "invalid proposal proof: round is required for replay protection",
         )
 
+    # The stored record binds the proposal to one ruling; a caller's proof cannot rebind it.
+    if stored.dispute_id is not None and stored.dispute_id != target_dispute_id:
+        return (
+            CommandStatus.FAILED,
+            f"dispute mismatch: proposal {parsed.proposal_id} is recorded for dispute "
+            f"{stored.dispute_id}, not target dispute {target_dispute_id}",
+        )
+
+    if stored.round is not None and stored.round != target_round:
+        return (
+            CommandStatus.FAILED,
+            f"round mismatch: proposal {parsed.proposal_id} is recorded for round "
+            f"{stored.round}, not target round {target_round}",
+        )
+
     if parsed.dispute_id is not None and parsed.dispute_id != target_dispute_id:
         return (
             CommandStatus.FAILED,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 from ai_arbitration_dao.types import CommandStatus
@@ -42,6 +43,11 @@ class RoundSafetyStore:
             return CommandStatus.PENDING
         return state.status
 
+    def rounds(self) -> Iterator[tuple[str, int, CommandStatus]]:
+        for key, state in self._rounds.items():
+            dispute_id, _, raw_round = key.rpartition(":")
+            yield dispute_id, int(raw_round), state.status
+
 
 def check_round_safety(
     store: RoundSafetyStore,
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from ai_arbitration_dao.solana.accounts import ChallengeAccount, PayoutAccount
+from ai_arbitration_dao.types import CommandStatus
+
+PAYOUT_STATUS_NAMES = ("queued", "challenged", "released", "cancelled", "denied")
+RULING_OUTCOME_NAMES = ("Allow", "Deny")
+
+
+def payout_status_name(status: int) -> str:
+    if 0 <= status < len(PAYOUT_STATUS_NAMES):
+        return PAYOUT_STATUS_NAMES[status]
+    return f"unknown({status})"
+
+
+def ruling_outcome_name(outcome: int | None) -> str | None:
+    if outcome is None:
+        return None
+    if 0 <= outcome < len(RULING_OUTCOME_NAMES):
+        return RULING_OUTCOME_NAMES[outcome]
+    return f"unknown({outcome})"
+
+
+def challenge_round_status(challenge: ChallengeAccount, round: int) -> CommandStatus:
+    """Status of ``round`` visible from the ``Challenge`` account alone."""
+    if challenge.ruling_recorded_for_round > round:
+        return CommandStatus.EXECUTED
+    return CommandStatus.PENDING
+
+
+def derive_ruling_status(
+    challenge: ChallengeAccount,
+    payout: PayoutAccount,
+    round: int,
+) -> CommandStatus:
+    """Derive the on-chain status of the ruling for ``round`` of a dispute.
+
+    ``record_ruling`` sets ``ruling_recorded_for_round = round + 1``, so a ruling exists
+    for ``round`` once that counter has passed it. A finalized dispute without a ruling
+    for ``round`` can no longer accept one.
+    """
+    status = challenge_round_status(challenge, round)
+    if status == CommandStatus.EXECUTED:
+        return status
+    if payout.finalized:
+        return CommandStatus.ALREADY_RULED
+    return CommandStatus.PENDING
@@ -0,0 +1,248 @@
+"""Opt-in warm CLI daemon served over a local Unix socket.
+
+The daemon keeps settings, handler modules and process-wide caches loaded between
+invocations. ``forward_to_daemon`` is the client half used by ``cli.entrypoint``; it
+returns ``None`` whenever the request should run in-process instead, so callers fall
+back transparently when no daemon is listening or its environment differs.
+
+The socket lives in a directory only its owner can write to. The client talks only to
+a socket, and (where ``SO_PEERCRED`` exists) a peer process, owned by its own user. The
+daemon opens each connection by naming the settings variables it compares. The client
+answers with a digest of its values for those names, never the environment itself.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import traceback
+from collections.abc import Callable, Collection, Mapping, Sequence
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Any
+
+SOCKET_ENV_VAR = "AI_ARBITRATION_DAO_DAEMON_SOCKET"
+CONNECT_TIMEOUT_SECONDS = 0.5
+# Upper bound on one forwarded command. Past it the daemon may already have acted, so
+# the client reports a failure rather than running the command a second time.
+RESPONSE_TIMEOUT_SECONDS = 300.0
+
+# ``struct ucred``: pid, uid, gid.
+_PEERCRED = struct.Struct("3i")
+
+RunCommand = Callable[[Sequence[str]], int]
+
+
+def default_socket_path() -> str:
+    configured = os.environ.get(SOCKET_ENV_VAR, "").strip()
+    if configured:
+        return configured
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR", "").strip()
+    if runtime_dir:
+        return os.path.join(runtime_dir, "ai-arbitration-dao.sock")
+    return f"/tmp/ai-arbitration-dao-{os.getuid()}/daemon.sock"
+
+
+def _is_private_directory(directory: str) -> bool:
+    """Owned by this user and not writable by anyone else, so nobody can bind inside it."""
+    try:
+        info = os.stat(directory)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def _is_trusted_socket(path: str) -> bool:
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(info.st_mode)
+        and info.st_uid == os.getuid()
+        and _is_private_directory(os.path.dirname(os.path.abspath(path)))
+    )
+
+
+def _peer_is_current_user(connection: socket.socket) -> bool:
+    option = getattr(socket, "SO_PEERCRED", None)
+    if option is None:
+        # No peer credentials on this platform; the socket and directory checks stand.
+        return True
+    _pid, uid, _gid = _PEERCRED.unpack(
+        connection.getsockopt(socket.SOL_SOCKET, option, _PEERCRED.size)
+    )
+    return bool(uid == os.getuid())
+
+
+def _decode_message(raw: bytes) -> dict[str, Any] | None:
+    try:
+        message = json.loads(raw)
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def settings_digest(environ: Mapping[str, str], settings_keys: Collection[str]) -> str:
+    """Digest of the ``settings_keys`` variables in ``environ`` (names compared lowercased)."""
+    keys = set(settings_keys)
+    selected = sorted((key.lower(), value) for key, value in environ.items() if key.lower() in keys)
+    return hashlib.sha256(json.dumps(selected).encode("utf-8")).hexdigest()
+
+
+def forward_to_daemon(argv: Sequence[str], *, socket_path: str | None = None) -> int | None:
+    """Run ``argv`` in a listening daemon, replaying its output; ``None`` means run locally."""
+    path = socket_path or default_socket_path()
+    if not _is_trusted_socket(path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(CONNECT_TIMEOUT_SECONDS)
+            client.connect(path)
+            if not _peer_is_current_user(client):
+                return None
+            with client.makefile("rb") as reader:
+                hello = _decode_message(reader.readline())
+                settings_keys = hello.get("settings_keys") if hello is not None else None
+                if not isinstance(settings_keys, list):
+                    return None
+                request = {
+                    "argv": list(argv),
+                    "cwd": os.getcwd(),
+                    "settings_digest": settings_digest(os.environ, settings_keys),
+                }
+                client.settimeout(RESPONSE_TIMEOUT_SECONDS)
+                client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+                try:
+                    raw_response = reader.readline()
+                except TimeoutError:
+                    print(
+                        f"ai-arbitration-dao: daemon at {path} did not answer within "
+                        f"{RESPONSE_TIMEOUT_SECONDS:g}s",
+                        file=sys.stderr,
+                    )
+                    return 1
+    except OSError:
+        return None
+
+    response = _decode_message(raw_response)
+    if response is None or response.get("fallback"):
+        return None
+
+    stdout, stderr, exit_code = (response.get(key) for key in ("stdout", "stderr", "exit_code"))
+    if not isinstance(stdout, str) or not isinstance(stderr, str) or type(exit_code) is not int:
+        return None
+
+    sys.stdout.write(stdout)
+    sys.stdout.flush()
+    sys.stderr.write(stderr)
+    sys.stderr.flush()
+    return exit_code
+
+
+def _settings_keys() -> list[str]:
+    from ai_arbitration_dao.config import AppSettings
+
+    return sorted(AppSettings.model_fields)
+
+
+def _exit_code(code: object) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+class _CommandRequestHandler(socketserver.StreamRequestHandler):
+    server: CliDaemonServer
+
+    def handle(self) -> None:
+        hello = {"settings_keys": self.server.settings_keys}
+        self.wfile.write(json.dumps(hello).encode("utf-8") + b"\n")
+        response = self.server.execute(_decode_message(self.rfile.readline()))
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class CliDaemonServer(socketserver.UnixStreamServer):
+    """Serial command server: one request at a time, so stdout capture stays isolated."""
+
+    def __init__(self, socket_path: str, run_command: RunCommand) -> None:
+        self._run_command = run_command
+        self._cwd = os.getcwd()
+        self.settings_keys = _settings_keys()
+        self._settings_digest = settings_digest(os.environ, self.settings_keys)
+        super().__init__(socket_path, _CommandRequestHandler)
+
+    def execute(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict):
+            return {"fallback": True}
+
+        argv = request.get("argv")
+        if not isinstance(argv, list) or not all(isinstance(item, str) for item in argv):
+            return {"fallback": True}
+
+        if request.get("cwd") != self._cwd:
+            return {"fallback": True}
+        if request.get("settings_digest") != self._settings_digest:
+            return {"fallback": True}
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                exit_code = self._run_command(argv)
+            except SystemExit as exc:
+                exit_code = _exit_code(exc.code)
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+
+        return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit_code": exit_code}
+
+
+def serve_daemon(socket_path: str, run_command: RunCommand) -> None:
+    from ai_arbitration_dao.cli import COMMAND_HANDLERS
+    from ai_arbitration_dao.config import get_settings
+    from ai_arbitration_dao.observability.logging import get_logger
+    from ai_arbitration_dao.solana.account_cache import start_account_cache_invalidation
+
+    # Load settings and import every handler module up front so forwarded commands start warm.
+    settings = get_settings()
+    for command in COMMAND_HANDLERS:
+        COMMAND_HANDLERS[command]
+    start_account_cache_invalidation(settings)
+
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if not _is_private_directory(directory):
+        raise SystemExit(
+            f"refusing to listen in {directory}: it must be owned by the current user "
+            "and not writable by group or others"
+        )
+    if os.path.lexists(socket_path):
+        os.unlink(socket_path)
+
+    server = CliDaemonServer(socket_path, run_command)
+    os.chmod(socket_path, 0o600)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    get_logger("cli_daemon").info("daemon_listening", socket_path=socket_path)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
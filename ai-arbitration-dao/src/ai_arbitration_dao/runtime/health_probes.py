@@ -0,0 +1,195 @@
+"""Live dependency probes for seat health checks.
+
+Probes run concurrently, each under its own timeout, and their results are cached per
+target for a TTL so frequent callers (systemd, load balancers, dashboards) share one set
+of upstream requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.solana.rpc_client import RpcClientFactory
+from ai_arbitration_dao.types import SeatProvider
+
+HealthProbe = Callable[[], Awaitable[bool]]
+
+# Reachability of each provider's API host is checked with a TCP connect; no credentials
+# are sent and no tokens are spent.
+MODEL_PROVIDER_HOSTS: dict[SeatProvider, str] = {
+    SeatProvider.CLAUDE: "api.anthropic.com",
+    SeatProvider.OPENAI: "api.openai.com",
+    SeatProvider.MINIMAX: "api.minimax.io",
+}
+MODEL_PROVIDER_PORT = 443
+
+
+@dataclass(slots=True, frozen=True)
+class ProbeResult:
+    ok: bool
+    latency_ms: float
+    error: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "status": "ok" if self.ok else "failed",
+            "latency_ms": self.latency_ms,
+            "error": self.error,
+        }
+
+
+async def _timed_probe(probe: HealthProbe, timeout_seconds: float) -> ProbeResult:
+    started = time.perf_counter()
+    try:
+        ok = await asyncio.wait_for(probe(), timeout=timeout_seconds)
+        error = None if ok else "probe reported unhealthy"
+    except TimeoutError:
+        ok, error = False, f"timed out after {timeout_seconds:g}s"
+    except Exception as exc:
+        ok, error = False, f"{type(exc).__name__}: {exc}"
+    latency_ms = round((time.perf_counter() - started) * 1000, 3)
+    return ProbeResult(ok=bool(ok), latency_ms=latency_ms, error=error)
+
+
+async def run_probes(
+    probes: Mapping[str, HealthProbe],
+    *,
+    timeout_seconds: float,
+) -> dict[str, ProbeResult]:
+    """Run every probe concurrently; a slow or failing probe never delays the others."""
+    names = list(probes)
+    results = await asyncio.gather(*(_timed_probe(probes[name], timeout_seconds) for name in names))
+    return dict(zip(names, results, strict=True))
+
+
+class ProbeCache:
+    """Thread-safe TTL cache of probe results keyed by probe target."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._entries: dict[tuple[str, ...], tuple[float, dict[str, ProbeResult]]] = {}
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def get(self, key: tuple[str, ...], ttl_seconds: float) -> dict[str, ProbeResult] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if self._clock() - stored_at >= ttl_seconds:
+                del self._entries[key]
+                return None
+            return results
+
+    def put(self, key: tuple[str, ...], results: dict[str, ProbeResult]) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock(), results)
+
+    def get_or_refresh(
+        self,
+        key: tuple[str, ...],
+        ttl_seconds: float,
+        refresh: Callable[[], dict[str, ProbeResult]],
+    ) -> tuple[dict[str, ProbeResult], bool]:
+        """Return cached results, or refresh them once even under concurrent callers."""
+        cached = self.get(key, ttl_seconds)
+        if cached is not None:
+            return cached, True
+        with self._refresh_lock:
+            cached = self.get(key, ttl_seconds)
+            if cached is not None:
+                return cached, True
+            results = refresh()
+            self.put(key, results)
+            return results, False
+
+
+@lru_cache(maxsize=1)
+def default_probe_cache() -> ProbeCache:
+    return ProbeCache()
+
+
+def _tcp_probe(host: str, port: int) -> HealthProbe:
+    async def probe() -> bool:
+        _, writer = await asyncio.open_connection(host, port)
+        writer.close()
+        await writer.wait_closed()
+        return True
+
+    return probe
+
+
+async def _live_probe_results(
+    settings: AppSettings,
+    model_provider: SeatProvider,
+) -> dict[str, ProbeResult]:
+    factory = RpcClientFactory(settings)
+    client = factory.create()
+
+    async def rpc_probe() -> bool:
+        healthy, slot = await asyncio.gather(client.is_connected(), client.get_slot())
+        return healthy and slot.value > 0
+
+    async def governance_probe() -> bool:
+        if not settings.governance_address:
+            raise ValueError("GOVERNANCE_ADDRESS is not configured")
+        response = await client.get_account_info(Pubkey.from_string(settings.governance_address))
+        account = response.value
+        return account is not None and account.owner == Pubkey.from_string(
+            settings.governance_program_id
+        )
+
+    try:
+        return await run_probes(
+            {
+                "rpc": rpc_probe,
+                "governance": governance_probe,
+                "model": _tcp_probe(MODEL_PROVIDER_HOSTS[model_provider], MODEL_PROVIDER_PORT),
+            },
+            timeout_seconds=settings.health_probe_timeout_seconds,
+        )
+    finally:
+        await factory.close()
+
+
+def probe_cache_key(settings: AppSettings, model_provider: SeatProvider) -> tuple[str, ...]:
+    """Key probe results on every input the probes read, so a config change never hits."""
+    endpoints = tuple(
+        f"{endpoint.url}|{','.join(sorted(endpoint.roles))}"
+        for endpoint in settings.rpc_endpoints()
+    )
+    return (
+        *endpoints,
+        settings.governance_program_id,
+        settings.governance_address,
+        MODEL_PROVIDER_HOSTS[model_provider],
+        str(MODEL_PROVIDER_PORT),
+        f"{settings.health_probe_timeout_seconds:g}",
+    )
+
+
+def probe_seat_dependencies(
+    settings: AppSettings,
+    model_provider: SeatProvider,
+    *,
+    cache: ProbeCache | None = None,
+) -> tuple[dict[str, ProbeResult], bool]:
+    """Return probe results for the seat's dependencies and whether they came from cache."""
+    if cache is None:
+        cache = default_probe_cache()
+    key = probe_cache_key(settings, model_provider)
+    return cache.get_or_refresh(
+        key,
+        settings.health_cache_ttl_seconds,
+        lambda: asyncio.run(_live_probe_results(settings, model_provider)),
+    )
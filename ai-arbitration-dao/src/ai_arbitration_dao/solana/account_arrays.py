@@ -0,0 +1,138 @@
+"""Vectorized decoding of many safe-treasury accounts into NumPy structured arrays.
+
+Requires the optional ``analytics`` extra (NumPy). Account data is copied once into a
+zero-padded ``(rows, width)`` byte matrix; every field is then gathered for all rows at
+once, with per-row offsets so ``Option`` fields shift later columns row by row. Each
+``Option`` field ``x`` becomes a value column ``x`` (zeroed when absent) plus an
+``x_present`` flag; ``Payout.policy_snapshot`` is a nested structured field; pubkeys and
+hashes are ``(32,)`` ``uint8`` subarrays.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    import numpy as np
+    from numpy.typing import NDArray
+except ImportError as exc:  # pragma: no cover - exercised only without the extra
+    raise ImportError(
+        "vectorized account decoding requires NumPy; install ai-arbitration-dao[analytics]"
+    ) from exc
+
+from ai_arbitration_dao.solana.account_loader import RawAccount
+from ai_arbitration_dao.solana.accounts import (
+    DISCRIMINATOR_SIZE,
+    AccountData,
+    AccountDecodeError,
+    AccountView,
+    Field,
+    Nested,
+    Option,
+)
+
+# Reads past a row's end (absent Option values, truncated rows) land in zero padding.
+_PADDING = 64
+
+
+def account_dtype(view_class: type[AccountView]) -> Any:
+    fields: list[tuple[str, Any]] = []
+    for field in view_class.FIELDS:
+        if isinstance(field, Nested):
+            fields.append((field.name, account_dtype(field.view_class)))
+        else:
+            fields.append((field.name, field.numpy_dtype))
+        if field.optional:
+            fields.append((f"{field.name}_present", "?"))
+    return np.dtype(fields)
+
+
+def _gather(
+    field: Field[Any],
+    matrix: NDArray[np.uint8],
+    offsets: NDArray[np.int64],
+) -> NDArray[Any]:
+    columns = np.take_along_axis(matrix, offsets[:, None] + np.arange(field.size), axis=1)
+    spec = field.numpy_dtype
+    if isinstance(spec, tuple):
+        return columns
+    if spec == "?":
+        return columns[:, 0] != 0
+    return np.ascontiguousarray(columns).view(np.dtype(spec)).reshape(len(offsets))
+
+
+def _decode_into(
+    out: NDArray[Any],
+    view_class: type[AccountView],
+    matrix: NDArray[np.uint8],
+    offsets: NDArray[np.int64],
+) -> None:
+    """Decode ``view_class`` fields for every row, advancing ``offsets`` in place."""
+    limit = matrix.shape[1] - _PADDING
+    rows = np.arange(len(offsets))
+    for field in view_class.FIELDS:
+        read_at = np.minimum(offsets, limit)
+        if isinstance(field, Nested):
+            nested_offsets = read_at.copy()
+            _decode_into(out[field.name], field.view_class, matrix, nested_offsets)
+            offsets += field.size
+        elif isinstance(field, Option):
+            tags = matrix[rows, read_at]
+            invalid = tags > 1
+            if invalid.any():
+                row = int(np.argmax(invalid))
+                raise AccountDecodeError(
+                    f"row {row}: {view_class.ACCOUNT_NAME}.{field.name} has invalid Option tag"
+                )
+            present = tags == 1
+            values = _gather(field.inner, matrix, read_at + 1)
+            values[~present] = 0
+            out[field.name] = values
+            out[f"{field.name}_present"] = present
+            offsets += 1 + present * field.size
+        else:
+            out[field.name] = _gather(field, matrix, read_at)
+            offsets += field.size
+
+
+def decode_accounts_array(
+    view_class: type[AccountView],
+    accounts: Sequence[AccountData],
+) -> NDArray[Any]:
+    """Decode raw account data of one type into a structured array, one row per account."""
+    count = len(accounts)
+    lengths = np.fromiter((len(data) for data in accounts), dtype=np.int64, count=count)
+    width = int(lengths.max()) if count else 0
+    matrix = np.zeros((count, width + _PADDING), dtype=np.uint8)
+    if count and bool((lengths == width).all()):
+        matrix[:, :width] = np.frombuffer(b"".join(accounts), dtype=np.uint8).reshape(count, width)
+    else:
+        for row, data in enumerate(accounts):
+            matrix[row, : len(data)] = np.frombuffer(data, dtype=np.uint8)
+
+    expected = np.frombuffer(view_class.DISCRIMINATOR, dtype=np.uint8)
+    mismatched = (matrix[:, :DISCRIMINATOR_SIZE] != expected).any(axis=1)
+    if mismatched.any():
+        row = int(np.argmax(mismatched))
+        raise AccountDecodeError(f"row {row}: account data is not a {view_class.ACCOUNT_NAME}")
+
+    out = np.zeros(count, dtype=account_dtype(view_class))
+    offsets = np.full(count, DISCRIMINATOR_SIZE, dtype=np.int64)
+    _decode_into(out, view_class, matrix, offsets)
+    truncated = offsets > lengths
+    if truncated.any():
+        row = int(np.argmax(truncated))
+        raise AccountDecodeError(f"row {row}: {view_class.ACCOUNT_NAME} account data is truncated")
+    return out
+
+
+def decode_program_accounts_array(
+    view_class: type[AccountView],
+    accounts: Sequence[tuple[str, RawAccount]],
+) -> tuple[list[str], NDArray[Any]]:
+    """Decode a ``getProgramAccounts`` result; returns addresses aligned with the rows."""
+    return (
+        [address for address, _ in accounts],
+        decode_accounts_array(view_class, [account.data for _, account in accounts]),
+    )
@@ -0,0 +1,267 @@
+"""Slot-aware account cache kept current by ``accountSubscribe`` / ``programSubscribe``.
+
+Entries are keyed by ``(pubkey, commitment)`` and remember the context slot of the RPC
+response they came from, so a read can demand data no older than a given slot. A
+notification for an account drops its entries and leaves a slot marker behind, so a
+read that was already in flight cannot store the value the notification superseded.
+Eviction is LRU against an approximate byte budget. Lookups never await, so one lock
+makes a cache safe to share between the warm daemon's command threads and the thread
+that applies notifications. While a cache that depends on a subscription has no live
+feed it is bypassed: reads miss and nothing is stored until the feed is back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.observability.logging import get_logger
+from ai_arbitration_dao.observability.metrics import CacheMetrics, cache_metrics
+from ai_arbitration_dao.solana.account_loader import RawAccount
+
+ACCOUNT_CACHE_METRICS = "account"
+DEFAULT_ACCOUNT_CACHE_BYTES = 64 * 1024 * 1024
+# Rough cost of the key, the entry and the RawAccount on top of the account data itself.
+_ENTRY_OVERHEAD_BYTES = 256
+_RECONNECT_DELAY_SECONDS = 1.0
+
+
+@dataclass(slots=True, frozen=True)
+class CachedAccount:
+    account: RawAccount | None
+    slot: int
+
+
+@dataclass(slots=True, frozen=True)
+class _Entry:
+    stored_at: float
+    slot: int
+    # ``None`` marks an invalidated key: nothing cached, but older values are refused.
+    value: CachedAccount | None
+    nbytes: int
+
+
+def _entry_size(account: RawAccount | None) -> int:
+    return _ENTRY_OVERHEAD_BYTES + (0 if account is None else len(account.data))
+
+
+class AccountCache:
+    """LRU cache of account reads bounded by ``max_bytes``, with an optional entry TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = DEFAULT_ACCOUNT_CACHE_BYTES,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: CacheMetrics | None = None,
+    ) -> None:
+        if max_bytes < _ENTRY_OVERHEAD_BYTES:
+            raise ValueError(f"max_bytes must be at least {_ENTRY_OVERHEAD_BYTES}")
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._metrics = metrics if metrics is not None else cache_metrics(ACCOUNT_CACHE_METRICS)
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._commitments: set[str] = set()
+        self._nbytes = 0
+        self._bypassed = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        return self._metrics
+
+    @property
+    def bypassed(self) -> bool:
+        return self._bypassed
+
+    def bypass(self) -> None:
+        """Empty the cache and stop serving or storing reads until ``resume``."""
+        with self._lock:
+            self._bypassed = True
+            self._entries.clear()
+            self._nbytes = 0
+
+    def resume(self) -> None:
+        with self._lock:
+            self._bypassed = False
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        self._nbytes -= self._entries.pop(key).nbytes
+
+    def _insert(self, key: tuple[str, str], entry: _Entry) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._nbytes += entry.nbytes
+        while self._nbytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            if oldest != key:
+                self._metrics.record_eviction()
+
+    def get(
+        self,
+        pubkey: str,
+        commitment: str,
+        *,
+        min_slot: int | None = None,
+    ) -> CachedAccount | None:
+        """Cached read of ``pubkey`` observed at ``min_slot`` or later, if there is one."""
+        key = (pubkey, commitment)
+        with self._lock:
+            entry = None if self._bypassed else self._entries.get(key)
+            if entry is not None and entry.value is not None:
+                if (
+                    self._ttl_seconds is not None
+                    and self._clock() - entry.stored_at >= self._ttl_seconds
+                ):
+                    self._remove(key)
+                elif min_slot is None or entry.slot >= min_slot:
+                    self._entries.move_to_end(key)
+                    self._metrics.record_hit()
+                    return entry.value
+            self._metrics.record_miss()
+            return None
+
+    def put(self, pubkey: str, commitment: str, account: RawAccount | None, slot: int) -> bool:
+        """Store a read made at context ``slot``; refused if the key already has a newer slot."""
+        key = (pubkey, commitment)
+        with self._lock:
+            if self._bypassed:
+                return False
+            current = self._entries.get(key)
+            if current is not None and current.slot > slot:
+                return False
+            self._commitments.add(commitment)
+            size = _entry_size(account)
+            self._insert(key, _Entry(self._clock(), slot, CachedAccount(account, slot), size))
+            return key in self._entries
+
+    def invalidate(self, pubkey: str, *, slot: int) -> None:
+        """Drop ``pubkey`` at every commitment because it changed at ``slot``."""
+        with self._lock:
+            for commitment in self._commitments:
+                key = (pubkey, commitment)
+                current = self._entries.get(key)
+                if current is None or current.slot < slot:
+                    self._insert(key, _Entry(self._clock(), slot, None, _ENTRY_OVERHEAD_BYTES))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+
+class AccountCacheInvalidator:
+    """Applies ``accountNotification`` / ``programNotification`` messages to a cache."""
+
+    def __init__(self, cache: AccountCache) -> None:
+        self._cache = cache
+        self._accounts: dict[int, str] = {}
+
+    def track(self, subscription_id: int, pubkey: str) -> None:
+        """Record which account an ``accountSubscribe`` subscription watches."""
+        self._accounts[subscription_id] = pubkey
+
+    def handle(self, notification: object) -> None:
+        from solders.rpc.responses import AccountNotification, ProgramNotification
+
+        if isinstance(notification, ProgramNotification):
+            result = notification.result
+            self._cache.invalidate(str(result.value.pubkey), slot=result.context.slot)
+        elif isinstance(notification, AccountNotification):
+            pubkey = self._accounts.get(notification.subscription)
+            if pubkey is not None:
+                self._cache.invalidate(pubkey, slot=notification.result.context.slot)
+
+
+async def run_account_cache_invalidation(
+    ws_url: str,
+    cache: AccountCache,
+    program_id: str,
+    *,
+    accounts: Sequence[str] = (),
+) -> None:
+    """Invalidate ``cache`` from one websocket subscription until the connection drops.
+
+    Watches every account owned by ``program_id`` plus ``accounts`` (for accounts of other
+    programs). Without the feed, cached values can no longer be trusted to be current, so
+    the cache is bypassed until every subscription is in place and again once the
+    connection ends.
+    """
+    from solana.rpc.websocket_api import SolanaWsClient
+
+    invalidator = AccountCacheInvalidator(cache)
+    cache.bypass()
+    try:
+        async with SolanaWsClient(ws_url) as client:
+            await client.program_subscribe(
+                program_id=Pubkey.from_string(program_id), encoding="base64"
+            )
+            for pubkey in accounts:
+                subscription = await client.account_subscribe(
+                    pubkey=Pubkey.from_string(pubkey), encoding="base64"
+                )
+                invalidator.track(subscription.subscription_id, pubkey)
+            cache.resume()
+            async for notification in client:
+                invalidator.handle(notification)
+    finally:
+        cache.bypass()
+
+
+@lru_cache(maxsize=4)
+def shared_account_cache(max_bytes: int, ttl_seconds: float | None) -> AccountCache:
+    return AccountCache(max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+
+
+def account_cache_for(settings: AppSettings) -> AccountCache | None:
+    """The process-wide cache configured by ``settings``; ``None`` when caching is off."""
+    if settings.account_cache_max_bytes <= 0:
+        return None
+    ttl_seconds = settings.account_cache_ttl_seconds
+    return shared_account_cache(settings.account_cache_max_bytes, ttl_seconds or None)
+
+
+def start_account_cache_invalidation(settings: AppSettings) -> threading.Thread | None:
+    """Keep the shared cache invalidated from ``SOLANA_WS_URL`` on a background thread."""
+    cache = account_cache_for(settings)
+    if cache is None or not settings.solana_ws_url:
+        return None
+
+    logger = get_logger("account_cache")
+    # Reads from other threads must not fill the cache before the first subscription.
+    cache.bypass()
+
+    async def follow() -> None:
+        while True:
+            try:
+                await run_account_cache_invalidation(
+                    settings.solana_ws_url, cache, settings.safe_treasury_program_id
+                )
+            except Exception as exc:
+                logger.warning("account_cache_feed_lost", error=str(exc))
+            await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    thread = threading.Thread(
+        target=asyncio.run, args=(follow(),), name="account-cache-invalidation", daemon=True
+    )
+    thread.start()
+    return thread
@@ -0,0 +1,103 @@
+"""Bulk account reads over ``getMultipleAccounts``."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.models import MemcmpOpts
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.solana.accounts import PUBKEY_SIZE
+
+# Solana RPC nodes reject ``getMultipleAccounts`` requests with more than 100 keys.
+MAX_ACCOUNTS_PER_REQUEST = 100
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+@dataclass(slots=True, frozen=True)
+class RawAccount:
+    owner: str
+    data: bytes
+
+
+class AccountLoader(Protocol):
+    async def load_accounts(self, addresses: Sequence[str]) -> list[RawAccount | None]: ...
+
+
+class ProgramAccountLoader(Protocol):
+    async def load_program_accounts(
+        self,
+        program_id: str,
+        discriminator: bytes,
+    ) -> list[tuple[str, RawAccount]]: ...
+
+
+class BulkAccountLoader(AccountLoader, ProgramAccountLoader, Protocol):
+    pass
+
+
+def _memcmp_bytes(prefix: bytes) -> str:
+    """Base58-encode a memcmp prefix of up to 32 bytes with solders' ``Pubkey`` encoder.
+
+    Left-padding with zero bytes only prepends ``1`` digits, which are sliced off again.
+    """
+    padding = PUBKEY_SIZE - len(prefix)
+    return str(Pubkey.from_bytes(bytes(padding) + prefix))[padding:]
+
+
+class RpcAccountLoader:
+    """Load accounts in ``getMultipleAccounts`` chunks issued concurrently.
+
+    Results keep the order of ``addresses``; missing accounts are ``None``.
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        *,
+        chunk_size: int = MAX_ACCOUNTS_PER_REQUEST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        if not 1 <= chunk_size <= MAX_ACCOUNTS_PER_REQUEST:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_ACCOUNTS_PER_REQUEST}")
+        self._client = client
+        self._chunk_size = chunk_size
+        self._semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def _load_chunk(self, addresses: Sequence[str]) -> list[RawAccount | None]:
+        pubkeys = [Pubkey.from_string(address) for address in addresses]
+        async with self._semaphore:
+            response = await self._client.get_multiple_accounts(pubkeys, encoding="base64")
+        return [
+            None if account is None else RawAccount(owner=str(account.owner), data=account.data)
+            for account in response.value
+        ]
+
+    async def load_accounts(self, addresses: Sequence[str]) -> list[RawAccount | None]:
+        chunks = [
+            addresses[start : start + self._chunk_size]
+            for start in range(0, len(addresses), self._chunk_size)
+        ]
+        results = await asyncio.gather(*(self._load_chunk(chunk) for chunk in chunks))
+        return [account for chunk_result in results for account in chunk_result]
+
+    async def load_program_accounts(
+        self,
+        program_id: str,
+        discriminator: bytes,
+    ) -> list[tuple[str, RawAccount]]:
+        """Scan every account of ``program_id`` whose data starts with ``discriminator``."""
+        async with self._semaphore:
+            response = await self._client.get_program_accounts(
+                Pubkey.from_string(program_id),
+                encoding="base64",
+                filters=[MemcmpOpts(offset=0, bytes=_memcmp_bytes(discriminator))],
+            )
+        return [
+            (str(item.pubkey), RawAccount(owner=str(item.account.owner), data=item.account.data))
+            for item in response.value
+        ]
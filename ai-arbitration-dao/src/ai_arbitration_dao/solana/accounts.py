@@ -0,0 +1,405 @@
+"""Decoders for safe-treasury Anchor accounts.
+
+Layouts mirror ``programs/safe-treasury/src/state.rs``: an 8-byte Anchor discriminator
+(``sha256("account:<Name>")[:8]``) followed by Borsh-encoded fields.
+
+Each ``*View`` class wraps a ``memoryview`` over the raw account data without copying it.
+Field offsets are resolved once at construction (only ``Option`` tags move them) and each
+field is decoded on attribute access, so reading one field of a large account costs one
+``unpack_from``. ``decode_challenge`` and ``decode_payout`` materialize the subset of
+fields the runtime commands use.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, ClassVar, Self, overload
+
+from solders.pubkey import Pubkey
+
+DISCRIMINATOR_SIZE = 8
+PUBKEY_SIZE = 32
+
+# ``SafePolicy`` embedded in ``Payout.policy_snapshot`` (no discriminator).
+SAFE_POLICY_SIZE = 174
+# ``SafePolicy.resolver`` follows the discriminator and ``authority`` at a fixed offset.
+SAFE_POLICY_RESOLVER_OFFSET = DISCRIMINATOR_SIZE + PUBKEY_SIZE
+
+_U8 = struct.Struct("<B")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+
+AccountData = bytes | bytearray | memoryview
+
+
+class AccountDecodeError(ValueError):
+    pass
+
+
+def account_discriminator(name: str) -> bytes:
+    return hashlib.sha256(f"account:{name}".encode()).digest()[:DISCRIMINATOR_SIZE]
+
+
+CHALLENGE_DISCRIMINATOR = account_discriminator("Challenge")
+PAYOUT_DISCRIMINATOR = account_discriminator("Payout")
+SAFE_POLICY_DISCRIMINATOR = account_discriminator("SafePolicy")
+CHALLENGE_BOND_VAULT_DISCRIMINATOR = account_discriminator("ChallengeBondVault")
+TREASURY_INFO_DISCRIMINATOR = account_discriminator("TreasuryInfo")
+TREASURY_REGISTRY_DISCRIMINATOR = account_discriminator("TreasuryRegistry")
+
+
+class Field[T](ABC):
+    """A Borsh field read lazily from the owning view's buffer."""
+
+    size: int
+    optional = False
+    # NumPy dtype spec for the vectorized decoder in ``solana.account_arrays``.
+    numpy_dtype: Any = None
+    index: int
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @abstractmethod
+    def read(self, data: memoryview, offset: int) -> T: ...
+
+    @overload
+    def __get__(self, view: None, owner: type) -> Self: ...
+
+    @overload
+    def __get__(self, view: AccountView, owner: type) -> T: ...
+
+    def __get__(self, view: AccountView | None, owner: type) -> Self | T:
+        if view is None:
+            return self
+        return self.read(view.data, view.base + view.offsets[self.index])
+
+
+class Int(Field[int]):
+    def __init__(self, layout: struct.Struct, numpy_dtype: str) -> None:
+        self._layout = layout
+        self.size = layout.size
+        self.numpy_dtype = numpy_dtype
+
+    def read(self, data: memoryview, offset: int) -> int:
+        value: int = self._layout.unpack_from(data, offset)[0]
+        return value
+
+
+class Bool(Field[bool]):
+    size = 1
+    numpy_dtype = "?"
+
+    def read(self, data: memoryview, offset: int) -> bool:
+        return data[offset] != 0
+
+
+class Key(Field[str]):
+    size = PUBKEY_SIZE
+    numpy_dtype = ("u1", (PUBKEY_SIZE,))
+
+    def read(self, data: memoryview, offset: int) -> str:
+        return str(Pubkey.from_bytes(bytes(data[offset : offset + PUBKEY_SIZE])))
+
+
+class Bytes(Field[memoryview]):
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.numpy_dtype = ("u1", (size,))
+
+    def read(self, data: memoryview, offset: int) -> memoryview:
+        return data[offset : offset + self.size]
+
+
+class Option[T](Field[T | None]):
+    optional = True
+
+    def __init__(self, inner: Field[T]) -> None:
+        self.inner = inner
+        self.size = inner.size
+        self.numpy_dtype = inner.numpy_dtype
+
+    def read(self, data: memoryview, offset: int) -> T | None:
+        if data[offset] == 0:
+            return None
+        return self.inner.read(data, offset + 1)
+
+
+def u8() -> Int:
+    return Int(_U8, "u1")
+
+
+def u64() -> Int:
+    return Int(_U64, "<u8")
+
+
+def i64() -> Int:
+    return Int(_I64, "<i8")
+
+
+class AccountView:
+    """Base for lazy account views; subclasses declare fields in Borsh order."""
+
+    __slots__ = ("data", "base", "offsets")
+
+    ACCOUNT_NAME: ClassVar[str]
+    # What the discriminator tags: "account", or "event" for Anchor event payloads.
+    KIND: ClassVar[str] = "account"
+    DISCRIMINATOR: ClassVar[bytes]
+    FIELDS: ClassVar[tuple[Field[Any], ...]]
+    # Encoded size with every ``Option`` present (Anchor's ``InitSpace``, minus the
+    # discriminator).
+    SIZE: ClassVar[int]
+    _STATIC_OFFSETS: ClassVar[tuple[int, ...] | None]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields = [value for value in vars(cls).values() if isinstance(value, Field)]
+        offsets: list[int] = []
+        size = 0
+        for index, field in enumerate(fields):
+            field.index = index
+            offsets.append(size)
+            size += field.size + (1 if field.optional else 0)
+        cls.FIELDS = tuple(fields)
+        cls.SIZE = size
+        cls._STATIC_OFFSETS = None if any(f.optional for f in fields) else tuple(offsets)
+
+    def __init__(self, data: AccountData, base: int = DISCRIMINATOR_SIZE) -> None:
+        """Wrap ``data``; ``base`` is where the fields start (after the discriminator).
+
+        The discriminator is checked only for top-level accounts (``base`` of 8).
+        """
+        view = data if isinstance(data, memoryview) else memoryview(data)
+        if base == DISCRIMINATOR_SIZE and view[:DISCRIMINATOR_SIZE] != self.DISCRIMINATOR:
+            raise AccountDecodeError(f"{self.KIND} data is not a {self.ACCOUNT_NAME} {self.KIND}")
+        self.data = view
+        self.base = base
+        static = self._STATIC_OFFSETS
+        if static is not None:
+            self.offsets = static
+            end = base + self.SIZE
+        else:
+            self.offsets, end = self._resolve_offsets(view, base)
+        if end > len(view):
+            raise AccountDecodeError(f"{self.ACCOUNT_NAME} {self.KIND} data is truncated")
+
+    def _resolve_offsets(self, view: memoryview, base: int) -> tuple[tuple[int, ...], int]:
+        offsets: list[int] = []
+        offset = 0
+        for field in self.FIELDS:
+            offsets.append(offset)
+            if not field.optional:
+                offset += field.size
+                continue
+            if base + offset >= len(view):
+                raise AccountDecodeError(f"{self.ACCOUNT_NAME} {self.KIND} data is truncated")
+            tag = view[base + offset]
+            if tag > 1:
+                raise AccountDecodeError(
+                    f"{self.ACCOUNT_NAME}.{field.name} has invalid Option tag {tag}"
+                )
+            offset += 1 + (field.size if tag else 0)
+        return tuple(offsets), base + offset
+
+    def as_dict(self) -> dict[str, Any]:
+        """Decode every field; raw byte arrays are rendered as hex."""
+        values: dict[str, Any] = {}
+        for field in self.FIELDS:
+            value = field.__get__(self, type(self))
+            if isinstance(value, memoryview):
+                value = value.hex()
+            elif isinstance(value, AccountView):
+                value = value.as_dict()
+            values[field.name] = value
+        return values
+
+
+class Nested[V: AccountView](Field[V]):
+    def __init__(self, view_class: type[V]) -> None:
+        self.view_class = view_class
+        self.size = view_class.SIZE
+
+    def read(self, data: memoryview, offset: int) -> V:
+        return self.view_class(data, offset)
+
+
+class SafePolicyView(AccountView):
+    __slots__ = ()
+    ACCOUNT_NAME = "SafePolicy"
+    DISCRIMINATOR = SAFE_POLICY_DISCRIMINATOR
+
+    authority = Key()
+    resolver = Key()
+    dispute_window = u64()
+    challenge_bond = u64()
+    eligibility_mint = Key()
+    min_token_balance = u64()
+    max_appeal_rounds = u8()
+    appeal_window_duration = u64()
+    appeal_bond_multiplier = u8()
+    ipfs_policy_hash = Bytes(32)
+    exit_custody_allowed = Bool()
+    payout_cancellation_allowed = Bool()
+    treasury_mode_enabled = Bool()
+    payout_count = u64()
+    bump = u8()
+
+
+class PayoutView(AccountView):
+    __slots__ = ()
+    ACCOUNT_NAME = "Payout"
+    DISCRIMINATOR = PAYOUT_DISCRIMINATOR
+
+    payout_id = u64()
+    payout_index = u64()
+    safe = Key()
+    asset_type = u8()
+    mint = Option(Key())
+    recipient = Key()
+    amount = u64()
+    metadata_hash = Option(Bytes(32))
+    status = u8()
+    dispute_deadline = i64()
+    policy_snapshot = Nested(SafePolicyView)
+    challenge = Option(Key())
+    dispute_round = u8()
+    finalized = Bool()
+    final_outcome = Option(u8())
+    bump = u8()
+
+
+class ChallengeView(AccountView):
+    __slots__ = ()
+    ACCOUNT_NAME = "Challenge"
+    DISCRIMINATOR = CHALLENGE_DISCRIMINATOR
+
+    payout = Key()
+    challenger = Key()
+    bond_amount = u64()
+    round = u8()
+    created_at = i64()
+    appeal_deadline = i64()
+    current_outcome = Option(u8())
+    ruling_recorded_for_round = u8()
+    bump = u8()
+
+
+class ChallengeBondVaultView(AccountView):
+    __slots__ = ()
+    ACCOUNT_NAME = "ChallengeBondVault"
+    DISCRIMINATOR = CHALLENGE_BOND_VAULT_DISCRIMINATOR
+
+    total_bonds_held = u64()
+    bump = u8()
+
+
+class TreasuryInfoView(AccountView):
+    __slots__ = ()
+    ACCOUNT_NAME = "TreasuryInfo"
+    DISCRIMINATOR = TREASURY_INFO_DISCRIMINATOR
+
+    safe = Key()
+    mode = u8()
+    registered_at = i64()
+    bump = u8()
+
+
+class TreasuryRegistryView(AccountView):
+    __slots__ = ()
+    ACCOUNT_NAME = "TreasuryRegistry"
+    DISCRIMINATOR = TREASURY_REGISTRY_DISCRIMINATOR
+
+    treasury_count = u64()
+    bump = u8()
+
+
+ACCOUNT_VIEWS: dict[bytes, type[AccountView]] = {
+    view_class.DISCRIMINATOR: view_class
+    for view_class in (
+        SafePolicyView,
+        PayoutView,
+        ChallengeView,
+        ChallengeBondVaultView,
+        TreasuryInfoView,
+        TreasuryRegistryView,
+    )
+}
+
+
+def view_account(data: AccountData) -> AccountView:
+    """Wrap ``data`` in the view matching its discriminator."""
+    view_class = ACCOUNT_VIEWS.get(bytes(data[:DISCRIMINATOR_SIZE]))
+    if view_class is None:
+        raise AccountDecodeError("account data has an unknown discriminator")
+    return view_class(data)
+
+
+@dataclass(slots=True, frozen=True)
+class ChallengeAccount:
+    payout: str
+    challenger: str
+    bond_amount: int
+    round: int
+    created_at: int
+    appeal_deadline: int
+    current_outcome: int | None
+    ruling_recorded_for_round: int
+    bump: int
+
+
+@dataclass(slots=True, frozen=True)
+class PayoutAccount:
+    payout_id: int
+    payout_index: int
+    safe: str
+    asset_type: int
+    status: int
+    dispute_deadline: int
+    challenge: str | None
+    dispute_round: int
+    finalized: bool
+    final_outcome: int | None
+    bump: int
+
+
+def safe_policy_resolver(data: AccountData) -> memoryview:
+    """Zero-copy view of ``SafePolicy.resolver``; compare it directly against raw key bytes."""
+    return SafePolicyView(data).data[
+        SAFE_POLICY_RESOLVER_OFFSET : SAFE_POLICY_RESOLVER_OFFSET + PUBKEY_SIZE
+    ]
+
+
+def decode_challenge(data: AccountData) -> ChallengeAccount:
+    view = ChallengeView(data)
+    return ChallengeAccount(
+        payout=view.payout,
+        challenger=view.challenger,
+        bond_amount=view.bond_amount,
+        round=view.round,
+        created_at=view.created_at,
+        appeal_deadline=view.appeal_deadline,
+        current_outcome=view.current_outcome,
+        ruling_recorded_for_round=view.ruling_recorded_for_round,
+        bump=view.bump,
+    )
+
+
+def decode_payout(data: AccountData) -> PayoutAccount:
+    view = PayoutView(data)
+    return PayoutAccount(
+        payout_id=view.payout_id,
+        payout_index=view.payout_index,
+        safe=view.safe,
+        asset_type=view.asset_type,
+        status=view.status,
+        dispute_deadline=view.dispute_deadline,
+        challenge=view.challenge,
+        dispute_round=view.dispute_round,
+        finalized=view.finalized,
+        final_outcome=view.final_outcome,
+        bump=view.bump,
+    )
@@ -0,0 +1,287 @@
+"""Coalesced account reads over one shared RPC client.
+
+Single-account reads issued within ``window_seconds`` of each other are merged into
+``getMultipleAccounts`` chunks of at most 100 keys, and the chunks of one flush are sent as
+a single JSON-RPC batch array when the endpoint accepts batches. A key that is already
+queued or in flight joins the pending read instead of issuing another, and identical
+concurrent ``getProgramAccounts`` scans share one request.
+
+With an ``AccountCache`` attached, reads are served from the cache when it holds a value
+observed at the caller's ``min_slot`` or later, and every fetched account is stored with
+the context slot of its response.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from solana.exceptions import SolanaRpcException
+from solana.rpc.core import RPCException
+from solders.account_decoder import UiAccountEncoding
+from solders.commitment_config import CommitmentLevel
+from solders.pubkey import Pubkey
+from solders.rpc.config import RpcAccountInfoConfig
+from solders.rpc.requests import GetMultipleAccounts, batch_to_json
+from solders.rpc.responses import GetMultipleAccountsResp, batch_from_json
+
+from ai_arbitration_dao.solana.account_cache import AccountCache, CachedAccount
+from ai_arbitration_dao.solana.account_loader import (
+    MAX_ACCOUNTS_PER_REQUEST,
+    RawAccount,
+    RpcAccountLoader,
+)
+
+if TYPE_CHECKING:
+    from ai_arbitration_dao.solana.rpc_client import ProviderAsyncClient
+
+# Many hosted RPC providers cap the number of requests in one JSON-RPC batch.
+MAX_REQUESTS_PER_BATCH = 20
+
+_AccountFuture = asyncio.Future[RawAccount | None]
+_ScanFuture = asyncio.Future[list[tuple[str, RawAccount]]]
+
+
+class _BatchRejectedError(Exception):
+    """The endpoint answered a JSON-RPC batch with something other than a batch reply."""
+
+
+@dataclass(slots=True, frozen=True)
+class _BatchBody:
+    requests: Sequence[GetMultipleAccounts]
+
+    def to_json(self) -> str:
+        return batch_to_json(list(self.requests))
+
+
+class CoalescingAccountReader:
+    """``BulkAccountLoader`` that merges concurrent reads into shared RPC calls.
+
+    Bind one reader to one event loop, like the client it wraps; ``RpcClientFactory.reader``
+    hands out a shared instance per RPC URL. Results keep the order of ``addresses``;
+    missing accounts are ``None``.
+    """
+
+    def __init__(
+        self,
+        client: ProviderAsyncClient,
+        *,
+        chunk_size: int = MAX_ACCOUNTS_PER_REQUEST,
+        window_seconds: float = 0.0,
+        batch_requests: bool = True,
+        cache: AccountCache | None = None,
+    ) -> None:
+        if not 1 <= chunk_size <= MAX_ACCOUNTS_PER_REQUEST:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_ACCOUNTS_PER_REQUEST}")
+        self._client = client
+        self._chunk_size = chunk_size
+        self._window_seconds = max(window_seconds, 0.0)
+        self._batch_requests = batch_requests
+        self._cache = cache
+        self._commitment = str(client.commitment)
+        self._commitment_level = CommitmentLevel.from_string(self._commitment)
+        self._scanner = RpcAccountLoader(client)
+        self._pending: dict[Pubkey, _AccountFuture] = {}
+        self._queued: list[Pubkey] = []
+        self._queued_min_slot: int | None = None
+        self._flush_scheduled = False
+        self._scans: dict[tuple[str, bytes], _ScanFuture] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def batch_requests(self) -> bool:
+        """Whether flushes are still sent as batch arrays.
+
+        Cleared only when the endpoint explicitly rejects a batch; a batch that fails for
+        any other reason (a timeout, a 5xx) is retried per chunk and batching stays on.
+        """
+        return self._batch_requests
+
+    async def load_account(
+        self,
+        address: str,
+        *,
+        min_slot: int | None = None,
+    ) -> RawAccount | None:
+        return (await self.load_accounts([address], min_slot=min_slot))[0]
+
+    async def load_accounts(
+        self,
+        addresses: Sequence[str],
+        *,
+        min_slot: int | None = None,
+    ) -> list[RawAccount | None]:
+        """Read ``addresses``; ``min_slot`` bounds how old a cached or fetched value may be.
+
+        A key already in flight is joined even if that read was issued with a lower
+        ``min_slot``.
+        """
+        pubkeys = [Pubkey.from_string(address) for address in addresses]
+        reads: list[CachedAccount | _AccountFuture] = []
+        for pubkey in pubkeys:
+            cached = None
+            if self._cache is not None:
+                cached = self._cache.get(str(pubkey), self._commitment, min_slot=min_slot)
+            reads.append(cached if cached is not None else self._future_for(pubkey, min_slot))
+        pending = [read for read in reads if not isinstance(read, CachedAccount)]
+        await asyncio.gather(*(asyncio.shield(future) for future in pending))
+        return [
+            read.account if isinstance(read, CachedAccount) else read.result() for read in reads
+        ]
+
+    async def load_program_accounts(
+        self,
+        program_id: str,
+        discriminator: bytes,
+    ) -> list[tuple[str, RawAccount]]:
+        """Scan ``program_id`` like ``RpcAccountLoader``, sharing identical concurrent scans."""
+        key = (program_id, discriminator)
+        future = self._scans.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._scans[key] = future
+            self._spawn(self._scan(key, future))
+        return await asyncio.shield(future)
+
+    def _future_for(self, pubkey: Pubkey, min_slot: int | None) -> _AccountFuture:
+        if min_slot is not None:
+            self._queued_min_slot = max(min_slot, self._queued_min_slot or 0)
+        future = self._pending.get(pubkey)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[pubkey] = future
+        self._queued.append(pubkey)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            if self._window_seconds:
+                loop.call_later(self._window_seconds, self._flush)
+            else:
+                loop.call_soon(self._flush)
+        return future
+
+    def _spawn(self, coroutine: Any) -> None:
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        queued, self._queued = self._queued, []
+        min_slot, self._queued_min_slot = self._queued_min_slot, None
+        chunks = [
+            queued[start : start + self._chunk_size]
+            for start in range(0, len(queued), self._chunk_size)
+        ]
+        for start in range(0, len(chunks), MAX_REQUESTS_PER_BATCH):
+            self._spawn(self._fetch(chunks[start : start + MAX_REQUESTS_PER_BATCH], min_slot))
+
+    async def _fetch(self, chunks: list[list[Pubkey]], min_slot: int | None) -> None:
+        owned = [[(pubkey, self._pending[pubkey]) for pubkey in chunk] for chunk in chunks]
+        try:
+            responses = await self._fetch_chunks(self._requests(chunks, min_slot))
+            for entries, response in zip(owned, responses, strict=True):
+                slot = response.context.slot
+                for (pubkey, future), account in zip(entries, _raw_accounts(response), strict=True):
+                    if self._cache is not None:
+                        self._cache.put(str(pubkey), self._commitment, account, slot)
+                    future.set_result(account)
+        except BaseException as exc:
+            # Includes cancellation and solders' PanicException, which are not ``Exception``s.
+            for entries in owned:
+                for _, future in entries:
+                    if not future.done():
+                        future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+        finally:
+            for entries in owned:
+                for pubkey, future in entries:
+                    if self._pending.get(pubkey) is future:
+                        del self._pending[pubkey]
+
+    def _requests(
+        self,
+        chunks: list[list[Pubkey]],
+        min_slot: int | None,
+    ) -> list[GetMultipleAccounts]:
+        config = RpcAccountInfoConfig(
+            encoding=UiAccountEncoding.Base64,
+            commitment=self._commitment_level,
+            min_context_slot=min_slot,
+        )
+        return [GetMultipleAccounts(chunk, config, id=index) for index, chunk in enumerate(chunks)]
+
+    async def _fetch_chunks(
+        self,
+        requests: list[GetMultipleAccounts],
+    ) -> list[GetMultipleAccountsResp]:
+        if len(requests) > 1 and self._batch_requests:
+            try:
+                return await self._fetch_batch(requests)
+            except _BatchRejectedError:
+                self._batch_requests = False
+            except (SolanaRpcException, ValueError):
+                # Possibly transient: retry this flush one request per chunk.
+                pass
+        return await self._fetch_each(requests)
+
+    async def _fetch_each(
+        self,
+        requests: list[GetMultipleAccounts],
+    ) -> list[GetMultipleAccountsResp]:
+        return list(
+            await asyncio.gather(
+                *(self._client.send(request, GetMultipleAccountsResp) for request in requests)
+            )
+        )
+
+    async def _fetch_batch(
+        self,
+        requests: list[GetMultipleAccounts],
+    ) -> list[GetMultipleAccountsResp]:
+        raw = await self._client.send_unparsed(_BatchBody(requests))
+        items = json.loads(raw)
+        if not isinstance(items, list):
+            raise _BatchRejectedError("endpoint did not answer the JSON-RPC batch with an array")
+        if items and all(_rejects_batch(item) for item in items):
+            raise _BatchRejectedError("endpoint does not support JSON-RPC batches")
+        if len(items) != len(requests):
+            raise ValueError("endpoint answered the JSON-RPC batch with the wrong length")
+        # Batch responses may arrive in any order; ``id`` ties them back to their chunk.
+        items.sort(key=lambda item: item.get("id", -1))
+        parsed = batch_from_json(json.dumps(items), [GetMultipleAccountsResp] * len(requests))
+        responses: list[GetMultipleAccountsResp] = []
+        for response in parsed:
+            if not isinstance(response, GetMultipleAccountsResp):
+                raise RPCException(response)
+            responses.append(response)
+        return responses
+
+    async def _scan(self, key: tuple[str, bytes], future: _ScanFuture) -> None:
+        try:
+            future.set_result(await self._scanner.load_program_accounts(*key))
+        except BaseException as exc:
+            future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+        finally:
+            del self._scans[key]
+
+
+def _rejects_batch(item: object) -> bool:
+    if not isinstance(item, dict):
+        return False
+    error = item.get("error")
+    return isinstance(error, dict) and "batch" in str(error.get("message", "")).lower()
+
+
+def _raw_accounts(response: GetMultipleAccountsResp) -> list[RawAccount | None]:
+    return [
+        None if account is None else RawAccount(owner=str(account.owner), data=account.data)
+        for account in response.value
+    ]
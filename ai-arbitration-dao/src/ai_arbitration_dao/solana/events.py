@@ -0,0 +1,276 @@
+"""Streaming decoder for safe-treasury Anchor events in transaction logs.
+
+``emit!`` writes each event as a ``Program data: <base64>`` log line whose payload is the
+8-byte discriminator ``sha256("event:<Name>")[:8]`` followed by the Borsh-encoded event.
+Lines are attributed to the program on top of the ``invoke [n]`` / ``success`` /
+``failed`` call stack, so data logged by other programs (including CPIs made by the
+safe-treasury program) is skipped. Events are the same lazy views as accounts; see
+``solana.accounts``. A data line that carries a known discriminator but does not decode is
+reported to ``on_error`` (logged by default) and skipped, so one bad payload cannot end a
+live feed.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
+
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.observability.logging import get_logger
+from ai_arbitration_dao.solana.accounts import (
+    DISCRIMINATOR_SIZE,
+    AccountDecodeError,
+    AccountView,
+    Bool,
+    Bytes,
+    Key,
+    Option,
+    i64,
+    u8,
+    u64,
+)
+
+PROGRAM_DATA_PREFIX = "Program data: "
+_PROGRAM_PREFIX = "Program "
+_INVOKE_PREFIX = "invoke ["
+
+UndecodableEventHandler = Callable[[AccountDecodeError], None]
+
+
+def event_discriminator(name: str) -> bytes:
+    return hashlib.sha256(f"event:{name}".encode()).digest()[:DISCRIMINATOR_SIZE]
+
+
+class _EventView(AccountView):
+    __slots__ = ()
+    KIND = "event"
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.ACCOUNT_NAME = cls.__name__
+        cls.DISCRIMINATOR = event_discriminator(cls.__name__)
+
+
+class PayoutQueued(_EventView):
+    __slots__ = ()
+    safe = Key()
+    payout_id = u64()
+    asset_type = u8()
+    mint = Option(Key())
+    recipient = Key()
+    amount = u64()
+    dispute_deadline = i64()
+    policy_hash = Bytes(32)
+
+
+class PayoutChallenged(_EventView):
+    __slots__ = ()
+    safe = Key()
+    payout_id = u64()
+    dispute_id = Key()
+    challenger = Key()
+    bond_amount = u64()
+    round = u8()
+
+
+class RulingRecorded(_EventView):
+    __slots__ = ()
+    safe = Key()
+    payout_id = u64()
+    dispute_id = Key()
+    round = u8()
+    outcome = u8()
+    is_final = Bool()
+
+
+class RulingAppealed(_EventView):
+    __slots__ = ()
+    safe = Key()
+    payout_id = u64()
+    dispute_id = Key()
+    new_round = u8()
+    bond_amount = u64()
+
+
+class RulingFinalized(_EventView):
+    __slots__ = ()
+    safe = Key()
+    payout_id = u64()
+    dispute_id = Key()
+    round = u8()
+    outcome = u8()
+
+
+class PayoutReleased(_EventView):
+    __slots__ = ()
+    safe = Key()
+    payout_id = u64()
+    recipient = Key()
+    amount = u64()
+    asset_type = u8()
+
+
+class PayoutDenied(_EventView):
+    __slots__ = ()
+    safe = Key()
+    payout_id = u64()
+
+
+class PayoutCancelled(_EventView):
+    __slots__ = ()
+    safe = Key()
+    payout_id = u64()
+
+
+class CustodyExited(_EventView):
+    __slots__ = ()
+    safe = Key()
+    asset_type = u8()
+    recipient = Key()
+
+
+EVENT_TYPES: dict[bytes, type[AccountView]] = {
+    event_class.DISCRIMINATOR: event_class
+    for event_class in (
+        PayoutQueued,
+        PayoutChallenged,
+        RulingRecorded,
+        RulingAppealed,
+        RulingFinalized,
+        PayoutReleased,
+        PayoutDenied,
+        PayoutCancelled,
+        CustodyExited,
+    )
+}
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionLogs:
+    signature: str
+    logs: Sequence[str]
+    failed: bool = False
+    slot: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionEvent:
+    signature: str
+    slot: int | None
+    event: AccountView
+
+
+def decode_event(payload: str | bytes) -> AccountView | None:
+    """Decode one base64 ``Program data`` payload; ``None`` for events not listed here."""
+    try:
+        raw = base64.b64decode(payload, validate=True)
+    except (binascii.Error, ValueError) as exc:
+        raise AccountDecodeError("program data is not valid base64") from exc
+    event_class = EVENT_TYPES.get(raw[:DISCRIMINATOR_SIZE])
+    if event_class is None:
+        return None
+    return event_class(raw)
+
+
+def _log_undecodable(signature: str | None, exc: AccountDecodeError) -> None:
+    get_logger("events").warning("undecodable_program_data", signature=signature, error=str(exc))
+
+
+def iter_log_events(
+    logs: Iterable[str],
+    program_id: str,
+    *,
+    on_error: UndecodableEventHandler | None = None,
+) -> Iterator[AccountView]:
+    """Yield the events ``program_id`` emitted in one transaction's log messages.
+
+    Undecodable ``Program data`` lines are passed to ``on_error`` and skipped.
+    """
+    report = on_error if on_error is not None else partial(_log_undecodable, None)
+    stack: list[str] = []
+    for line in logs:
+        if line.startswith(PROGRAM_DATA_PREFIX):
+            if stack and stack[-1] == program_id:
+                try:
+                    event = decode_event(line[len(PROGRAM_DATA_PREFIX) :])
+                except AccountDecodeError as exc:
+                    report(exc)
+                    continue
+                if event is not None:
+                    yield event
+            continue
+        if not line.startswith(_PROGRAM_PREFIX):
+            continue
+        program, _, rest = line[len(_PROGRAM_PREFIX) :].partition(" ")
+        if rest.startswith(_INVOKE_PREFIX):
+            stack.append(program)
+        elif (rest == "success" or rest.startswith("failed")) and stack and stack[-1] == program:
+            stack.pop()
+
+
+def _transaction_events(
+    transaction: TransactionLogs,
+    program_id: str,
+    on_error: UndecodableEventHandler | None,
+) -> Iterator[TransactionEvent]:
+    report = on_error if on_error is not None else partial(_log_undecodable, transaction.signature)
+    for event in iter_log_events(transaction.logs, program_id, on_error=report):
+        yield TransactionEvent(transaction.signature, transaction.slot, event)
+
+
+def iter_transaction_events(
+    transactions: Iterable[TransactionLogs],
+    program_id: str,
+    *,
+    on_error: UndecodableEventHandler | None = None,
+) -> Iterator[TransactionEvent]:
+    """Yield events from a batch of transactions in order, skipping failed transactions.
+
+    A failed transaction's state changes are rolled back, so its logged events never took
+    effect.
+    """
+    for transaction in transactions:
+        if transaction.failed:
+            continue
+        yield from _transaction_events(transaction, program_id, on_error)
+
+
+async def aiter_transaction_events(
+    transactions: AsyncIterable[TransactionLogs],
+    program_id: str,
+    *,
+    on_error: UndecodableEventHandler | None = None,
+) -> AsyncIterator[TransactionEvent]:
+    """``iter_transaction_events`` over a live feed such as ``subscribe_program_logs``."""
+    async for transaction in transactions:
+        if transaction.failed:
+            continue
+        for event in _transaction_events(transaction, program_id, on_error):
+            yield event
+
+
+async def subscribe_program_logs(ws_url: str, program_id: str) -> AsyncIterator[TransactionLogs]:
+    """Stream logs of transactions that mention ``program_id`` via ``logsSubscribe``."""
+    from solana.rpc.websocket_api import SolanaWsClient
+    from solders.rpc.config import RpcTransactionLogsFilterMentions
+    from solders.rpc.responses import LogsNotification
+
+    async with SolanaWsClient(ws_url) as client:
+        await client.logs_subscribe(
+            filter_=RpcTransactionLogsFilterMentions(Pubkey.from_string(program_id))
+        )
+        async for notification in client:
+            if not isinstance(notification, LogsNotification):
+                continue
+            result = notification.result
+            yield TransactionLogs(
+                signature=str(result.value.signature),
+                logs=result.value.logs,
+                failed=result.value.err is not None,
+                slot=result.context.slot,
+            )
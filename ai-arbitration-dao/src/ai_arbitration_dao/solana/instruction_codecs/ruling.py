@@ -1,7 +1,14 @@
 from __future__ import annotations
 
 import hashlib
+import struct
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
+
+# payout_id u64, round u8, outcome u8, is_final bool (Borsh layout, little-endian, packed).
+RECORD_RULING_STRUCT = struct.Struct("<QBB?")
+RECORD_RULING_SIZE = RECORD_RULING_STRUCT.size
 
 
 @dataclass(slots=True, frozen=True)
@@ -12,14 +19,81 @@ class RecordRulingPayload:
     is_final: bool
 
     def to_bytes(self) -> bytes:
-        return b"".join(
-            (
-                int(self.payout_id).to_bytes(8, byteorder="little", signed=False),
-                int(self.round).to_bytes(1, byteorder="little", signed=False),
-                int(self.outcome).to_bytes(1, byteorder="little", signed=False),
-                bytes([1 if self.is_final else 0]),
+        try:
+            return RECORD_RULING_STRUCT.pack(
+                int(self.payout_id), int(self.round), int(self.outcome), bool(self.is_final)
             )
-        )
+        except struct.error as exc:
+            raise OverflowError(str(exc)) from exc
 
     def payload_hash_hex(self) -> str:
         return hashlib.sha256(self.to_bytes()).hexdigest()
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes | bytearray | memoryview,
+        offset: int = 0,
+    ) -> RecordRulingPayload:
+        """Decode one payload at ``offset`` without copying the underlying buffer."""
+        try:
+            payout_id, round_value, outcome, is_final = RECORD_RULING_STRUCT.unpack_from(
+                data, offset
+            )
+        except struct.error as exc:
+            raise ValueError(f"RecordRulingPayload needs {RECORD_RULING_SIZE} bytes") from exc
+        return cls(payout_id=payout_id, round=round_value, outcome=outcome, is_final=is_final)
+
+
+def encode_many(
+    payloads: Sequence[RecordRulingPayload],
+    out: bytearray | memoryview | None = None,
+    offset: int = 0,
+) -> bytearray | memoryview:
+    """Pack payloads back to back into ``out`` (allocated once when omitted).
+
+    Each record is byte-identical to ``RecordRulingPayload.to_bytes``.
+    """
+    if out is None:
+        out = bytearray(offset + len(payloads) * RECORD_RULING_SIZE)
+    elif len(out) < offset + len(payloads) * RECORD_RULING_SIZE:
+        raise ValueError("output buffer is too small for the payloads")
+    pack_into = RECORD_RULING_STRUCT.pack_into
+    try:
+        for payload in payloads:
+            pack_into(
+                out,
+                offset,
+                int(payload.payout_id),
+                int(payload.round),
+                int(payload.outcome),
+                bool(payload.is_final),
+            )
+            offset += RECORD_RULING_SIZE
+    except struct.error as exc:
+        raise OverflowError(str(exc)) from exc
+    return out
+
+
+def _check_record_buffer(data: bytes | bytearray | memoryview) -> None:
+    if len(data) % RECORD_RULING_SIZE:
+        raise ValueError(
+            f"buffer length {len(data)} is not a multiple of {RECORD_RULING_SIZE} bytes"
+        )
+
+
+def decode_many(data: bytes | bytearray | memoryview) -> list[RecordRulingPayload]:
+    _check_record_buffer(data)
+    return [
+        RecordRulingPayload(payout_id=payout_id, round=round_value, outcome=outcome, is_final=final)
+        for payout_id, round_value, outcome, final in RECORD_RULING_STRUCT.iter_unpack(data)
+    ]
+
+
+def decode_many_array(data: bytes | bytearray | memoryview) -> Any:
+    """View the buffer as a NumPy structured array without copying (``analytics`` extra)."""
+    import numpy as np
+
+    _check_record_buffer(data)
+    dtype = np.dtype([("payout_id", "<u8"), ("round", "u1"), ("outcome", "u1"), ("is_final", "?")])
+    return np.frombuffer(data, dtype=dtype)
@@ -0,0 +1,131 @@
+"""Program-derived address derivation with a process-wide bump-seed cache.
+
+``find_program_address`` may hash up to 255 candidate seeds before it finds an
+off-curve address, so each ``(program_id, seeds)`` result is memoized and can be
+persisted to disk between runs. Seeds mirror the safe-treasury program contexts and
+the spl-governance account layout.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from pathlib import Path
+
+from solders.pubkey import Pubkey
+
+MAX_SEED_LENGTH = 32
+
+PdaSeeds = tuple[bytes, ...]
+PdaRequest = tuple[PdaSeeds, str]
+
+
+class PdaCache:
+    """Thread-safe memo of ``(program_id, seeds) -> (address, bump)``."""
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self._path = Path(path) if path else None
+        self._entries: dict[tuple[str, PdaSeeds], tuple[str, int]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if self._path is not None and self._path.exists():
+            self.load(self._path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find_program_address(self, seeds: Sequence[bytes], program_id: str) -> tuple[str, int]:
+        key = (program_id, tuple(seeds))
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None:
+            return cached
+
+        for seed in seeds:
+            if len(seed) > MAX_SEED_LENGTH:
+                raise ValueError(f"PDA seeds must be at most {MAX_SEED_LENGTH} bytes")
+        address, bump = Pubkey.find_program_address(list(seeds), Pubkey.from_string(program_id))
+        derived = (str(address), bump)
+        with self._lock:
+            self._entries[key] = derived
+            self._dirty = True
+        return derived
+
+    def derive_many(self, requests: Iterable[PdaRequest]) -> list[tuple[str, int]]:
+        """Derive many addresses, reusing cached entries and duplicate requests."""
+        return [self.find_program_address(seeds, program_id) for seeds, program_id in requests]
+
+    def load(self, path: str | os.PathLike[str]) -> None:
+        raw_entries = json.loads(Path(path).read_text(encoding="utf-8"))
+        entries = {
+            (str(entry["program_id"]), tuple(bytes.fromhex(seed) for seed in entry["seeds"])): (
+                str(entry["address"]),
+                int(entry["bump"]),
+            )
+            for entry in raw_entries
+        }
+        with self._lock:
+            self._entries.update(entries)
+
+    def save(self, path: str | os.PathLike[str] | None = None) -> bool:
+        """Atomically write the cache to ``path`` (default: the load path) if it changed."""
+        target = Path(path) if path else self._path
+        if target is None:
+            raise ValueError("PDA cache has no path to save to")
+        with self._lock:
+            if not self._dirty and target == self._path:
+                return False
+            entries = [
+                {
+                    "program_id": program_id,
+                    "seeds": [seed.hex() for seed in seeds],
+                    "address": address,
+                    "bump": bump,
+                }
+                for (program_id, seeds), (address, bump) in self._entries.items()
+            ]
+            self._dirty = False
+        temporary = target.with_name(f"{target.name}.tmp")
+        temporary.write_text(json.dumps(entries, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, target)
+        return True
+
+
+@lru_cache(maxsize=8)
+def default_pda_cache(path: str = "") -> PdaCache:
+    return PdaCache(path or None)
+
+
+def safe_policy_seeds(authority: str) -> PdaSeeds:
+    return (b"safe_policy", bytes(Pubkey.from_string(authority)))
+
+
+def payout_seeds(safe: str, payout_index: int) -> PdaSeeds:
+    return (b"payout", bytes(Pubkey.from_string(safe)), payout_index.to_bytes(8, "little"))
+
+
+def challenge_seeds(payout: str) -> PdaSeeds:
+    return (b"challenge", bytes(Pubkey.from_string(payout)))
+
+
+def native_vault_seeds(safe: str) -> PdaSeeds:
+    return (b"native_vault", bytes(Pubkey.from_string(safe)))
+
+
+def challenge_bond_vault_seeds() -> PdaSeeds:
+    return (b"challenge_bond_vault",)
+
+
+def realm_seeds(realm_name: str) -> PdaSeeds:
+    return (b"governance", realm_name.encode("utf-8"))
+
+
+def account_governance_seeds(realm: str, governed_account: str) -> PdaSeeds:
+    return (
+        b"account-governance",
+        bytes(Pubkey.from_string(realm)),
+        bytes(Pubkey.from_string(governed_account)),
+    )
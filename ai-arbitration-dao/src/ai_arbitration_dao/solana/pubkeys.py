@@ -1,14 +1,74 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
 from solders.pubkey import Pubkey
 
+# Commands see the same creators, voters and governance addresses over and over; the
+# warm daemon keeps this many distinct base58 strings (valid or not) parsed.
+PUBKEY_CACHE_SIZE = 65_536
 
-def normalize_pubkey(raw_value: str, *, field_name: str) -> str:
+
+@dataclass(slots=True, frozen=True)
+class NormalizedPubkey:
+    address: str
+    raw: bytes
+
+
+@dataclass(slots=True, frozen=True)
+class NormalizedPubkeys:
+    """Result of ``normalize_pubkeys``: one entry per input, ``None`` where it was invalid."""
+
+    values: list[NormalizedPubkey | None]
+    errors: dict[int, str]
+
+    @property
+    def addresses(self) -> list[str]:
+        return [value.address for value in self.values if value is not None]
+
+
+@lru_cache(maxsize=PUBKEY_CACHE_SIZE)
+def _parse_pubkey(candidate: str) -> NormalizedPubkey | None:
+    try:
+        pubkey = Pubkey.from_string(candidate)
+    except ValueError:
+        return None
+    return NormalizedPubkey(address=str(pubkey), raw=bytes(pubkey))
+
+
+def _resolve(raw_value: str, field_name: str) -> NormalizedPubkey:
     candidate = raw_value.strip()
     if not candidate:
         raise ValueError(f"{field_name} is required")
 
-    try:
-        return str(Pubkey.from_string(candidate))
-    except ValueError as exc:
-        raise ValueError(f"{field_name} must be a valid Solana public key") from exc
+    normalized = _parse_pubkey(candidate)
+    if normalized is None:
+        raise ValueError(f"{field_name} must be a valid Solana public key")
+    return normalized
+
+
+def resolve_pubkey(raw_value: str, *, field_name: str) -> NormalizedPubkey:
+    """Like ``normalize_pubkey`` but also returns the raw 32-byte key."""
+    return _resolve(raw_value, field_name)
+
+
+def normalize_pubkey(raw_value: str, *, field_name: str) -> str:
+    return _resolve(raw_value, field_name).address
+
+
+def normalize_pubkeys(raw_values: Sequence[str], *, field_name: str) -> NormalizedPubkeys:
+    """Validate many base58 keys at once, collecting every error instead of stopping.
+
+    Error messages name the failing position as ``field_name[index]``.
+    """
+    values: list[NormalizedPubkey | None] = []
+    errors: dict[int, str] = {}
+    for index, raw_value in enumerate(raw_values):
+        try:
+            values.append(_resolve(raw_value, f"{field_name}[{index}]"))
+        except ValueError as exc:
+            values.append(None)
+            errors[index] = str(exc)
+    return NormalizedPubkeys(values=values, errors=errors)
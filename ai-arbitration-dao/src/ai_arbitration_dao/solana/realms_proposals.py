@@ -0,0 +1,189 @@
+"""Bulk reads of Realms ``ProposalV2`` accounts used as governance proofs.
+
+Parsing mirrors ``parse_governance_proposal_proof`` in
+``programs/safe-treasury/src/utils.rs``: the account must be owned by a Realms governance
+program, hold at least 66 bytes, start with account type 14, carry the governance address
+at bytes ``1..33`` and the proposal state at byte 65. A proposal counts as passed in the
+executable (4) and executed (5) states, exactly as the on-chain ``record_ruling`` check.
+
+Passed states are cached per proposal. Executed is terminal and stays cached; executable
+can still change, so it is re-read after ``recheck_seconds``. Any other state is never
+cached because the next read may already see it pass.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.observability.metrics import CacheMetrics, cache_metrics
+from ai_arbitration_dao.solana.account_loader import AccountLoader
+from ai_arbitration_dao.solana.accounts import PUBKEY_SIZE, AccountData, AccountDecodeError
+
+PROPOSAL_V2_ACCOUNT_TYPE = 14
+PROPOSAL_DATA_MIN_LEN = 66
+PROPOSAL_GOVERNANCE_START = 1
+PROPOSAL_GOVERNANCE_END = PROPOSAL_GOVERNANCE_START + PUBKEY_SIZE
+PROPOSAL_STATE_INDEX = 65
+
+PROPOSAL_STATE_EXECUTABLE = 4
+PROPOSAL_STATE_EXECUTED = 5
+
+REALMS_GOVERNANCE_PROGRAM_ID = "GovER5Lthms3bLBqWub97yVrMmEogzX7xNjdXpPPCVZw"
+REALMS_GOVERNANCE_TEST_PROGRAM_ID = "GTesTBiEWE32WHXXE2S4XbZvA5CrEc4xs6ZgRe895dP"
+GOVERNANCE_PROGRAM_IDS = frozenset(
+    {REALMS_GOVERNANCE_PROGRAM_ID, REALMS_GOVERNANCE_TEST_PROGRAM_ID}
+)
+
+PROPOSAL_STATE_CACHE_METRICS = "proposal_state"
+DEFAULT_PROPOSAL_STATE_CACHE_SIZE = 4096
+DEFAULT_EXECUTABLE_RECHECK_SECONDS = 30.0
+
+
+class InvalidProposalProofError(AccountDecodeError):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class GovernanceProposalProof:
+    governance: str
+    state: int
+
+    @property
+    def passed(self) -> bool:
+        return is_passed_proposal_state(self.state)
+
+
+def is_governance_program(program_id: str) -> bool:
+    return program_id in GOVERNANCE_PROGRAM_IDS
+
+
+def is_passed_proposal_state(state: int) -> bool:
+    return state in (PROPOSAL_STATE_EXECUTABLE, PROPOSAL_STATE_EXECUTED)
+
+
+def parse_governance_proposal_proof(owner: str, data: AccountData) -> GovernanceProposalProof:
+    if not is_governance_program(owner):
+        raise InvalidProposalProofError(f"proposal owner {owner} is not a governance program")
+    if len(data) < PROPOSAL_DATA_MIN_LEN:
+        raise InvalidProposalProofError(
+            f"proposal data is {len(data)} bytes, expected at least {PROPOSAL_DATA_MIN_LEN}"
+        )
+    if data[0] != PROPOSAL_V2_ACCOUNT_TYPE:
+        raise InvalidProposalProofError(
+            f"account type {data[0]} is not ProposalV2 ({PROPOSAL_V2_ACCOUNT_TYPE})"
+        )
+    governance = Pubkey(bytes(data[PROPOSAL_GOVERNANCE_START:PROPOSAL_GOVERNANCE_END]))
+    return GovernanceProposalProof(governance=str(governance), state=data[PROPOSAL_STATE_INDEX])
+
+
+class ProposalStateCache:
+    """Bounded LRU of passed proposal states, safe to share between threads."""
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = DEFAULT_PROPOSAL_STATE_CACHE_SIZE,
+        recheck_seconds: float = DEFAULT_EXECUTABLE_RECHECK_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: CacheMetrics | None = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._recheck_seconds = recheck_seconds
+        self._clock = clock
+        self._metrics = (
+            metrics if metrics is not None else cache_metrics(PROPOSAL_STATE_CACHE_METRICS)
+        )
+        self._entries: OrderedDict[str, tuple[GovernanceProposalProof, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def metrics(self) -> CacheMetrics:
+        return self._metrics
+
+    def get(self, proposal_id: str) -> GovernanceProposalProof | None:
+        with self._lock:
+            entry = self._entries.get(proposal_id)
+            if entry is not None:
+                proof, stored_at = entry
+                if (
+                    proof.state == PROPOSAL_STATE_EXECUTED
+                    or self._clock() - stored_at < self._recheck_seconds
+                ):
+                    self._entries.move_to_end(proposal_id)
+                    self._metrics.record_hit()
+                    return proof
+                del self._entries[proposal_id]
+            self._metrics.record_miss()
+            return None
+
+    def put(self, proposal_id: str, proof: GovernanceProposalProof) -> None:
+        """Remember ``proof`` if it is passed; otherwise forget any earlier state."""
+        with self._lock:
+            if not proof.passed:
+                self._entries.pop(proposal_id, None)
+                return
+            self._entries[proposal_id] = (proof, self._clock())
+            self._entries.move_to_end(proposal_id)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._metrics.record_eviction()
+
+    def invalidate(self, proposal_id: str) -> None:
+        with self._lock:
+            self._entries.pop(proposal_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache(maxsize=1)
+def default_proposal_state_cache() -> ProposalStateCache:
+    return ProposalStateCache()
+
+
+async def fetch_governance_proposals(
+    loader: AccountLoader,
+    proposal_ids: Sequence[str],
+    *,
+    cache: ProposalStateCache | None = None,
+) -> dict[str, GovernanceProposalProof]:
+    """Read and parse many ``ProposalV2`` accounts with one ``load_accounts`` call.
+
+    Proposals served from ``cache`` are not read again. Ids whose account is missing or
+    is not a valid ``ProposalV2`` account are left out of the result.
+    """
+    proofs: dict[str, GovernanceProposalProof] = {}
+    missing: list[str] = []
+    for proposal_id in dict.fromkeys(proposal_ids):
+        cached = cache.get(proposal_id) if cache is not None else None
+        if cached is None:
+            missing.append(proposal_id)
+        else:
+            proofs[proposal_id] = cached
+    if not missing:
+        return proofs
+
+    for proposal_id, account in zip(missing, await loader.load_accounts(missing), strict=True):
+        if account is None:
+            continue
+        try:
+            proof = parse_governance_proposal_proof(account.owner, account.data)
+        except InvalidProposalProofError:
+            continue
+        if cache is not None:
+            cache.put(proposal_id, proof)
+        proofs[proposal_id] = proof
+    return proofs
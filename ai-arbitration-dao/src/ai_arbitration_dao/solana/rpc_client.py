@@ -1,15 +1,211 @@
 from __future__ import annotations
 
+import asyncio
+from types import TracebackType
+from typing import Self, TypeVar
+
 from solana.rpc.async_api import AsyncClient
+from solana.rpc.async_http_provider import AsyncHTTPProvider
+from solana.rpc.jsonrpc import JsonRpcRequestSerializer
+from solders.rpc.requests import Body
+from solders.rpc.responses import RPCResult
 
 from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.solana.account_cache import account_cache_for
+from ai_arbitration_dao.solana.coalescing_reader import CoalescingAccountReader
+from ai_arbitration_dao.solana.rpc_router import LatencyWindow, RoutedEndpoint, RpcRouter
+
+_Response = TypeVar("_Response", bound=RPCResult)
+
+
+class _LimitedHTTPProvider(AsyncHTTPProvider):
+    """``AsyncHTTPProvider`` whose requests wait on a per-endpoint semaphore."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        semaphore: asyncio.Semaphore,
+        timeout: float | None = None,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool = True,
+    ) -> None:
+        super().__init__(
+            endpoint,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
+        self.semaphore = semaphore
+
+    async def make_request_unparsed(self, body: JsonRpcRequestSerializer) -> str:
+        # Every RPC method (typed or raw) funnels through make_request_unparsed.
+        async with self.semaphore:
+            return await super().make_request_unparsed(body)
+
+
+class _RoutedHTTPProvider(AsyncHTTPProvider):
+    """``AsyncHTTPProvider`` that hands every request to an ``RpcRouter``."""
+
+    def __init__(self, router: RpcRouter) -> None:
+        super().__init__(router.endpoints[0].url)
+        self.router = router
+
+    async def make_request_unparsed(self, body: JsonRpcRequestSerializer) -> str:
+        return await self.router.request(body)
+
+
+class ProviderAsyncClient(AsyncClient):
+    """``AsyncClient`` over a provider built by this package.
+
+    ``send`` and ``send_unparsed`` are the raw JSON-RPC entry points for callers that
+    build their own requests (batches, for instance).
+    """
+
+    def __init__(self, provider: AsyncHTTPProvider) -> None:
+        super().__init__(str(provider.endpoint_uri))
+        # AsyncClient takes no provider argument; replace the default one before first use.
+        self._provider = provider
+
+    async def send(self, body: Body, parser: type[_Response]) -> _Response:
+        return await self._provider.make_request(body, parser)
+
+    async def send_unparsed(self, body: JsonRpcRequestSerializer) -> str:
+        return await self._provider.make_request_unparsed(body)
+
+
+class SharedAsyncClient(ProviderAsyncClient):
+    """Client whose requests wait on a per-endpoint semaphore.
+
+    Instances are owned by an ``RpcClientFactory`` and closed when it closes.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        semaphore: asyncio.Semaphore,
+        timeout: float | None = None,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool = True,
+    ) -> None:
+        super().__init__(
+            _LimitedHTTPProvider(
+                endpoint,
+                semaphore=semaphore,
+                timeout=timeout,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+                http2=http2,
+            )
+        )
+        self.semaphore = semaphore
+
+
+class RoutedAsyncClient(ProviderAsyncClient):
+    """Client whose requests are spread over several endpoints by an ``RpcRouter``."""
+
+    def __init__(self, router: RpcRouter) -> None:
+        super().__init__(_RoutedHTTPProvider(router))
+        self.router = router
+
+    async def close(self) -> None:
+        await self.router.close()
+        await super().close()
 
 
 class RpcClientFactory:
-    """Thin factory for AsyncClient to keep adapter construction deterministic."""
+    """Hands out one shared keep-alive HTTP/2 client per RPC URL.
+
+    With several ``SOLANA_RPC_ENDPOINTS``, ``create()`` without a URL returns a client that
+    routes each request through an ``RpcRouter`` over the per-endpoint clients. Clients bind
+    to the running event loop, so use one factory per loop and close it with
+    ``async with factory:`` (or ``await factory.close()``) instead of closing clients.
+    """
 
     def __init__(self, settings: AppSettings) -> None:
         self._settings = settings
+        self._endpoints = settings.rpc_endpoints()
+        self._clients: dict[str, SharedAsyncClient] = {}
+        self._routed: RoutedAsyncClient | None = None
+        self._readers: dict[str | None, CoalescingAccountReader] = {}
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def create(self, url: str | None = None) -> ProviderAsyncClient:
+        if url is None and len(self._endpoints) > 1:
+            return self._routed_client()
+        endpoint = url or self._endpoints[0].url
+        client = self._clients.get(endpoint)
+        if client is None:
+            settings = self._settings
+            client = SharedAsyncClient(
+                endpoint,
+                semaphore=asyncio.Semaphore(settings.rpc_max_concurrency),
+                timeout=settings.rpc_timeout_seconds,
+                max_connections=settings.rpc_max_connections,
+                max_keepalive_connections=settings.rpc_max_keepalive_connections,
+                keepalive_expiry=settings.rpc_keepalive_expiry_seconds,
+                http2=True,
+            )
+            self._clients[endpoint] = client
+        return client
+
+    def _routed_client(self) -> RoutedAsyncClient:
+        if self._routed is None:
+            settings = self._settings
+            router = RpcRouter(
+                [
+                    RoutedEndpoint(
+                        url=endpoint.url,
+                        roles=endpoint.roles,
+                        send=self.create(endpoint.url).send_unparsed,
+                        latency=LatencyWindow(settings.rpc_latency_window),
+                    )
+                    for endpoint in self._endpoints
+                ],
+                hedge_reads=settings.rpc_hedge_reads,
+                max_slot_lag=settings.rpc_max_slot_lag,
+                slot_check_interval_seconds=settings.rpc_slot_check_interval_seconds,
+                failure_penalty_seconds=settings.rpc_timeout_seconds,
+            )
+            self._routed = RoutedAsyncClient(router)
+        return self._routed
+
+    def reader(self, url: str | None = None) -> CoalescingAccountReader:
+        """Shared coalescing account reader over ``create(url)``, backed by the account cache."""
+        reader = self._readers.get(url)
+        if reader is None:
+            reader = CoalescingAccountReader(
+                self.create(url),
+                window_seconds=self._settings.rpc_coalesce_window_seconds,
+                batch_requests=self._settings.rpc_batch_requests,
+                cache=account_cache_for(self._settings),
+            )
+            self._readers[url] = reader
+        return reader
 
-    def create(self) -> AsyncClient:
-        return AsyncClient(self._settings.solana_rpc_url)
+    async def close(self) -> None:
+        clients: list[AsyncClient] = list(self._clients.values())
+        if self._routed is not None:
+            clients.append(self._routed)
+        self._clients.clear()
+        self._routed = None
+        self._readers.clear()
+        await asyncio.gather(*(client.close() for client in clients))
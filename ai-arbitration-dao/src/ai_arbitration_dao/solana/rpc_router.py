@@ -0,0 +1,215 @@
+"""Latency-aware routing of JSON-RPC requests across several endpoints.
+
+Reads go to the endpoint with the lowest rolling p50 latency. When that endpoint has not
+answered within its own p95, the same request is sent to the next endpoint and the first
+successful response wins; a transport failure moves on to the next endpoint at once.
+Sends (``sendTransaction`` and friends) are never duplicated. A periodic ``getSlot``
+sweep ejects endpoints that lag the highest observed slot by more than ``max_slot_lag``
+or do not answer; ejected endpoints are only tried after every healthy one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from solana.rpc.jsonrpc import JsonRpcRequestSerializer
+from solders.rpc.requests import GetSlot
+from solders.rpc.responses import GetSlotResp
+
+from ai_arbitration_dao.config import RpcEndpointRole
+
+SendRaw = Callable[[JsonRpcRequestSerializer], Awaitable[str]]
+
+# Methods that change chain state; they go to send endpoints and are never hedged.
+SEND_METHODS = frozenset({"sendTransaction", "requestAirdrop"})
+DEFAULT_LATENCY_WINDOW = 128
+DEFAULT_MAX_SLOT_LAG = 50
+DEFAULT_SLOT_CHECK_INTERVAL_SECONDS = 5.0
+# Percentiles are only trusted once an endpoint has this many samples.
+_MIN_SAMPLES = 8
+
+
+class LatencyWindow:
+    """Rolling window of request latencies in seconds."""
+
+    def __init__(self, size: int = DEFAULT_LATENCY_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=max(size, 1))
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float | None:
+        if len(self._samples) < _MIN_SAMPLES:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    @property
+    def p50(self) -> float | None:
+        return self.percentile(0.5)
+
+    @property
+    def p95(self) -> float | None:
+        return self.percentile(0.95)
+
+
+@dataclass(slots=True)
+class RoutedEndpoint:
+    url: str
+    roles: frozenset[RpcEndpointRole]
+    send: SendRaw
+    latency: LatencyWindow
+    slot: int | None = None
+    ejected: bool = False
+    failures: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "roles": sorted(role.value for role in self.roles),
+            "p50_ms": _milliseconds(self.latency.p50),
+            "p95_ms": _milliseconds(self.latency.p95),
+            "slot": self.slot,
+            "ejected": self.ejected,
+            "failures": self.failures,
+        }
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def _is_send(body: JsonRpcRequestSerializer) -> bool:
+    payload = body.to_json()
+    # Substring check first: reads are the common case and may carry large batches.
+    if not any(method in payload for method in SEND_METHODS):
+        return False
+    parsed = json.loads(payload)
+    requests = parsed if isinstance(parsed, list) else [parsed]
+    return any(
+        isinstance(request, dict) and request.get("method") in SEND_METHODS for request in requests
+    )
+
+
+@dataclass(slots=True)
+class RpcRouter:
+    """Routes raw JSON-RPC bodies to endpoints; one router per event loop.
+
+    ``failure_penalty_seconds`` is recorded as the latency of a failed request so that a
+    failing endpoint drifts to the back of the ranking.
+    """
+
+    endpoints: Sequence[RoutedEndpoint]
+    hedge_reads: bool = True
+    max_slot_lag: int = DEFAULT_MAX_SLOT_LAG
+    slot_check_interval_seconds: float = DEFAULT_SLOT_CHECK_INTERVAL_SECONDS
+    failure_penalty_seconds: float = 10.0
+    clock: Callable[[], float] = time.monotonic
+    _last_slot_check: float | None = field(default=None, init=False)
+    _slot_check: asyncio.Task[None] | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        for role in RpcEndpointRole:
+            if not any(role in endpoint.roles for endpoint in self.endpoints):
+                raise ValueError(f"no RPC endpoint has the {role.value} role")
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [endpoint.snapshot() for endpoint in self.endpoints]
+
+    def ranked(self, role: RpcEndpointRole) -> list[RoutedEndpoint]:
+        """Endpoints with ``role``: healthy ones by p50 (unmeasured first), then ejected."""
+        candidates = [endpoint for endpoint in self.endpoints if role in endpoint.roles]
+        return sorted(
+            candidates, key=lambda endpoint: (endpoint.ejected, endpoint.latency.p50 or 0.0)
+        )
+
+    async def request(self, body: JsonRpcRequestSerializer) -> str:
+        self._schedule_slot_check()
+        if _is_send(body):
+            return await self._attempt(self.ranked(RpcEndpointRole.SEND)[0], body)
+        return await self._hedged_read(body)
+
+    async def _attempt(self, endpoint: RoutedEndpoint, body: JsonRpcRequestSerializer) -> str:
+        started = self.clock()
+        try:
+            raw = await endpoint.send(body)
+        except asyncio.CancelledError:
+            # Lost a hedge race: the elapsed time is a lower bound on this request's latency.
+            endpoint.latency.record(self.clock() - started)
+            raise
+        except Exception:
+            endpoint.failures += 1
+            endpoint.latency.record(self.failure_penalty_seconds)
+            raise
+        endpoint.latency.record(self.clock() - started)
+        return raw
+
+    async def _hedged_read(self, body: JsonRpcRequestSerializer) -> str:
+        loop = asyncio.get_running_loop()
+        primary, *backups = self.ranked(RpcEndpointRole.READ)
+        pending = {loop.create_task(self._attempt(primary, body))}
+        hedge_after = primary.latency.p95 if self.hedge_reads else None
+        error: BaseException | None = None
+        try:
+            while pending:
+                timeout = hedge_after if backups else None
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                if backups and (not done or not pending):
+                    # Hedge once on a slow primary; after that, only fail over.
+                    hedge_after = None
+                    pending.add(loop.create_task(self._attempt(backups.pop(0), body)))
+        finally:
+            for task in pending:
+                task.cancel()
+        assert error is not None
+        raise error
+
+    def _schedule_slot_check(self) -> None:
+        if len(self.endpoints) < 2 or (self._slot_check and not self._slot_check.done()):
+            return
+        now = self.clock()
+        if (
+            self._last_slot_check is not None
+            and now - self._last_slot_check < self.slot_check_interval_seconds
+        ):
+            return
+        self._last_slot_check = now
+        self._slot_check = asyncio.get_running_loop().create_task(self.check_slots())
+
+    async def check_slots(self) -> None:
+        """Poll ``getSlot`` on every endpoint and eject the ones that lag or fail."""
+
+        async def slot_of(endpoint: RoutedEndpoint) -> int | None:
+            try:
+                parsed = GetSlotResp.from_json(await endpoint.send(GetSlot()))
+            except Exception:
+                return None
+            return parsed.value if isinstance(parsed, GetSlotResp) else None
+
+        slots = await asyncio.gather(*(slot_of(endpoint) for endpoint in self.endpoints))
+        highest = max((slot for slot in slots if slot is not None), default=None)
+        for endpoint, slot in zip(self.endpoints, slots, strict=True):
+            endpoint.slot = slot
+            endpoint.ejected = highest is not None and (
+                slot is None or highest - slot > self.max_slot_lag
+            )
+
+    async def close(self) -> None:
+        if self._slot_check is not None:
+            self._slot_check.cancel()
+            await asyncio.gather(self._slot_check, return_exceptions=True)
@@ -0,0 +1 @@
+"""Durable storage backends for runtime state."""
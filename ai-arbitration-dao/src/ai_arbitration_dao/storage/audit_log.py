@@ -0,0 +1,427 @@
+"""Append-only, segmented binary audit log with memory-mapped hash indexes.
+
+Each segment is a pair of files:
+
+``<sequence>.log``
+    A 16-byte header (magic, creation time) followed by records framed as
+    ``body_length u32 | crc32 u32 | body``. The body holds ``recorded_at f64``,
+    ``round u64``, ``outcome u8`` and four length-prefixed UTF-8 strings
+    (proposal_id, tx_signature, payload_hash, dispute_id).
+
+``<sequence>.idx``
+    A fixed-size open-addressing hash table, memory-mapped, mapping 64-bit key hashes of
+    ``proposal_id`` and ``(dispute_id, round)`` to record offsets. Lookups probe one slot
+    chain per segment and confirm matches against the record itself.
+
+Segments roll after ``max_records_per_segment`` records. ``compact`` drops whole sealed
+segments whose newest record is older than a cutoff. On open, records appended after
+the index was last updated are re-indexed and a torn trailing record is truncated.
+
+Several processes may share one directory. Writers hold an exclusive ``flock`` on the
+directory's ``LOCK`` file and readers a shared one; under the lock each process re-reads
+the segment list and the active segment's end from the shared index header before it
+appends or reads, so no writer appends at a stale offset.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from ai_arbitration_dao.domain.audit_artifact import AuditArtifact
+from ai_arbitration_dao.domain.dispute_snapshot import RulingOutcome
+
+DEFAULT_MAX_RECORDS_PER_SEGMENT = 65_536
+LOCK_FILE_NAME = "LOCK"
+
+_LOG_MAGIC = b"AADLOG01"
+_INDEX_MAGIC = b"AADIDX01"
+_LOG_HEADER = struct.Struct("<8sd")  # magic, created_at
+_INDEX_HEADER = struct.Struct("<8sQQQd")  # magic, slot_count, record_count, indexed_end, last_at
+_INDEX_HEADER_SIZE = 64
+_SLOT = struct.Struct("<QQ")  # key hash, record offset + 1 (0 marks an empty slot)
+_RECORD_PREFIX = struct.Struct("<II")  # body length, crc32(body)
+_RECORD_FIXED = struct.Struct("<dQB")  # recorded_at, round, outcome
+_TEXT_LENGTH = struct.Struct("<I")
+
+_OUTCOMES = tuple(RulingOutcome)
+_OUTCOME_CODES = {outcome: code for code, outcome in enumerate(_OUTCOMES)}
+
+
+class AuditLogCorruptionError(ValueError):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class AuditLogRecord:
+    artifact: AuditArtifact
+    recorded_at: float
+
+
+def _proposal_key(proposal_id: str) -> int:
+    return _key_hash(b"proposal\x00" + proposal_id.encode("utf-8"))
+
+
+def _dispute_key(dispute_id: str, round: int) -> int:
+    return _key_hash(b"dispute\x00" + dispute_id.encode("utf-8") + b"\x00" + str(round).encode())
+
+
+def _key_hash(raw_key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(raw_key, digest_size=8).digest(), "little")
+
+
+def _encode_record(artifact: AuditArtifact, recorded_at: float) -> bytes:
+    parts = [_RECORD_FIXED.pack(recorded_at, artifact.round, _OUTCOME_CODES[artifact.outcome])]
+    for text in (
+        artifact.proposal_id,
+        artifact.tx_signature,
+        artifact.payload_hash,
+        artifact.dispute_id,
+    ):
+        encoded = text.encode("utf-8")
+        parts.append(_TEXT_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    body = b"".join(parts)
+    return _RECORD_PREFIX.pack(len(body), zlib.crc32(body)) + body
+
+
+def _decode_body(body: bytes) -> AuditLogRecord:
+    recorded_at, round_value, outcome_code = _RECORD_FIXED.unpack_from(body, 0)
+    offset = _RECORD_FIXED.size
+    texts: list[str] = []
+    for _ in range(4):
+        (length,) = _TEXT_LENGTH.unpack_from(body, offset)
+        offset += _TEXT_LENGTH.size
+        texts.append(body[offset : offset + length].decode("utf-8"))
+        offset += length
+    proposal_id, tx_signature, payload_hash, dispute_id = texts
+    return AuditLogRecord(
+        artifact=AuditArtifact(
+            proposal_id=proposal_id,
+            tx_signature=tx_signature,
+            payload_hash=payload_hash,
+            dispute_id=dispute_id,
+            round=round_value,
+            outcome=_OUTCOMES[outcome_code],
+        ),
+        recorded_at=recorded_at,
+    )
+
+
+class _Segment:
+    def __init__(self, directory: Path, sequence: int, *, slot_count: int) -> None:
+        self.sequence = sequence
+        self.log_path = directory / f"{sequence:020d}.log"
+        self.index_path = directory / f"{sequence:020d}.idx"
+
+        self._log_fd = os.open(self.log_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.end = os.fstat(self._log_fd).st_size
+        if self.end == 0:
+            os.write(self._log_fd, _LOG_HEADER.pack(_LOG_MAGIC, time.time()))
+            self.end = _LOG_HEADER.size
+        elif os.pread(self._log_fd, 8, 0) != _LOG_MAGIC:
+            os.close(self._log_fd)
+            raise AuditLogCorruptionError(f"{self.log_path} is not an audit log segment")
+
+        index_fd = os.open(self.index_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(index_fd).st_size == 0:
+                os.ftruncate(index_fd, _INDEX_HEADER_SIZE + slot_count * _SLOT.size)
+                os.pwrite(
+                    index_fd,
+                    _INDEX_HEADER.pack(_INDEX_MAGIC, slot_count, 0, _LOG_HEADER.size, 0.0),
+                    0,
+                )
+            self._index = mmap.mmap(index_fd, 0)
+        finally:
+            os.close(index_fd)
+
+        magic, self.slot_count, self.record_count, indexed_end, self.last_recorded_at = (
+            _INDEX_HEADER.unpack_from(self._index, 0)
+        )
+        if magic != _INDEX_MAGIC:
+            raise AuditLogCorruptionError(f"{self.index_path} is not an audit log index")
+        self._recover(indexed_end)
+
+    def _recover(self, indexed_end: int) -> None:
+        """Index records written after the last index update; drop a torn tail."""
+        offset = indexed_end
+        while offset < self.end:
+            parsed = self._read_at(offset)
+            if parsed is None:
+                os.ftruncate(self._log_fd, offset)
+                self.end = offset
+                break
+            record, size = parsed
+            self._index_record(record, offset)
+            offset += size
+        self._write_header(self.end)
+
+    def reload(self, *, recover: bool) -> None:
+        """Catch up with records other processes appended since this segment was read.
+
+        The index is a shared mapping, so their slots are already visible; only the header
+        counters and the end offset need re-reading. With ``recover`` (writers only) records
+        past the indexed end are indexed and a torn tail is dropped, as on open.
+        """
+        _, _, self.record_count, indexed_end, self.last_recorded_at = _INDEX_HEADER.unpack_from(
+            self._index, 0
+        )
+        self.end = indexed_end
+        if recover:
+            self.end = os.fstat(self._log_fd).st_size
+            if self.end != indexed_end:
+                self._recover(indexed_end)
+
+    def _read_at(self, offset: int) -> tuple[AuditLogRecord, int] | None:
+        prefix = os.pread(self._log_fd, _RECORD_PREFIX.size, offset)
+        if len(prefix) < _RECORD_PREFIX.size:
+            return None
+        length, checksum = _RECORD_PREFIX.unpack(prefix)
+        body = os.pread(self._log_fd, length, offset + _RECORD_PREFIX.size)
+        if len(body) < length or zlib.crc32(body) != checksum:
+            return None
+        return _decode_body(body), _RECORD_PREFIX.size + length
+
+    def _write_header(self, indexed_end: int) -> None:
+        _INDEX_HEADER.pack_into(
+            self._index,
+            0,
+            _INDEX_MAGIC,
+            self.slot_count,
+            self.record_count,
+            indexed_end,
+            self.last_recorded_at,
+        )
+
+    def _insert(self, key_hash: int, offset: int) -> None:
+        mask = self.slot_count - 1
+        slot = key_hash & mask
+        while True:
+            position = _INDEX_HEADER_SIZE + slot * _SLOT.size
+            if _SLOT.unpack_from(self._index, position)[1] == 0:
+                _SLOT.pack_into(self._index, position, key_hash, offset + 1)
+                return
+            slot = (slot + 1) & mask
+
+    def _index_record(self, record: AuditLogRecord, offset: int) -> None:
+        artifact = record.artifact
+        self._insert(_proposal_key(artifact.proposal_id), offset)
+        self._insert(_dispute_key(artifact.dispute_id, artifact.round), offset)
+        self.record_count += 1
+        self.last_recorded_at = max(self.last_recorded_at, record.recorded_at)
+
+    def append(self, encoded: bytes, record: AuditLogRecord, *, fsync: bool) -> None:
+        offset = self.end
+        os.pwrite(self._log_fd, encoded, offset)
+        if fsync:
+            os.fsync(self._log_fd)
+        self.end += len(encoded)
+        self._index_record(record, offset)
+        self._write_header(self.end)
+
+    def lookup(self, key_hash: int) -> Iterator[AuditLogRecord]:
+        mask = self.slot_count - 1
+        slot = key_hash & mask
+        while True:
+            stored_hash, stored_offset = _SLOT.unpack_from(
+                self._index, _INDEX_HEADER_SIZE + slot * _SLOT.size
+            )
+            if stored_offset == 0:
+                return
+            if stored_hash == key_hash:
+                parsed = self._read_at(stored_offset - 1)
+                if parsed is None:
+                    raise AuditLogCorruptionError(f"{self.log_path} has a corrupt record")
+                yield parsed[0]
+            slot = (slot + 1) & mask
+
+    def records(self) -> Iterator[AuditLogRecord]:
+        offset = _LOG_HEADER.size
+        while offset < self.end:
+            parsed = self._read_at(offset)
+            if parsed is None:
+                raise AuditLogCorruptionError(f"{self.log_path} has a corrupt record")
+            yield parsed[0]
+            offset += parsed[1]
+
+    def flush(self) -> None:
+        self._index.flush()
+        os.fsync(self._log_fd)
+
+    def close(self) -> None:
+        self._index.flush()
+        self._index.close()
+        os.close(self._log_fd)
+
+    def remove(self) -> None:
+        self.close()
+        self.log_path.unlink()
+        self.index_path.unlink()
+
+
+class AuditLog:
+    """Durable audit artifact history with O(1) lookups per segment.
+
+    ``find_by_proposal`` and ``find_by_dispute`` return matching records oldest first.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_records_per_segment: int = DEFAULT_MAX_RECORDS_PER_SEGMENT,
+        fsync: bool = False,
+    ) -> None:
+        if max_records_per_segment < 1:
+            raise ValueError("max_records_per_segment must be positive")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_records = max_records_per_segment
+        # Two keys per record at a load factor of at most one half.
+        self._slot_count = 1 << (max_records_per_segment * 4 - 1).bit_length()
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._lock_fd = os.open(self._directory / LOCK_FILE_NAME, os.O_RDWR | os.O_CREAT, 0o644)
+
+        self._segments: list[_Segment] = []
+        with self._locked(fcntl.LOCK_EX):
+            if not self._segments:
+                self._segments.append(_Segment(self._directory, 0, slot_count=self._slot_count))
+
+    def __enter__(self) -> AuditLog:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segments)
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        """Hold the thread lock and the directory ``flock``, then catch up with other writers."""
+        with self._lock:
+            fcntl.flock(self._lock_fd, operation)
+            try:
+                self._refresh(recover=operation == fcntl.LOCK_EX)
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _refresh(self, *, recover: bool) -> None:
+        sequences = sorted(int(path.stem) for path in self._directory.glob("*.log"))
+        known = {segment.sequence: segment for segment in self._segments}
+        for sequence in known.keys() - set(sequences):
+            known[sequence].close()
+        previous_active = self._segments[-1] if self._segments else None
+        self._segments = [
+            known[sequence]
+            if sequence in known
+            else _Segment(self._directory, sequence, slot_count=self._slot_count)
+            for sequence in sequences
+        ]
+        if not self._segments:
+            return
+        # Another process may have filled and sealed the segment this one last appended to.
+        if previous_active is not None and previous_active is not self._segments[-1]:
+            if previous_active.sequence in sequences:
+                previous_active.reload(recover=False)
+        self._segments[-1].reload(recover=recover)
+
+    def _active_segment(self) -> _Segment:
+        active = self._segments[-1]
+        if active.record_count >= self._max_records or active.slot_count != self._slot_count:
+            active.flush()
+            active = _Segment(self._directory, active.sequence + 1, slot_count=self._slot_count)
+            self._segments.append(active)
+        return active
+
+    def append(self, artifact: AuditArtifact, *, recorded_at: float | None = None) -> None:
+        self.append_many([artifact], recorded_at=recorded_at)
+
+    def append_many(
+        self,
+        artifacts: Iterable[AuditArtifact],
+        *,
+        recorded_at: float | None = None,
+    ) -> None:
+        timestamp = time.time() if recorded_at is None else recorded_at
+        with self._locked(fcntl.LOCK_EX):
+            for artifact in artifacts:
+                record = AuditLogRecord(artifact=artifact, recorded_at=timestamp)
+                encoded = _encode_record(artifact, timestamp)
+                self._active_segment().append(encoded, record, fsync=self._fsync)
+
+    def find_by_proposal(self, proposal_id: str) -> list[AuditLogRecord]:
+        key_hash = _proposal_key(proposal_id)
+        with self._locked(fcntl.LOCK_SH):
+            return [
+                record
+                for segment in self._segments
+                for record in segment.lookup(key_hash)
+                if record.artifact.proposal_id == proposal_id
+            ]
+
+    def find_by_dispute(self, dispute_id: str, round: int) -> list[AuditLogRecord]:
+        key_hash = _dispute_key(dispute_id, round)
+        with self._locked(fcntl.LOCK_SH):
+            return [
+                record
+                for segment in self._segments
+                for record in segment.lookup(key_hash)
+                if record.artifact.dispute_id == dispute_id and record.artifact.round == round
+            ]
+
+    def records(self) -> Iterator[AuditLogRecord]:
+        """Iterate every record oldest first (a full scan; prefer the indexed finders).
+
+        The shared lock is held until the iterator is exhausted or closed, so the scan is a
+        consistent snapshot: writers and compaction in any process wait for it. Do not
+        append to this log while iterating it.
+        """
+        with self._locked(fcntl.LOCK_SH):
+            for segment in self._segments:
+                yield from segment.records()
+
+    def compact(self, max_age_seconds: float, *, now: float | None = None) -> int:
+        """Drop sealed segments whose newest record is older than ``max_age_seconds``."""
+        cutoff = (time.time() if now is None else now) - max_age_seconds
+        with self._locked(fcntl.LOCK_EX):
+            sealed, active = self._segments[:-1], self._segments[-1]
+            expired = [segment for segment in sealed if segment.last_recorded_at < cutoff]
+            for segment in expired:
+                segment.remove()
+            self._segments = [segment for segment in sealed if segment not in expired]
+            self._segments.append(active)
+        return len(expired)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._segments[-1].flush()
+
+    def close(self) -> None:
+        with self._lock:
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+            if self._lock_fd >= 0:
+                os.close(self._lock_fd)
+                self._lock_fd = -1
+
+
+@lru_cache(maxsize=8)
+def open_audit_log(directory: str) -> AuditLog:
+    return AuditLog(directory)
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+
+from ai_arbitration_dao.orchestration.proposal_authorization import ProposalProof
+
+DEFAULT_CACHE_SIZE = 4096
+
+# Stays below SQLite's historical 999 bound-parameter limit for IN (...) lookups.
+_LOOKUP_CHUNK_SIZE = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS proposals (
+        proposal_id TEXT PRIMARY KEY,
+        proof_type TEXT NOT NULL,
+        executed INTEGER NOT NULL,
+        dispute_id TEXT,
+        round INTEGER
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS proposals_dispute_round ON proposals (dispute_id, round)",
+    "CREATE INDEX IF NOT EXISTS proposals_executed ON proposals (executed)",
+)
+
+# A stored proposal keeps its dispute and round: a later proof may only promote it to
+# executed, and only if it claims no binding or the stored one.
+_UPSERT = """
+    INSERT INTO proposals (proposal_id, proof_type, executed, dispute_id, round)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (proposal_id) DO UPDATE SET
+        executed = MAX(proposals.executed, excluded.executed)
+    WHERE (excluded.dispute_id IS NULL AND excluded.round IS NULL)
+        OR (proposals.dispute_id IS excluded.dispute_id AND proposals.round IS excluded.round)
+"""
+
+_COLUMNS = "proposal_id, proof_type, executed, dispute_id, round"
+
+ProposalRow = tuple[str, str, int, str | None, int | None]
+
+
+class ProposalBindingConflictError(ValueError):
+    def __init__(self, proposal_ids: Sequence[str]) -> None:
+        self.proposal_ids = list(proposal_ids)
+        super().__init__(
+            "proposals already recorded for another dispute or round: "
+            + ", ".join(self.proposal_ids)
+        )
+
+
+def _to_row(proof: ProposalProof) -> ProposalRow:
+    return (proof.proposal_id, proof.proof_type, int(proof.executed), proof.dispute_id, proof.round)
+
+
+def _rebinds(stored: ProposalProof, proof: ProposalProof) -> bool:
+    if proof.dispute_id is None and proof.round is None:
+        return False
+    return (stored.dispute_id, stored.round) != (proof.dispute_id, proof.round)
+
+
+def _from_row(row: ProposalRow) -> ProposalProof:
+    proposal_id, proof_type, executed, dispute_id, round_value = row
+    return ProposalProof(
+        proposal_id=proposal_id,
+        proof_type=proof_type,
+        executed=bool(executed),
+        dispute_id=dispute_id,
+        round=round_value,
+    )
+
+
+class SqliteProposalStore:
+    """Durable ProposalStore backed by SQLite in WAL mode.
+
+    Offers the ProposalStore interface plus bulk and indexed lookups. Reads are served
+    from a bounded per-instance LRU cache that every write through this store updates.
+    Adding a proposal that is already stored never changes its dispute or round, so
+    processes sharing the database cannot rebind each other's proposals.
+    """
+
+    def __init__(self, path: str | Path, *, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[str, ProposalProof] = OrderedDict()
+        self._cache_size = cache_size
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+            self._cache.clear()
+
+    def _remember(self, proof: ProposalProof) -> None:
+        self._cache[proof.proposal_id] = proof
+        self._cache.move_to_end(proof.proposal_id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def add_proposal(self, proof: ProposalProof) -> None:
+        self.add_proposals((proof,))
+
+    def add_proposals(self, proofs: Iterable[ProposalProof]) -> None:
+        """Insert ``proofs``; a proof for a stored proposal can only mark it executed.
+
+        Raises ``ProposalBindingConflictError`` and writes nothing if any proof claims a
+        different dispute or round than the stored proposal.
+        """
+        batch = list(proofs)
+        with self._lock:
+            for proof in batch:
+                self._cache.pop(proof.proposal_id, None)
+            with self._connection:
+                self._connection.executemany(_UPSERT, [_to_row(proof) for proof in batch])
+                # Same transaction: the rows as stored, including any written concurrently.
+                stored = self._select(proof.proposal_id for proof in batch)
+                conflicts = [
+                    proof.proposal_id
+                    for proof in batch
+                    if _rebinds(stored[proof.proposal_id], proof)
+                ]
+                if conflicts:
+                    raise ProposalBindingConflictError(conflicts)
+            for proof in batch:
+                self._remember(stored[proof.proposal_id])
+
+    def get_proposal(self, proposal_id: str) -> ProposalProof | None:
+        return self.get_proposals((proposal_id,)).get(proposal_id)
+
+    def get_proposals(self, proposal_ids: Iterable[str]) -> dict[str, ProposalProof]:
+        found: dict[str, ProposalProof] = {}
+        with self._lock:
+            missing: list[str] = []
+            for proposal_id in dict.fromkeys(proposal_ids):
+                cached = self._cache.get(proposal_id)
+                if cached is None:
+                    missing.append(proposal_id)
+                else:
+                    self._cache.move_to_end(proposal_id)
+                    found[proposal_id] = cached
+
+            for proof in self._select(missing).values():
+                self._remember(proof)
+                found[proof.proposal_id] = proof
+        return found
+
+    def _select(self, proposal_ids: Iterable[str]) -> dict[str, ProposalProof]:
+        selected: dict[str, ProposalProof] = {}
+        remaining = iter(dict.fromkeys(proposal_ids))
+        while chunk := list(islice(remaining, _LOOKUP_CHUNK_SIZE)):
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM proposals WHERE proposal_id IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                proof = _from_row(row)
+                selected[proof.proposal_id] = proof
+        return selected
+
+    def mark_executed(self, proposal_id: str) -> bool:
+        with self._lock:
+            with self._connection:
+                cursor = self._connection.execute(
+                    "UPDATE proposals SET executed = 1 WHERE proposal_id = ?",
+                    (proposal_id,),
+                )
+            # Drop rather than patch the cached copy; the next read reloads the stored row.
+            self._cache.pop(proposal_id, None)
+        return cursor.rowcount > 0
+
+    def proposals_for_dispute(self, dispute_id: str, round: int) -> list[ProposalProof]:
+        return self._query(
+            f"SELECT {_COLUMNS} FROM proposals WHERE dispute_id = ? AND round = ? "
+            "ORDER BY proposal_id",
+            (dispute_id, round),
+        )
+
+    def proposals_by_execution(self, *, executed: bool, limit: int = 1000) -> list[ProposalProof]:
+        return self._query(
+            f"SELECT {_COLUMNS} FROM proposals WHERE executed = ? ORDER BY proposal_id LIMIT ?",
+            (int(executed), limit),
+        )
+
+    def _query(self, sql: str, parameters: Sequence[object]) -> list[ProposalProof]:
+        with self._lock:
+            rows = self._connection.execute(sql, parameters).fetchall()
+        return [_from_row(row) for row in rows]
+
+
+@lru_cache(maxsize=8)
+def open_proposal_store(path: str) -> SqliteProposalStore:
+    """Process-wide store per path, so workers and the CLI daemon reuse one connection."""
+    return SqliteProposalStore(path)
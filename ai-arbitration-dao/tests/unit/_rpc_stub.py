@@ -0,0 +1,74 @@
+"""Local JSON-RPC stand-in shared by the RPC client, router and reader tests."""
+
+from __future__ import annotations
+
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+class RpcStandIn(ThreadingHTTPServer, ABC):
+    """Serve JSON-RPC over HTTP on a free local port.
+
+    Every decoded POST body is recorded in ``posts`` (and the client address in
+    ``connections``) before ``respond`` answers it; a ``None`` answer is sent as a 503.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _RpcHandler)
+        self.lock = threading.Lock()
+        self.posts: list[Any] = []
+        self.connections: set[tuple[str, int]] = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    @abstractmethod
+    def respond(self, request: Any) -> Any: ...
+
+
+class _RpcHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: RpcStandIn
+
+    def do_POST(self) -> None:  # noqa: N802
+        server = self.server
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.posts.append(request)
+            server.connections.add(self.client_address)
+        response = server.respond(request)
+        if response is None:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: object) -> None:
+        pass
+
+
+@contextmanager
+def serving[S: RpcStandIn](*servers: S) -> Iterator[tuple[S, ...]]:
+    """Run ``servers`` on background threads and shut them down on exit."""
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield servers
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
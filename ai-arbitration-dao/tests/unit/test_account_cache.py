@@ -0,0 +1,186 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from solders.pubkey import Pubkey
+from solders.rpc.responses import parse_websocket_message
+
+from ai_arbitration_dao.observability.metrics import CacheMetrics
+from ai_arbitration_dao.solana.account_cache import (
+    AccountCache,
+    AccountCacheInvalidator,
+    CachedAccount,
+    run_account_cache_invalidation,
+)
+from ai_arbitration_dao.solana.account_loader import RawAccount
+
+OWNER = str(Pubkey(bytes([9]) * 32))
+SAFE = str(Pubkey(bytes([1]) * 32))
+PAYOUT = str(Pubkey(bytes([2]) * 32))
+
+
+def _cache(**kwargs: object) -> AccountCache:
+    return AccountCache(metrics=CacheMetrics("test"), **kwargs)  # type: ignore[arg-type]
+
+
+def _raw(data: bytes = b"policy") -> RawAccount:
+    return RawAccount(owner=OWNER, data=data)
+
+
+def test_cache_serves_reads_no_older_than_min_slot() -> None:
+    cache = _cache()
+    cache.put(SAFE, "confirmed", _raw(), 100)
+    cache.put(PAYOUT, "confirmed", None, 100)
+
+    assert cache.get(SAFE, "confirmed") == CachedAccount(_raw(), 100)
+    assert cache.get(SAFE, "confirmed", min_slot=100) == CachedAccount(_raw(), 100)
+    assert cache.get(PAYOUT, "confirmed") == CachedAccount(None, 100)
+    assert cache.get(SAFE, "confirmed", min_slot=101) is None
+    assert cache.get(SAFE, "finalized") is None
+    assert cache.metrics.snapshot() == {"hits": 3, "misses": 2, "evictions": 0}
+
+    assert not cache.put(SAFE, "confirmed", _raw(b"older"), 99)
+    assert cache.get(SAFE, "confirmed") == CachedAccount(_raw(), 100)
+
+
+def test_cache_evicts_least_recently_used_entries_by_bytes() -> None:
+    keys = [str(Pubkey(bytes([index]) * 32)) for index in range(1, 5)]
+    cache = _cache(max_bytes=3 * (256 + 100))
+    for key in keys[:3]:
+        cache.put(key, "confirmed", _raw(bytes(100)), 1)
+    cache.get(keys[0], "confirmed")
+
+    cache.put(keys[3], "confirmed", _raw(bytes(100)), 1)
+
+    assert len(cache) == 3
+    assert cache.nbytes == 3 * (256 + 100)
+    assert cache.get(keys[1], "confirmed") is None
+    assert cache.get(keys[0], "confirmed") is not None
+    assert cache.metrics.snapshot()["evictions"] == 1
+    assert not cache.put(SAFE, "confirmed", _raw(bytes(2000)), 1)
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    now = [0.0]
+    cache = _cache(ttl_seconds=5.0, clock=lambda: now[0])
+    cache.put(SAFE, "confirmed", _raw(), 1)
+
+    now[0] = 4.0
+    assert cache.get(SAFE, "confirmed") is not None
+    now[0] = 5.0
+    assert cache.get(SAFE, "confirmed") is None
+    assert len(cache) == 0
+
+
+def test_invalidation_refuses_values_read_before_the_change() -> None:
+    cache = _cache()
+    cache.put(SAFE, "confirmed", _raw(), 100)
+    cache.put(SAFE, "finalized", _raw(), 98)
+
+    cache.invalidate(SAFE, slot=105)
+
+    assert cache.get(SAFE, "confirmed") is None
+    assert cache.get(SAFE, "finalized") is None
+    assert not cache.put(SAFE, "confirmed", _raw(b"stale"), 104)
+    assert cache.put(SAFE, "confirmed", _raw(b"fresh"), 105)
+    assert cache.get(SAFE, "confirmed") == CachedAccount(_raw(b"fresh"), 105)
+
+
+def _notification(method: str, subscription: int, slot: int, value: object) -> str:
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": {
+                "subscription": subscription,
+                "result": {"context": {"slot": slot}, "value": value},
+            },
+        }
+    )
+
+
+def test_invalidator_applies_program_and_account_notifications() -> None:
+    account = {
+        "lamports": 1,
+        "data": ["cG9saWN5", "base64"],
+        "owner": OWNER,
+        "executable": False,
+        "rentEpoch": 0,
+        "space": 6,
+    }
+    cache = _cache()
+    cache.put(SAFE, "confirmed", _raw(), 10)
+    cache.put(PAYOUT, "confirmed", _raw(), 10)
+    invalidator = AccountCacheInvalidator(cache)
+    invalidator.track(7, PAYOUT)
+
+    for raw in (
+        _notification("programNotification", 3, 11, {"pubkey": SAFE, "account": account}),
+        _notification("accountNotification", 7, 12, account),
+        _notification("accountNotification", 8, 13, account),
+    ):
+        (message,) = parse_websocket_message(raw)
+        invalidator.handle(message)
+
+    assert cache.get(SAFE, "confirmed") is None
+    assert cache.get(PAYOUT, "confirmed") is None
+    assert cache.put(SAFE, "confirmed", _raw(), 11)
+    assert not cache.put(PAYOUT, "confirmed", _raw(), 11)
+
+
+def test_cache_rejects_budget_smaller_than_one_entry() -> None:
+    with pytest.raises(ValueError, match="max_bytes"):
+        AccountCache(max_bytes=10)
+
+
+class _DroppingWsClient:
+    """Subscribes, checks what the cache does while live, then loses the connection."""
+
+    def __init__(self, cache: AccountCache) -> None:
+        self.cache = cache
+        self.live_put: bool | None = None
+
+    def __call__(self, _url: str) -> "_DroppingWsClient":
+        return self
+
+    async def __aenter__(self) -> "_DroppingWsClient":
+        assert self.cache.bypassed
+        assert not self.cache.put(SAFE, "confirmed", _raw(), 1)
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+    async def program_subscribe(self, **_: object) -> None:
+        return None
+
+    async def account_subscribe(self, **_: object) -> SimpleNamespace:
+        return SimpleNamespace(subscription_id=1)
+
+    def __aiter__(self) -> "_DroppingWsClient":
+        return self
+
+    async def __anext__(self) -> object:
+        self.live_put = self.cache.put(SAFE, "confirmed", _raw(), 2)
+        raise ConnectionError("feed dropped")
+
+
+def test_cache_is_bypassed_while_the_invalidation_feed_is_down(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import solana.rpc.websocket_api
+
+    cache = _cache()
+    client = _DroppingWsClient(cache)
+    monkeypatch.setattr(solana.rpc.websocket_api, "SolanaWsClient", client)
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(run_account_cache_invalidation("ws://rpc", cache, OWNER, accounts=[PAYOUT]))
+
+    assert client.live_put is True
+    assert cache.bypassed
+    assert cache.get(SAFE, "confirmed") is None
+    assert not cache.put(SAFE, "confirmed", _raw(), 3)
+    cache.resume()
+    assert cache.put(SAFE, "confirmed", _raw(), 3)
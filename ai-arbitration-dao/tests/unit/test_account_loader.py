@@ -0,0 +1,82 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.solana.account_loader import RawAccount, RpcAccountLoader
+
+OWNER = Pubkey(bytes([7]) * 32)
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def get_multiple_accounts(self, pubkeys: list[Pubkey], **_: Any) -> SimpleNamespace:
+        self.calls.append(len(pubkeys))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SimpleNamespace(
+            value=[
+                None if bytes(pubkey)[0] % 2 else SimpleNamespace(owner=OWNER, data=bytes(pubkey))
+                for pubkey in pubkeys
+            ]
+        )
+
+
+class FakeProgramClient:
+    def __init__(self) -> None:
+        self.filters: list[Any] = []
+
+    async def get_program_accounts(self, program_id: Pubkey, **kwargs: Any) -> SimpleNamespace:
+        self.filters = kwargs["filters"]
+        account = SimpleNamespace(owner=program_id, data=b"challenge")
+        return SimpleNamespace(value=[SimpleNamespace(pubkey=OWNER, account=account)])
+
+
+def test_loader_chunks_requests_and_preserves_order() -> None:
+    client = FakeClient()
+    addresses = [str(Pubkey(bytes([index % 256]) + bytes(31))) for index in range(250)]
+
+    accounts = asyncio.run(RpcAccountLoader(client).load_accounts(addresses))  # type: ignore[arg-type]
+
+    assert client.calls == [100, 100, 50]
+    assert client.max_active == 3
+    assert accounts[0] == RawAccount(owner=str(OWNER), data=bytes(Pubkey.from_string(addresses[0])))
+    assert accounts[1] is None
+    assert len(accounts) == 250
+
+
+def test_loader_bounds_concurrency() -> None:
+    client = FakeClient()
+    addresses = [str(Pubkey(bytes([index % 256]) + bytes(31))) for index in range(40)]
+
+    asyncio.run(
+        RpcAccountLoader(client, chunk_size=5, max_concurrency=2).load_accounts(addresses)  # type: ignore[arg-type]
+    )
+
+    assert len(client.calls) == 8
+    assert client.max_active == 2
+
+
+def test_loader_rejects_oversized_chunks() -> None:
+    with pytest.raises(ValueError, match="chunk_size must be between 1 and 100"):
+        RpcAccountLoader(FakeClient(), chunk_size=101)  # type: ignore[arg-type]
+
+
+def test_program_scan_filters_on_discriminator() -> None:
+    client = FakeProgramClient()
+    program_id = str(Pubkey(bytes([8]) * 32))
+
+    accounts = asyncio.run(
+        RpcAccountLoader(client).load_program_accounts(program_id, bytes(7) + b"\x01")  # type: ignore[arg-type]
+    )
+
+    assert accounts == [(str(OWNER), RawAccount(owner=program_id, data=b"challenge"))]
+    assert [(item.offset, item.bytes) for item in client.filters] == [(0, "11111112")]
@@ -0,0 +1,257 @@
+import struct
+
+import pytest
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.solana.accounts import (
+    CHALLENGE_BOND_VAULT_DISCRIMINATOR,
+    CHALLENGE_DISCRIMINATOR,
+    PAYOUT_DISCRIMINATOR,
+    SAFE_POLICY_DISCRIMINATOR,
+    SAFE_POLICY_SIZE,
+    TREASURY_INFO_DISCRIMINATOR,
+    TREASURY_REGISTRY_DISCRIMINATOR,
+    AccountDecodeError,
+    AccountView,
+    ChallengeBondVaultView,
+    ChallengeView,
+    Field,
+    PayoutView,
+    SafePolicyView,
+    TreasuryInfoView,
+    TreasuryRegistryView,
+    decode_challenge,
+    u8,
+    view_account,
+)
+
+
+def _key(byte: int) -> bytes:
+    return bytes([byte]) * 32
+
+
+def _policy_fields(seed: int = 0) -> bytes:
+    fields = (
+        _key(1 + seed)
+        + _key(2 + seed)
+        + struct.pack("<QQ", 3_600, 10_000)
+        + _key(3 + seed)
+        + struct.pack("<QBQB", 5, 3, 7_200, 2)
+        + bytes([9]) * 32
+        + bytes([1, 0, 1])
+        + struct.pack("<QB", 42 + seed, 254)
+    )
+    assert len(fields) == SAFE_POLICY_SIZE
+    return fields
+
+
+def _payout_data(
+    *,
+    payout_id: int = 7,
+    mint: bytes | None = None,
+    metadata_hash: bytes | None = None,
+    challenge: bytes | None = None,
+    final_outcome: int | None = None,
+) -> bytes:
+    def option(value: bytes | None) -> bytes:
+        return b"\x00" if value is None else b"\x01" + value
+
+    return (
+        PAYOUT_DISCRIMINATOR
+        + struct.pack("<QQ", payout_id, payout_id + 1)
+        + _key(4)
+        + b"\x01"
+        + option(mint)
+        + _key(5)
+        + struct.pack("<Q", 50)
+        + option(metadata_hash)
+        + struct.pack("<Bq", 1, -99)
+        + _policy_fields(payout_id)
+        + option(challenge)
+        + bytes([2, 1])
+        + option(None if final_outcome is None else bytes([final_outcome]))
+        + b"\xfd"
+    )
+
+
+def _challenge_data(*, current_outcome: int | None = None, round: int = 1) -> bytes:
+    outcome = b"\x00" if current_outcome is None else bytes([1, current_outcome])
+    return (
+        CHALLENGE_DISCRIMINATOR
+        + _key(6)
+        + _key(7)
+        + struct.pack("<QBqq", 1_000, round, 10, -20)
+        + outcome
+        + bytes([round, 255])
+    )
+
+
+def test_safe_policy_view_reads_fields_without_copying() -> None:
+    data = bytearray(SAFE_POLICY_DISCRIMINATOR + _policy_fields())
+
+    view = SafePolicyView(data)
+
+    assert view.data.obj is data
+    assert view.authority == str(Pubkey(_key(1)))
+    assert view.resolver == str(Pubkey(_key(2)))
+    assert (view.dispute_window, view.challenge_bond, view.min_token_balance) == (3_600, 10_000, 5)
+    assert (view.max_appeal_rounds, view.appeal_window_duration) == (3, 7_200)
+    assert view.appeal_bond_multiplier == 2
+    assert bytes(view.ipfs_policy_hash) == bytes([9]) * 32
+    assert view.exit_custody_allowed is True
+    assert view.payout_cancellation_allowed is False
+    assert view.treasury_mode_enabled is True
+    assert (view.payout_count, view.bump) == (42, 254)
+
+    # The view tracks the buffer: later writes are visible on the next access.
+    data[-1] = 1
+    assert view.bump == 1
+
+
+def test_payout_view_resolves_option_offsets_and_policy_snapshot() -> None:
+    bare = PayoutView(_payout_data())
+    full = PayoutView(
+        _payout_data(
+            mint=_key(8),
+            metadata_hash=bytes([10]) * 32,
+            challenge=_key(11),
+            final_outcome=1,
+        )
+    )
+
+    for view in (bare, full):
+        assert (view.payout_id, view.payout_index, view.amount) == (7, 8, 50)
+        assert view.safe == str(Pubkey(_key(4)))
+        assert view.recipient == str(Pubkey(_key(5)))
+        assert (view.status, view.dispute_deadline) == (1, -99)
+        assert view.policy_snapshot.resolver == str(Pubkey(_key(9)))
+        assert view.policy_snapshot.payout_count == 49
+        assert (view.dispute_round, view.finalized, view.bump) == (2, True, 0xFD)
+
+    assert (bare.mint, bare.metadata_hash, bare.challenge, bare.final_outcome) == (
+        None,
+        None,
+        None,
+        None,
+    )
+    assert full.mint == str(Pubkey(_key(8)))
+    assert full.metadata_hash is not None and bytes(full.metadata_hash) == bytes([10]) * 32
+    assert full.challenge == str(Pubkey(_key(11)))
+    assert full.final_outcome == 1
+
+
+def test_small_account_views_decode_fixed_layouts() -> None:
+    vault = ChallengeBondVaultView(CHALLENGE_BOND_VAULT_DISCRIMINATOR + struct.pack("<QB", 9, 3))
+    info = TreasuryInfoView(TREASURY_INFO_DISCRIMINATOR + _key(12) + struct.pack("<BqB", 1, 77, 4))
+    registry = TreasuryRegistryView(TREASURY_REGISTRY_DISCRIMINATOR + struct.pack("<QB", 2, 5))
+
+    assert (vault.total_bonds_held, vault.bump) == (9, 3)
+    assert (info.safe, info.mode, info.registered_at, info.bump) == (
+        str(Pubkey(_key(12))),
+        1,
+        77,
+        4,
+    )
+    assert (registry.treasury_count, registry.bump) == (2, 5)
+
+
+def test_view_account_dispatches_on_discriminator() -> None:
+    assert isinstance(view_account(_challenge_data()), ChallengeView)
+    assert isinstance(view_account(memoryview(_payout_data())), PayoutView)
+    with pytest.raises(AccountDecodeError, match="unknown discriminator"):
+        view_account(bytes(16))
+
+
+def test_views_reject_truncated_data_and_invalid_option_tags() -> None:
+    with pytest.raises(AccountDecodeError, match="truncated"):
+        ChallengeView(_challenge_data(current_outcome=1)[:-1])
+    with pytest.raises(AccountDecodeError, match="truncated"):
+        PayoutView(_payout_data(challenge=_key(1))[:-40])
+    with pytest.raises(AccountDecodeError, match="not a Payout account"):
+        PayoutView(_challenge_data())
+
+    data = bytearray(_challenge_data())
+    data[8 + 32 + 32 + 8 + 1 + 8 + 8] = 2
+    with pytest.raises(AccountDecodeError, match="invalid Option tag"):
+        ChallengeView(data)
+
+
+def test_field_subclasses_must_implement_read() -> None:
+    class Unreadable(Field[int]):
+        size = 1
+
+    with pytest.raises(TypeError):
+        Unreadable()
+
+    class Counter(AccountView):
+        __slots__ = ()
+        ACCOUNT_NAME = "Counter"
+        DISCRIMINATOR = bytes(8)
+
+        count = u8()
+
+    assert Counter(bytes(8) + b"\x07").count == 7
+
+
+def test_decode_challenge_materializes_view_fields() -> None:
+    challenge = decode_challenge(memoryview(_challenge_data(current_outcome=0, round=3)))
+
+    assert challenge.payout == str(Pubkey(_key(6)))
+    assert (challenge.round, challenge.created_at, challenge.appeal_deadline) == (3, 10, -20)
+    assert challenge.current_outcome == 0
+    assert (challenge.ruling_recorded_for_round, challenge.bump) == (3, 255)
+
+
+def test_vectorized_decoder_matches_lazy_views() -> None:
+    pytest.importorskip("numpy")
+    from ai_arbitration_dao.solana.account_arrays import (
+        decode_accounts_array,
+        decode_program_accounts_array,
+    )
+    from ai_arbitration_dao.solana.account_loader import RawAccount
+
+    blobs = [
+        _payout_data(
+            payout_id=index,
+            mint=_key(20 + index) if index % 2 else None,
+            metadata_hash=bytes([index]) * 32 if index % 3 else None,
+            challenge=_key(40 + index) if index % 4 else None,
+            final_outcome=index % 2 if index % 5 else None,
+        )
+        for index in range(12)
+    ]
+
+    addresses, records = decode_program_accounts_array(
+        PayoutView,
+        [(f"address-{index}", RawAccount("owner", blob)) for index, blob in enumerate(blobs)],
+    )
+
+    assert addresses[3] == "address-3"
+    for record, blob in zip(records, blobs, strict=True):
+        view = PayoutView(blob)
+        assert int(record["payout_id"]) == view.payout_id
+        assert bool(record["mint_present"]) == (view.mint is not None)
+        if view.mint is not None:
+            assert str(Pubkey(bytes(record["mint"]))) == view.mint
+        assert bool(record["challenge_present"]) == (view.challenge is not None)
+        if view.challenge is not None:
+            assert str(Pubkey(bytes(record["challenge"]))) == view.challenge
+        assert int(record["dispute_deadline"]) == view.dispute_deadline
+        assert int(record["policy_snapshot"]["payout_count"]) == view.policy_snapshot.payout_count
+        assert bool(record["finalized"]) is view.finalized
+        expected_outcome = view.final_outcome
+        assert bool(record["final_outcome_present"]) == (expected_outcome is not None)
+        assert int(record["final_outcome"]) == (expected_outcome or 0)
+        assert int(record["bump"]) == view.bump
+
+    challenges = decode_accounts_array(
+        ChallengeView, [_challenge_data(current_outcome=1), _challenge_data(round=4)]
+    )
+    assert challenges["current_outcome_present"].tolist() == [True, False]
+    assert challenges["ruling_recorded_for_round"].tolist() == [1, 4]
+    assert challenges["appeal_deadline"].tolist() == [-20, -20]
+
+    with pytest.raises(AccountDecodeError, match="row 1: Challenge account data is truncated"):
+        decode_accounts_array(ChallengeView, [_challenge_data(), _challenge_data()[:-1]])
+    with pytest.raises(AccountDecodeError, match="row 0: account data is not a Challenge"):
+        decode_accounts_array(ChallengeView, [_payout_data()])
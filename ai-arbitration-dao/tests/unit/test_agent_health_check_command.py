@@ -1,8 +1,20 @@
+import asyncio
+import json
+import time
 from argparse import Namespace
 
+from ai_arbitration_dao.cli import command_defaults
 from ai_arbitration_dao.commands.agent_health_check import run_agent_health_check
-from ai_arbitration_dao.config import AppSettings
-from ai_arbitration_dao.types import CommandStatus
+from ai_arbitration_dao.config import AppSettings, RpcEndpointSettings
+from ai_arbitration_dao.observability.metrics import cache_metrics
+from ai_arbitration_dao.orchestration.batch import parse_batch_line
+from ai_arbitration_dao.runtime.health_probes import (
+    ProbeCache,
+    ProbeResult,
+    probe_cache_key,
+    run_probes,
+)
+from ai_arbitration_dao.types import CommandStatus, SeatProvider
 
 
 def _settings() -> AppSettings:
@@ -16,6 +28,7 @@ def _args(**overrides: object) -> Namespace:
         "rpc_ok": True,
         "governance_ok": True,
         "model_ok": True,
+        "probe": False,
     }
     base.update(overrides)
     return Namespace(**base)
@@ -55,3 +68,123 @@ def test_agent_health_check_rejects_missing_seat_id() -> None:
 
     assert result.status == CommandStatus.FAILED
     assert result.details["error"] == "seat_id is required"
+
+
+def _cached_probes(settings: AppSettings, *, model_ok: bool = True) -> ProbeCache:
+    cache = ProbeCache()
+    cache.put(
+        probe_cache_key(settings, SeatProvider.CLAUDE),
+        {
+            "rpc": ProbeResult(ok=True, latency_ms=1.5),
+            "governance": ProbeResult(ok=True, latency_ms=2.5),
+            "model": ProbeResult(ok=model_ok, latency_ms=3.5, error=None if model_ok else "down"),
+        },
+    )
+    return cache
+
+
+def test_agent_health_check_reports_probe_latency_from_cache() -> None:
+    settings = _settings()
+
+    result = run_agent_health_check(
+        _args(probe=True), settings, probe_cache=_cached_probes(settings, model_ok=False)
+    )
+
+    assert result.status == CommandStatus.FAILED
+    assert result.details["model_status"] == "failed"
+    assert result.details["probe_cache_hit"] is True
+    assert result.details["probes"]["rpc"] == {"status": "ok", "latency_ms": 1.5, "error": None}
+    assert result.details["probes"]["model"]["error"] == "down"
+
+
+def test_probe_cache_expires_after_ttl() -> None:
+    now = [100.0]
+    cache = ProbeCache(clock=lambda: now[0])
+    calls: list[int] = []
+
+    def refresh() -> dict[str, ProbeResult]:
+        calls.append(1)
+        return {"rpc": ProbeResult(ok=True, latency_ms=1.0)}
+
+    assert cache.get_or_refresh(("key",), 5.0, refresh)[1] is False
+    now[0] += 4.9
+    assert cache.get_or_refresh(("key",), 5.0, refresh)[1] is True
+    now[0] += 0.1
+    assert cache.get_or_refresh(("key",), 5.0, refresh)[1] is False
+    assert len(calls) == 2
+
+
+def test_run_probes_is_concurrent_with_per_probe_timeouts() -> None:
+    async def slow() -> bool:
+        await asyncio.sleep(1.0)
+        return True
+
+    async def quick() -> bool:
+        await asyncio.sleep(0.05)
+        return True
+
+    async def broken() -> bool:
+        raise ConnectionRefusedError("refused")
+
+    started = time.perf_counter()
+    results = asyncio.run(
+        run_probes({"slow": slow, "a": quick, "b": quick, "c": broken}, timeout_seconds=0.2)
+    )
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert results["a"].ok and results["b"].ok
+    assert results["slow"].error == "timed out after 0.2s"
+    assert results["c"].error == "ConnectionRefusedError: refused"
+    assert results["a"].latency_ms >= 50
+
+
+def test_probe_is_opt_in_for_batch_lines_and_direct_calls() -> None:
+    settings = _settings()
+    direct_args = _args()
+    del direct_args.probe
+    _, batch_args = parse_batch_line(
+        json.dumps(
+            {"command": "agent-health-check", "seat_id": "seat-claude", "model_provider": "claude"}
+        ),
+        defaults=command_defaults,
+    )
+
+    direct = run_agent_health_check(direct_args, settings, probe_cache=ProbeCache())
+    batched = run_agent_health_check(batch_args, settings, probe_cache=ProbeCache())
+
+    assert batch_args.probe is False
+    assert direct.status == CommandStatus.EXECUTED
+    assert "probes" not in direct.details
+    assert "probes" not in batched.details
+
+
+def test_probe_cache_key_covers_every_probe_input() -> None:
+    base = AppSettings(governance_address="Realm1111111111111111111111111111111111111")
+    variants = [
+        base.model_copy(
+            update={
+                "solana_rpc_endpoints": [
+                    RpcEndpointSettings(url="https://rpc-a.example"),
+                    RpcEndpointSettings(url="https://rpc-b.example"),
+                ]
+            }
+        ),
+        base.model_copy(update={"governance_address": ""}),
+        base.model_copy(
+            update={"governance_program_id": "Other11111111111111111111111111111111111111"}
+        ),
+        base.model_copy(update={"health_probe_timeout_seconds": 5.0}),
+    ]
+    key = probe_cache_key(base, SeatProvider.CLAUDE)
+
+    assert probe_cache_key(base, SeatProvider.OPENAI) != key
+    assert all(probe_cache_key(variant, SeatProvider.CLAUDE) != key for variant in variants)
+
+
+def test_agent_health_check_reports_cache_metrics() -> None:
+    cache_metrics("health_check_test").record_hit()
+
+    result = run_agent_health_check(_args(), _settings())
+
+    assert result.details["cache_metrics"]["health_check_test"]["hits"] >= 1
@@ -0,0 +1,80 @@
+import hashlib
+import math
+from dataclasses import replace
+
+import pytest
+
+from ai_arbitration_dao.domain.audit_artifact import AuditArtifact, create_audit_artifact
+from ai_arbitration_dao.domain.audit_batch import (
+    anchor_audit_artifacts,
+    build_audit_merkle_tree,
+    verify_inclusion,
+    verify_inclusion_batch,
+)
+from ai_arbitration_dao.domain.dispute_snapshot import RulingOutcome
+
+
+def _artifacts(count: int) -> list[AuditArtifact]:
+    return [
+        create_audit_artifact(
+            proposal_id=f"prop-{index}",
+            tx_signature=f"sig_{index}",
+            payload_hash=hashlib.sha256(f"payload-{index}".encode()).hexdigest(),
+            dispute_id=f"dispute-{index}",
+            round=0,
+            outcome=RulingOutcome.ALLOW,
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13, 100])
+def test_every_artifact_proof_verifies_against_the_root(count: int) -> None:
+    batch = anchor_audit_artifacts(_artifacts(count))
+
+    assert all(verify_inclusion(proof, batch.root) for proof in batch.proofs)
+    assert max(len(proof.siblings) for proof in batch.proofs) == math.ceil(math.log2(count))
+
+
+def test_root_commits_to_order_and_content() -> None:
+    hashes = [artifact.payload_hash for artifact in _artifacts(4)]
+
+    root = build_audit_merkle_tree(hashes).root
+
+    assert build_audit_merkle_tree(list(reversed(hashes))).root != root
+    assert build_audit_merkle_tree(hashes[:3]).root != root
+    single = build_audit_merkle_tree(hashes[:1]).root
+    assert single == hashlib.sha256(b"\x00" + bytes.fromhex(hashes[0])).hexdigest()
+
+
+def test_tampered_proofs_are_rejected() -> None:
+    batch = anchor_audit_artifacts(_artifacts(7))
+    proof = batch.proofs[5]
+    other_hash = batch.proofs[4].payload_hash
+
+    assert not verify_inclusion(replace(proof, payload_hash=other_hash), batch.root)
+    assert not verify_inclusion(replace(proof, leaf_index=4), batch.root)
+    assert not verify_inclusion(replace(proof, siblings=proof.siblings[:-1]), batch.root)
+    assert not verify_inclusion(replace(proof, siblings=("zz",) * len(proof.siblings)), batch.root)
+    assert not verify_inclusion(proof, "00" * 32)
+
+
+def test_batch_verification_matches_single_verification() -> None:
+    batch = anchor_audit_artifacts(_artifacts(50))
+    proofs = list(batch.proofs)
+    proofs[10] = replace(proofs[10], payload_hash=proofs[11].payload_hash)
+    proofs[30] = replace(proofs[30], siblings=(proofs[30].siblings[0], *proofs[29].siblings[1:]))
+    proofs.append(batch.proofs[0])
+
+    results = verify_inclusion_batch(proofs, batch.root)
+
+    assert results == [verify_inclusion(proof, batch.root) for proof in proofs]
+    assert results.count(False) == 2
+
+
+def test_anchor_rejects_empty_or_malformed_batches() -> None:
+    with pytest.raises(ValueError, match="at least one payload hash"):
+        anchor_audit_artifacts([])
+
+    with pytest.raises(ValueError, match="hex-encoded SHA-256"):
+        anchor_audit_artifacts([replace(_artifacts(1)[0], payload_hash="abc")])
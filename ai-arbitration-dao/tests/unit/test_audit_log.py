@@ -0,0 +1,196 @@
+import multiprocessing
+import os
+import threading
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from ai_arbitration_dao.commands.execute_ruling_proposal import run_execute_ruling_proposal
+from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.domain import RulingOutcome, create_audit_artifact
+from ai_arbitration_dao.domain.audit_artifact import AuditArtifact
+from ai_arbitration_dao.storage.audit_log import AuditLog, AuditLogCorruptionError
+from ai_arbitration_dao.types import CommandStatus
+
+
+def _artifact(index: int, *, dispute_id: str = "dispute-1", round: int = 0) -> AuditArtifact:
+    return create_audit_artifact(
+        proposal_id=f"prop-{index}",
+        tx_signature=f"sig-{index}",
+        payload_hash=f"{index:064x}",
+        dispute_id=dispute_id,
+        round=round,
+        outcome=RulingOutcome.DENY if index % 2 else RulingOutcome.ALLOW,
+    )
+
+
+def test_audit_log_round_trips_and_indexes_both_keys(tmp_path: Path) -> None:
+    with AuditLog(tmp_path) as log:
+        log.append_many(
+            [
+                _artifact(index, dispute_id=f"dispute-{index % 3}", round=index % 2)
+                for index in range(30)
+            ],
+            recorded_at=100.0,
+        )
+
+        [record] = log.find_by_proposal("prop-7")
+        assert record.artifact == _artifact(7, dispute_id="dispute-1", round=1)
+        assert record.recorded_at == 100.0
+
+        matches = log.find_by_dispute("dispute-1", 1)
+        assert [match.artifact.proposal_id for match in matches] == [
+            "prop-1",
+            "prop-7",
+            "prop-13",
+            "prop-19",
+            "prop-25",
+        ]
+        assert log.find_by_proposal("prop-missing") == []
+        assert log.find_by_dispute("dispute-1", 9) == []
+        assert len(list(log.records())) == 30
+
+
+def test_audit_log_rolls_segments_and_persists_across_reopen(tmp_path: Path) -> None:
+    with AuditLog(tmp_path, max_records_per_segment=4) as log:
+        for index in range(10):
+            log.append(_artifact(index, round=index))
+        assert log.segment_count == 3
+
+    with AuditLog(tmp_path, max_records_per_segment=4) as reopened:
+        assert reopened.segment_count == 3
+        assert [
+            record.artifact.proposal_id for record in reopened.find_by_dispute("dispute-1", 5)
+        ] == ["prop-5"]
+        reopened.append(_artifact(10, round=10))
+        assert reopened.segment_count == 3
+        assert [record.artifact for record in reopened.records()] == [
+            _artifact(index, round=index) for index in range(11)
+        ]
+
+
+def test_audit_log_compacts_sealed_segments_by_age(tmp_path: Path) -> None:
+    with AuditLog(tmp_path, max_records_per_segment=2) as log:
+        log.append_many([_artifact(0), _artifact(1)], recorded_at=1_000.0)
+        log.append_many([_artifact(2), _artifact(3)], recorded_at=2_000.0)
+        log.append(_artifact(4), recorded_at=3_000.0)
+
+        assert log.compact(1_500.0, now=3_100.0) == 1
+        assert log.find_by_proposal("prop-0") == []
+        assert [record.artifact.proposal_id for record in log.find_by_dispute("dispute-1", 0)] == [
+            "prop-2",
+            "prop-3",
+            "prop-4",
+        ]
+        # The active segment is never compacted, however old.
+        assert log.compact(0.0, now=10_000.0) == 1
+        assert log.segment_count == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"{2:020d}.idx",
+        f"{2:020d}.log",
+        "LOCK",
+    ]
+
+
+def test_audit_log_recovers_torn_tail_and_unindexed_records(tmp_path: Path) -> None:
+    with AuditLog(tmp_path) as log:
+        log.append_many([_artifact(index) for index in range(3)])
+    log_path = tmp_path / f"{0:020d}.log"
+    intact_size = log_path.stat().st_size
+
+    # Simulate a crash mid-write: a partial record with no index update.
+    with log_path.open("ab") as handle:
+        handle.write(b"\x40\x00\x00\x00\x00")
+
+    with AuditLog(tmp_path) as reopened:
+        assert log_path.stat().st_size == intact_size
+        reopened.append(_artifact(3))
+        assert len(reopened.find_by_dispute("dispute-1", 0)) == 4
+
+
+def test_audit_log_rejects_foreign_segment_files(tmp_path: Path) -> None:
+    (tmp_path / f"{0:020d}.log").write_bytes(b"not an audit log")
+    with pytest.raises(AuditLogCorruptionError):
+        AuditLog(tmp_path)
+
+
+def test_two_writers_on_one_directory_never_overwrite_each_other(tmp_path: Path) -> None:
+    with (
+        AuditLog(tmp_path, max_records_per_segment=3) as first,
+        AuditLog(tmp_path, max_records_per_segment=3) as second,
+    ):
+        for index in range(8):
+            (first if index % 2 else second).append(_artifact(index))
+
+        for log in (first, second):
+            assert [record.artifact.proposal_id for record in log.records()] == [
+                f"prop-{index}" for index in range(8)
+            ]
+            assert [record.artifact.tx_signature for record in log.find_by_proposal("prop-5")] == [
+                "sig-5"
+            ]
+            assert log.segment_count == 3
+
+
+def test_records_holds_the_shared_lock_for_the_whole_scan(tmp_path: Path) -> None:
+    with AuditLog(tmp_path) as reader, AuditLog(tmp_path) as writer:
+        writer.append_many([_artifact(index) for index in range(3)])
+        scan = reader.records()
+        first = next(scan)
+        appender = threading.Thread(target=writer.append, args=(_artifact(3),))
+        appender.start()
+        appender.join(timeout=0.2)
+
+        assert appender.is_alive()
+        assert [record.artifact.proposal_id for record in (first, *scan)] == [
+            "prop-0",
+            "prop-1",
+            "prop-2",
+        ]
+        appender.join(timeout=5)
+        assert not appender.is_alive()
+        assert len(list(reader.records())) == 4
+
+
+def _append_from_process(directory: str, offset: int) -> None:
+    with AuditLog(directory, max_records_per_segment=16) as log:
+        for index in range(offset, offset + 50):
+            log.append(_artifact(index))
+
+
+def test_concurrent_writer_processes_keep_every_record(tmp_path: Path) -> None:
+    writers = [
+        multiprocessing.Process(target=_append_from_process, args=(str(tmp_path), offset))
+        for offset in (0, 1_000)
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    assert [writer.exitcode for writer in writers] == [0, 0]
+    with AuditLog(tmp_path, max_records_per_segment=16) as log:
+        proposal_ids = sorted(record.artifact.proposal_id for record in log.records())
+        assert proposal_ids == sorted(
+            f"prop-{index}" for offset in (0, 1_000) for index in range(offset, offset + 50)
+        )
+        assert len(log.find_by_proposal("prop-1049")) == 1
+
+
+def test_execute_ruling_proposal_appends_to_configured_audit_log(tmp_path: Path) -> None:
+    audit_dir = tmp_path / "audit"
+    args = Namespace(
+        proposal_id="prop-audit",
+        already_ruled=False,
+        dispute_id="dispute-9",
+        round=2,
+        proposal_proof=None,
+    )
+
+    result = run_execute_ruling_proposal(args, AppSettings(audit_log_path=os.fspath(audit_dir)))
+
+    assert result.status == CommandStatus.EXECUTED
+    with AuditLog(audit_dir) as log:
+        [record] = log.find_by_dispute("dispute-9", 2)
+    assert record.artifact.as_dict() == result.details["audit_artifact"]
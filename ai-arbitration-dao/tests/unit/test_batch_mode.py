@@ -0,0 +1,229 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from ai_arbitration_dao.cli import COMMAND_HANDLERS, command_defaults, entrypoint
+from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.orchestration.batch import BatchLineError, parse_batch_line, run_batch
+from ai_arbitration_dao.types import CommandResult, CommandStatus
+
+VALID_VOTER = "11111111111111111111111111111111"
+
+
+def _settings() -> AppSettings:
+    return AppSettings()
+
+
+def test_parse_batch_line_accepts_flag_and_attribute_spellings() -> None:
+    command, args = parse_batch_line(
+        '{"command": "create-ruling-proposal", "payout-id": 7, "dispute_id": "d-1"}'
+    )
+
+    assert command == "create-ruling-proposal"
+    assert args.payout_id == 7
+    assert args.dispute_id == "d-1"
+
+
+def test_parse_batch_line_rejects_non_object() -> None:
+    with pytest.raises(BatchLineError, match="must be a JSON object"):
+        parse_batch_line('["submit-vote"]')
+
+
+def test_run_batch_yields_one_result_per_line_in_order() -> None:
+    lines = [
+        json.dumps({"command": "submit-vote", "proposal_id": "prop-1", "voter": VALID_VOTER}),
+        "",
+        json.dumps(
+            {
+                "command": "create-ruling-proposal",
+                "safe": "safe111",
+                "payout_id": 1,
+                "dispute_id": "dispute-1",
+                "round": 0,
+                "outcome": "Deny",
+                "is_final": True,
+            }
+        ),
+        json.dumps({"command": "verify-ruling-status", "dispute_id": "", "round": 0}),
+    ]
+
+    results = list(run_batch(lines, COMMAND_HANDLERS, _settings()))
+
+    assert [result.command for result in results] == [
+        "submit-vote",
+        "create-ruling-proposal",
+        "verify-ruling-status",
+    ]
+    assert results[0].status == CommandStatus.PENDING
+    assert results[1].details["payload"]["is_final"] is True
+    assert results[2].status == CommandStatus.FAILED
+
+
+def test_run_batch_reports_malformed_lines_without_stopping() -> None:
+    lines = [
+        "{not json",
+        json.dumps({"command": "no-such-command"}),
+        json.dumps({"command": "submit-vote", "proposal_id": "prop-1", "voter": VALID_VOTER}),
+    ]
+
+    results = list(run_batch(lines, COMMAND_HANDLERS, _settings()))
+
+    assert results[0].status == CommandStatus.FAILED
+    assert results[0].details["line"] == 1
+    assert "invalid JSON" in results[0].details["error"]
+    assert results[1].details == {"line": 2, "error": "unknown command: no-such-command"}
+    assert results[2].status == CommandStatus.PENDING
+
+
+def test_parse_batch_line_applies_cli_defaults_for_omitted_arguments() -> None:
+    command, args = parse_batch_line(
+        json.dumps({"command": "bootstrap-arbitration-dao", "creator": VALID_VOTER}),
+        defaults=command_defaults,
+    )
+
+    assert command == "bootstrap-arbitration-dao"
+    assert args.realm_name == "ai-arbitration-realm"
+    assert args.custom_panel == ""
+    assert args.creator == VALID_VOTER
+    assert "creator" not in command_defaults("bootstrap-arbitration-dao")
+
+
+def test_cli_batch_matches_cli_for_omitted_optional_arguments(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    entrypoint(["--json", "bootstrap-arbitration-dao", "--creator", VALID_VOTER])
+    single = capsys.readouterr().out
+
+    batch_file = tmp_path / "commands.ndjson"
+    batch_file.write_text(
+        json.dumps({"command": "bootstrap-arbitration-dao", "creator": VALID_VOTER}),
+        encoding="utf-8",
+    )
+    exit_code = entrypoint(["batch", "--input", str(batch_file)])
+
+    assert exit_code == 0
+    assert capsys.readouterr().out == single
+
+
+def _raising_handler(args: object, settings: AppSettings) -> CommandResult:
+    raise RuntimeError("boom")
+
+
+def test_run_batch_reports_handler_exceptions_per_line() -> None:
+    handlers = {**COMMAND_HANDLERS, "explode": _raising_handler}
+    lines = [
+        json.dumps({"command": "explode"}),
+        json.dumps({"command": "submit-vote", "proposal_id": "prop-1", "voter": VALID_VOTER}),
+    ]
+
+    results = list(run_batch(lines, handlers, _settings()))
+
+    assert results[0].command == "explode"
+    assert results[0].status == CommandStatus.FAILED
+    assert results[0].details == {"line": 1, "error": "RuntimeError: boom"}
+    assert results[1].status == CommandStatus.PENDING
+
+
+def test_cli_batch_streams_ndjson_from_file(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    batch_file = tmp_path / "commands.ndjson"
+    batch_file.write_text(
+        "\n".join(
+            [
+                json.dumps(
+                    {"command": "submit-vote", "proposal_id": "prop-1", "voter": VALID_VOTER}
+                ),
+                json.dumps({"command": "submit-vote", "proposal_id": "", "voter": VALID_VOTER}),
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    exit_code = entrypoint(["batch", "--input", str(batch_file)])
+
+    output = capsys.readouterr().out.splitlines()
+    assert exit_code == 1
+    assert [json.loads(line)["status"] for line in output] == ["pending", "failed"]
+
+
+def test_cli_batch_reports_unreadable_input_as_failed_result(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    missing = tmp_path / "missing.ndjson"
+
+    exit_code = entrypoint(["batch", "--input", str(missing)])
+
+    (line,) = capsys.readouterr().out.splitlines()
+    result = json.loads(line)
+    assert exit_code == 1
+    assert result["command"] == "batch"
+    assert result["status"] == "failed"
+    assert result["details"]["error"].startswith(f"cannot open input {missing}:")
+
+
+def test_cli_batch_output_matches_single_command_json(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    entrypoint(["--json", "submit-vote", "--proposal-id", "prop-1", "--voter", VALID_VOTER])
+    single = capsys.readouterr().out
+
+    batch_file = tmp_path / "commands.ndjson"
+    batch_file.write_text(
+        json.dumps({"command": "submit-vote", "proposal_id": "prop-1", "voter": VALID_VOTER}),
+        encoding="utf-8",
+    )
+    exit_code = entrypoint(["batch", "--input", str(batch_file)])
+
+    assert exit_code == 0
+    assert capsys.readouterr().out == single
+
+
+def _create_lines(count: int) -> list[str]:
+    return [
+        json.dumps(
+            {
+                "command": "create-ruling-proposal",
+                "safe": "safe111",
+                "payout_id": index,
+                "dispute_id": f"dispute-{index}",
+                "round": index % 3,
+                "outcome": "Deny" if index % 2 else "Allow",
+                "is_final": index % 5 == 0,
+            }
+        )
+        for index in range(count)
+    ]
+
+
+def test_run_batch_with_workers_matches_sequential_results_in_order() -> None:
+    lines = _create_lines(40)
+    lines.insert(7, "{broken")
+    lines.insert(21, json.dumps({"command": "execute-ruling-proposal", "proposal_id": ""}))
+
+    sequential = [result.to_json() for result in run_batch(lines, COMMAND_HANDLERS, _settings())]
+    parallel = [
+        result.to_json()
+        for result in run_batch(lines, COMMAND_HANDLERS, _settings(), workers=3, chunk_size=4)
+    ]
+
+    assert parallel == sequential
+    assert json.loads(parallel[7])["details"]["line"] == 8
+
+
+def test_cli_batch_accepts_workers_option(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    batch_file = tmp_path / "commands.ndjson"
+    batch_file.write_text("\n".join(_create_lines(10)), encoding="utf-8")
+
+    exit_code = entrypoint(
+        ["batch", "--input", str(batch_file), "--workers", "2", "--chunk-size", "3"]
+    )
+
+    output = capsys.readouterr().out.splitlines()
+    assert exit_code == 0
+    assert [json.loads(line)["details"]["snapshot"]["payout_id"] for line in output] == list(
+        range(10)
+    )
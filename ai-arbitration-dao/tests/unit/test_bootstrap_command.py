@@ -1,4 +1,7 @@
 from argparse import Namespace
+from pathlib import Path
+
+from solders.pubkey import Pubkey
 
 from ai_arbitration_dao.commands.bootstrap import run_bootstrap_arbitration_dao
 from ai_arbitration_dao.config import AppSettings
@@ -45,3 +48,38 @@ def test_bootstrap_rejects_empty_realm_name() -> None:
 
     assert result.status == CommandStatus.FAILED
     assert str(result.details["error"]) == "realm_name is required"
+
+
+def test_bootstrap_derives_program_addresses() -> None:
+    args = Namespace(creator=VALID_CREATOR, realm_name="realm", custom_panel="")
+
+    manifest = run_bootstrap_arbitration_dao(args, _settings()).details["manifest"]
+
+    safe_policy, bump = Pubkey.find_program_address(
+        [b"safe_policy", bytes(Pubkey.from_string(VALID_CREATOR))],
+        Pubkey.from_string(_settings().safe_treasury_program_id),
+    )
+    assert manifest["safe_policy_address"] == str(safe_policy)
+    assert manifest["bumps"]["safe_policy_address"] == bump
+    assert manifest["resolver_candidate"] == manifest["governance_address"]
+    for name in ("realm_address", "treasury_address", "challenge_bond_vault_address"):
+        Pubkey.from_string(manifest[name])
+
+
+def test_bootstrap_persists_pda_cache(tmp_path: Path) -> None:
+    path = tmp_path / "pda-cache.json"
+    args = Namespace(creator=VALID_CREATOR, realm_name="realm", custom_panel="")
+
+    result = run_bootstrap_arbitration_dao(args, AppSettings(pda_cache_path=str(path)))
+
+    assert result.status == CommandStatus.EXECUTED
+    assert path.exists()
+
+
+def test_bootstrap_rejects_oversized_realm_name() -> None:
+    args = Namespace(creator=VALID_CREATOR, realm_name="r" * 33, custom_panel="")
+
+    result = run_bootstrap_arbitration_dao(args, _settings())
+
+    assert result.status == CommandStatus.FAILED
+    assert result.details["error"] == "realm_name must be at most 32 bytes"
@@ -0,0 +1,85 @@
+"""Cold-start budget for the CLI: importing it must stay cheap for script-driven invocations."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ai_arbitration_dao.cli import COMMAND_HANDLERS, build_parser
+from ai_arbitration_dao.commands.submit_vote import run_submit_vote
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Cumulative import time of ai_arbitration_dao.cli, in microseconds.
+CLI_IMPORT_BUDGET_US = 100_000
+
+HEAVY_MODULES = frozenset(
+    {
+        "pydantic_settings",
+        "solders",
+        "solana",
+        "structlog",
+        "ai_arbitration_dao.config",
+        "ai_arbitration_dao.domain",
+        "ai_arbitration_dao.orchestration",
+        "ai_arbitration_dao.commands.submit_vote",
+    }
+)
+
+
+def _import_times(code: str) -> dict[str, int]:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    cumulative: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, raw_cumulative, raw_name = line.removeprefix("import time:").split("|")
+        cumulative[raw_name.strip()] = int(raw_cumulative.strip())
+    return cumulative
+
+
+def test_cli_import_stays_within_cold_start_budget() -> None:
+    cumulative = _import_times(
+        "import ai_arbitration_dao.cli as cli; cli.build_parser('submit-vote')"
+    )
+
+    assert cumulative["ai_arbitration_dao.cli"] < CLI_IMPORT_BUDGET_US
+
+
+def test_cli_import_does_not_load_command_dependencies() -> None:
+    cumulative = _import_times(
+        "import ai_arbitration_dao.cli as cli; sorted(cli.COMMAND_HANDLERS); "
+        "cli.build_parser('submit-vote')"
+    )
+
+    assert HEAVY_MODULES.isdisjoint(cumulative)
+
+
+def test_registry_resolves_handlers_on_demand() -> None:
+    assert COMMAND_HANDLERS["submit-vote"] is run_submit_vote
+    assert "batch" not in COMMAND_HANDLERS
+    with pytest.raises(KeyError):
+        COMMAND_HANDLERS["no-such-command"]
+
+
+def test_build_parser_only_constructs_selected_subcommand() -> None:
+    parser = build_parser("submit-vote")
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["bind-resolver", "--governance-address", "a", "--resolver-address", "a"])
+
+
+def test_build_parser_without_selection_lists_every_command() -> None:
+    usage = build_parser().format_help()
+
+    for command in COMMAND_HANDLERS:
+        assert command in usage
@@ -0,0 +1,176 @@
+import json
+import os
+import socket
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from ai_arbitration_dao.cli import entrypoint, run_command
+from ai_arbitration_dao.runtime import daemon
+from ai_arbitration_dao.runtime.daemon import SOCKET_ENV_VAR, CliDaemonServer, forward_to_daemon
+
+VALID_VOTER = "11111111111111111111111111111111"
+
+
+@pytest.fixture
+def daemon_socket(tmp_path: Path) -> Iterator[str]:
+    socket_path = str(tmp_path / "cli.sock")
+    server = CliDaemonServer(socket_path, run_command)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    try:
+        yield socket_path
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--json", "submit-vote", "--proposal-id", "prop-1", "--voter", VALID_VOTER],
+        ["submit-vote", "--proposal-id", "prop-1", "--voter", VALID_VOTER, "--deny"],
+        ["--json", "submit-vote", "--proposal-id", "", "--voter", VALID_VOTER],
+        ["submit-vote", "--proposal-id", "prop-1"],
+    ],
+)
+def test_forwarded_output_is_identical_to_in_process(
+    daemon_socket: str, argv: list[str], capsys: pytest.CaptureFixture[str]
+) -> None:
+    try:
+        local_exit_code = run_command(argv)
+    except SystemExit as exc:
+        local_exit_code = int(exc.code or 0)
+    local = capsys.readouterr()
+
+    forwarded_exit_code = forward_to_daemon(argv, socket_path=daemon_socket)
+    forwarded = capsys.readouterr()
+
+    assert forwarded_exit_code == local_exit_code
+    assert forwarded.out == local.out
+    assert forwarded.err == local.err
+
+
+def test_forward_returns_none_without_daemon(tmp_path: Path) -> None:
+    assert forward_to_daemon(["agent-health-check"], socket_path=str(tmp_path / "none")) is None
+
+
+def test_forward_falls_back_when_settings_environment_differs(
+    daemon_socket: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SOLANA_RPC_URL", "http://other-node:8899")
+
+    argv = ["--json", "submit-vote", "--proposal-id", "prop-1", "--voter", VALID_VOTER]
+    assert forward_to_daemon(argv, socket_path=daemon_socket) is None
+
+
+def test_forward_falls_back_when_working_directory_differs(
+    daemon_socket: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    argv = ["--json", "submit-vote", "--proposal-id", "prop-1", "--voter", VALID_VOTER]
+    assert forward_to_daemon(argv, socket_path=daemon_socket) is None
+
+
+def test_entrypoint_forwards_to_running_daemon(
+    daemon_socket: str, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv(SOCKET_ENV_VAR, daemon_socket)
+    forwarded: list[list[str]] = []
+    original_run_command = run_command
+
+    def recording_run_command(argv: list[str]) -> int:
+        forwarded.append(list(argv))
+        return original_run_command(argv)
+
+    monkeypatch.setattr("ai_arbitration_dao.cli.run_command", recording_run_command)
+
+    argv = ["--json", "submit-vote", "--proposal-id", "prop-1", "--voter", VALID_VOTER]
+    exit_code = entrypoint(argv)
+
+    assert exit_code == 0
+    assert forwarded == []
+    assert '"status":"pending"' in capsys.readouterr().out
+
+
+class _ScriptedDaemon:
+    """Listener that sends a hello, records the request line, then sends ``reply``."""
+
+    def __init__(self, socket_path: str, reply: bytes | None) -> None:
+        self.requests: list[dict[str, object]] = []
+        self._reply = reply
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(socket_path)
+        self._listener.listen(1)
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        connection, _ = self._listener.accept()
+        with connection, connection.makefile("rb") as reader:
+            connection.sendall(b'{"settings_keys": ["solana_rpc_url"]}\n')
+            self.requests.append(json.loads(reader.readline()))
+            if self._reply is not None:
+                connection.sendall(self._reply)
+            self._done.wait(5)
+
+    def close(self) -> None:
+        self._done.set()
+        self._thread.join()
+        self._listener.close()
+
+
+def test_forward_sends_a_settings_digest_and_falls_back_on_malformed_reply(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("SECRET_API_KEY", "do-not-send")
+    scripted = _ScriptedDaemon(str(tmp_path / "cli.sock"), b"not json\n")
+    try:
+        result = forward_to_daemon(["submit-vote"], socket_path=str(tmp_path / "cli.sock"))
+    finally:
+        scripted.close()
+
+    assert result is None
+    (request,) = scripted.requests
+    assert set(request) == {"argv", "cwd", "settings_digest"}
+    assert "do-not-send" not in json.dumps(request)
+
+
+def test_forward_gives_up_on_a_stalled_daemon_without_rerunning(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(daemon, "RESPONSE_TIMEOUT_SECONDS", 0.05)
+    scripted = _ScriptedDaemon(str(tmp_path / "cli.sock"), None)
+    try:
+        result = forward_to_daemon(["submit-vote"], socket_path=str(tmp_path / "cli.sock"))
+    finally:
+        scripted.close()
+
+    assert result == 1
+    assert "did not answer" in capsys.readouterr().err
+
+
+def test_forward_ignores_sockets_in_directories_others_can_write(daemon_socket: str) -> None:
+    directory = os.path.dirname(daemon_socket)
+    os.chmod(directory, 0o777)
+    try:
+        argv = ["--json", "submit-vote", "--proposal-id", "prop-1", "--voter", VALID_VOTER]
+        assert forward_to_daemon(argv, socket_path=daemon_socket) is None
+    finally:
+        os.chmod(directory, 0o700)
+
+
+def test_default_socket_path_falls_back_to_a_per_user_directory(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv(SOCKET_ENV_VAR, raising=False)
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+    assert daemon.default_socket_path() == f"/tmp/ai-arbitration-dao-{os.getuid()}/daemon.sock"
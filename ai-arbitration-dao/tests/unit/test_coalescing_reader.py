@@ -0,0 +1,196 @@
+import asyncio
+import base64
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from _rpc_stub import RpcStandIn, serving
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.observability.metrics import CacheMetrics
+from ai_arbitration_dao.solana.account_cache import AccountCache, CachedAccount
+from ai_arbitration_dao.solana.account_loader import RawAccount
+from ai_arbitration_dao.solana.coalescing_reader import CoalescingAccountReader
+from ai_arbitration_dao.solana.rpc_client import RpcClientFactory
+
+OWNER = str(Pubkey(bytes([9]) * 32))
+
+
+def _address(index: int) -> str:
+    return str(Pubkey(index.to_bytes(32, "big")))
+
+
+def _account(data: bytes) -> dict[str, Any]:
+    return {
+        "lamports": 1,
+        "data": [base64.b64encode(data).decode(), "base64"],
+        "owner": OWNER,
+        "executable": False,
+        "rentEpoch": 0,
+        "space": len(data),
+    }
+
+
+class _AccountRpc(RpcStandIn):
+    def __init__(self, *, batches: bool = True) -> None:
+        super().__init__()
+        self.batches = batches
+        self.failing = False
+        self.unavailable_batches = 0
+
+    def answer(self, request: dict[str, Any]) -> dict[str, Any]:
+        if self.failing:
+            return {
+                "jsonrpc": "2.0",
+                "error": {"code": -32603, "message": "busy"},
+                "id": request["id"],
+            }
+        if request["method"] == "getProgramAccounts":
+            result: Any = [{"pubkey": _address(1), "account": _account(b"scan")}]
+        else:
+            value = [
+                None if key == _address(0) else _account(bytes(Pubkey.from_string(key))[-2:])
+                for key in request["params"][0]
+            ]
+            result = {"context": {"slot": 7}, "value": value}
+        return {"jsonrpc": "2.0", "result": result, "id": request["id"]}
+
+    def respond(self, request: Any) -> Any:
+        if not isinstance(request, list):
+            return self.answer(request)
+        if self.unavailable_batches:
+            self.unavailable_batches -= 1
+            return None
+        if not self.batches:
+            return {
+                "jsonrpc": "2.0",
+                "error": {"code": -32600, "message": "batch requests are disabled"},
+                "id": None,
+            }
+        return [self.answer(item) for item in reversed(request)]
+
+
+@pytest.fixture
+def rpc_server() -> Iterator[_AccountRpc]:
+    with serving(_AccountRpc()) as (server,):
+        yield server
+
+
+@pytest.fixture
+def rpc_server_without_batches() -> Iterator[_AccountRpc]:
+    with serving(_AccountRpc(batches=False)) as (server,):
+        yield server
+
+
+def _expected(index: int) -> RawAccount | None:
+    return None if index == 0 else RawAccount(owner=OWNER, data=index.to_bytes(2, "big"))
+
+
+def test_concurrent_reads_coalesce_into_one_batch(rpc_server: _AccountRpc) -> None:
+    async def scenario() -> tuple[list[RawAccount | None], list[RawAccount | None]]:
+        async with RpcClientFactory(AppSettings(solana_rpc_url=rpc_server.url)) as factory:
+            reader = factory.reader()
+            assert factory.reader() is reader
+            *singles, bulk = await asyncio.gather(
+                *(reader.load_account(_address(index)) for index in range(150)),
+                reader.load_accounts([_address(index) for index in (5, 149, 0, 5)]),
+            )
+            return singles, bulk
+
+    singles, bulk = asyncio.run(scenario())
+
+    assert singles == [_expected(index) for index in range(150)]
+    assert bulk == [_expected(5), _expected(149), None, _expected(5)]
+    (batch,) = rpc_server.posts
+    assert [len(request["params"][0]) for request in batch] == [100, 50]
+
+
+def test_reader_falls_back_when_endpoint_rejects_batches(
+    rpc_server_without_batches: _AccountRpc,
+) -> None:
+    server = rpc_server_without_batches
+    settings = AppSettings(solana_rpc_url=server.url)
+
+    async def scenario() -> None:
+        async with RpcClientFactory(settings) as factory:
+            reader = factory.reader()
+            addresses = [_address(index) for index in range(1, 151)]
+            assert await reader.load_accounts(addresses) == [_expected(i) for i in range(1, 151)]
+            assert not reader.batch_requests
+            assert await reader.load_accounts(addresses) == [_expected(i) for i in range(1, 151)]
+
+    asyncio.run(scenario())
+
+    kinds = ["batch" if isinstance(post, list) else post["method"] for post in server.posts]
+    assert kinds == ["batch"] + ["getMultipleAccounts"] * 4
+
+
+def test_transient_batch_failure_keeps_batching_on(rpc_server: _AccountRpc) -> None:
+    rpc_server.unavailable_batches = 1
+
+    async def scenario() -> None:
+        async with RpcClientFactory(AppSettings(solana_rpc_url=rpc_server.url)) as factory:
+            reader = factory.reader()
+            addresses = [_address(index) for index in range(1, 151)]
+            assert await reader.load_accounts(addresses) == [_expected(i) for i in range(1, 151)]
+            assert reader.batch_requests
+            assert await reader.load_accounts(addresses) == [_expected(i) for i in range(1, 151)]
+
+    asyncio.run(scenario())
+
+    kinds = ["batch" if isinstance(post, list) else post["method"] for post in rpc_server.posts]
+    assert kinds == ["batch", "getMultipleAccounts", "getMultipleAccounts", "batch"]
+
+
+def test_failed_read_reaches_every_waiter_and_is_retried(rpc_server: _AccountRpc) -> None:
+    async def scenario() -> None:
+        async with RpcClientFactory(AppSettings(solana_rpc_url=rpc_server.url)) as factory:
+            reader = factory.reader()
+            rpc_server.failing = True
+            results = await asyncio.gather(
+                reader.load_account(_address(3)),
+                reader.load_accounts([_address(3), _address(4)]),
+                return_exceptions=True,
+            )
+            assert all(isinstance(result, Exception) for result in results)
+            rpc_server.failing = False
+            assert await reader.load_account(_address(3)) == _expected(3)
+
+    asyncio.run(scenario())
+
+    assert len(rpc_server.posts) == 2
+
+
+def test_identical_program_scans_share_one_request(rpc_server: _AccountRpc) -> None:
+    async def scenario() -> list[list[tuple[str, RawAccount]]]:
+        async with RpcClientFactory(AppSettings(solana_rpc_url=rpc_server.url)) as factory:
+            reader = factory.reader()
+            return list(
+                await asyncio.gather(
+                    *(reader.load_program_accounts(OWNER, b"\x01" * 8) for _ in range(4))
+                )
+            )
+
+    scans = asyncio.run(scenario())
+
+    assert scans == [[(_address(1), RawAccount(owner=OWNER, data=b"scan"))]] * 4
+    assert len(rpc_server.posts) == 1
+
+
+def test_cached_reads_skip_the_rpc_until_min_slot_passes_them(rpc_server: _AccountRpc) -> None:
+    cache = AccountCache(metrics=CacheMetrics("test"))
+
+    async def scenario() -> None:
+        async with RpcClientFactory(AppSettings(solana_rpc_url=rpc_server.url)) as factory:
+            reader = CoalescingAccountReader(factory.create(), cache=cache)
+            assert await reader.load_accounts([_address(1), _address(0)]) == [_expected(1), None]
+            assert await reader.load_account(_address(0)) is None
+            assert await reader.load_account(_address(1), min_slot=7) == _expected(1)
+            assert await reader.load_account(_address(1), min_slot=8) == _expected(1)
+
+    asyncio.run(scenario())
+
+    assert [post["params"][1]["minContextSlot"] for post in rpc_server.posts] == [None, 8]
+    assert cache.get(_address(1), "finalized") == CachedAccount(_expected(1), 7)
+    assert cache.metrics.snapshot()["hits"] == 3
@@ -1,6 +1,14 @@
+import json
 from argparse import Namespace
+from pathlib import Path
 
-from ai_arbitration_dao.commands.create_ruling_proposal import run_create_ruling_proposal
+import pytest
+
+from ai_arbitration_dao.cli import entrypoint
+from ai_arbitration_dao.commands.create_ruling_proposal import (
+    run_create_ruling_proposal,
+    stream_create_ruling_proposals,
+)
 from ai_arbitration_dao.config import AppSettings
 from ai_arbitration_dao.types import CommandStatus
 
@@ -49,3 +57,137 @@ def test_create_ruling_proposal_rejects_boolean_round() -> None:
 
     assert result.status == CommandStatus.FAILED
     assert result.details["error"] == "round must be an integer"
+
+
+def test_stream_from_csv_matches_single_proposals_and_isolates_bad_rows(tmp_path: Path) -> None:
+    disputes = tmp_path / "disputes.csv"
+    disputes.write_text(
+        "safe,payout_id,dispute_id,round,outcome,is_final\n"
+        "safe111,1,dispute-1,0,Allow,false\n"
+        "safe111,not-a-number,dispute-2,0,Allow,false\n"
+        "safe111,3,dispute-3,1,Deny,\n",
+        encoding="utf-8",
+    )
+
+    results = list(stream_create_ruling_proposals(str(disputes), _settings()))
+
+    assert [result.status for result in results] == [
+        CommandStatus.PENDING,
+        CommandStatus.FAILED,
+        CommandStatus.PENDING,
+    ]
+    assert [result.details["row"] for result in results] == [1, 2, 3]
+    single = run_create_ruling_proposal(_args(), _settings())
+    assert results[0].details["proposal_id"] == single.details["proposal_id"]
+    assert results[2].details["payload"]["is_final"] is False
+
+
+def test_stream_from_ndjson_reports_malformed_and_incomplete_rows(tmp_path: Path) -> None:
+    disputes = tmp_path / "disputes.ndjson"
+    disputes.write_text(
+        "\n".join(
+            [
+                "{oops",
+                json.dumps({"safe": "safe111", "payout_id": 1, "dispute_id": "dispute-1"}),
+                json.dumps(
+                    {
+                        "safe": "safe111",
+                        "payout_id": 2,
+                        "dispute_id": "dispute-2",
+                        "round": 0,
+                        "outcome": "Deny",
+                        "is_final": True,
+                    }
+                ),
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    results = stream_create_ruling_proposals(str(disputes), _settings())
+
+    first = next(results)
+    assert first.status == CommandStatus.FAILED
+    assert "invalid JSON" in first.details["error"]
+    second = next(results)
+    assert second.details["error"] == "missing required field(s): round, outcome"
+    third = next(results)
+    assert third.status == CommandStatus.PENDING
+    assert third.details["payload"]["is_final"] is True
+
+
+def test_stream_rejects_unknown_input_format(tmp_path: Path) -> None:
+    results = list(stream_create_ruling_proposals(str(tmp_path / "disputes.txt"), _settings()))
+
+    assert len(results) == 1
+    assert results[0].status == CommandStatus.FAILED
+
+
+def test_cli_create_with_input_streams_one_line_per_row(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    disputes = tmp_path / "disputes.csv"
+    disputes.write_text(
+        "safe,payout_id,dispute_id,round,outcome,is_final\n"
+        "safe111,1,dispute-1,0,Allow,true\n"
+        "safe111,2,dispute-2,0,Maybe,false\n",
+        encoding="utf-8",
+    )
+
+    exit_code = entrypoint(["--json", "create-ruling-proposal", "--input", str(disputes)])
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert exit_code == 1
+    assert [line["status"] for line in lines] == ["pending", "failed"]
+
+
+def test_stream_reports_missing_input_file_as_failed_result(tmp_path: Path) -> None:
+    results = list(stream_create_ruling_proposals(str(tmp_path / "absent.csv"), _settings()))
+
+    assert len(results) == 1
+    assert results[0].status == CommandStatus.FAILED
+    assert "cannot open input" in results[0].details["error"]
+
+
+def test_cli_create_is_final_defaults_rows_without_is_final(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    disputes = tmp_path / "disputes.csv"
+    disputes.write_text(
+        "safe,payout_id,dispute_id,round,outcome,is_final\n"
+        "safe111,1,dispute-1,0,Allow,\n"
+        "safe111,2,dispute-2,0,Allow,false\n",
+        encoding="utf-8",
+    )
+
+    exit_code = entrypoint(
+        ["--json", "create-ruling-proposal", "--input", str(disputes), "--is-final"]
+    )
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert exit_code == 0
+    assert [line["details"]["payload"]["is_final"] for line in lines] == [True, False]
+
+
+def test_cli_create_with_missing_input_fails_without_traceback(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    exit_code = entrypoint(
+        ["--json", "create-ruling-proposal", "--input", str(tmp_path / "absent.ndjson")]
+    )
+
+    (line,) = capsys.readouterr().out.splitlines()
+    assert exit_code == 1
+    assert json.loads(line)["status"] == "failed"
+
+
+def test_cli_create_requires_snapshot_flags_without_input() -> None:
+    with pytest.raises(SystemExit):
+        entrypoint(["create-ruling-proposal", "--safe", "safe111"])
+
+
+def test_cli_create_rejects_input_combined_with_snapshot_flags(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit):
+        entrypoint(
+            ["create-ruling-proposal", "--input", str(tmp_path / "d.csv"), "--safe", "safe111"]
+        )
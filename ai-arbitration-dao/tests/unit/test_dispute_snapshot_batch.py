@@ -0,0 +1,84 @@
+import random
+
+import pytest
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.domain import DisputeSnapshot, RulingOutcome
+
+np = pytest.importorskip("numpy")
+
+from ai_arbitration_dao.domain.dispute_snapshot_batch import DisputeSnapshotBatch  # noqa: E402
+
+SAFE = "SafeTreasury1111111111111111111111111111111"
+DISPUTE = "GovER5Lthms3bLBqWub97yVrMmEogzX7xNjdXpPPCVZw"
+
+
+def _snapshot(**overrides: object) -> DisputeSnapshot:
+    fields: dict[str, object] = {
+        "safe": SAFE,
+        "payout_id": 7,
+        "dispute_id": DISPUTE,
+        "round": 1,
+        "outcome": RulingOutcome.ALLOW,
+    }
+    fields.update(overrides)
+    return DisputeSnapshot(**fields)  # type: ignore[arg-type]
+
+
+def test_batch_round_trips_snapshots_losslessly() -> None:
+    rng = random.Random(15)
+    snapshots = [
+        _snapshot(
+            safe=f"safe-{rng.randrange(5)}",
+            payout_id=rng.randrange(2**63),
+            dispute_id=rng.choice([DISPUTE, "dispute-é", ""]),
+            round=rng.randrange(-2, 4),
+            outcome=rng.choice(list(RulingOutcome)),
+        )
+        for _ in range(500)
+    ]
+
+    batch = DisputeSnapshotBatch.from_snapshots(snapshots)
+
+    assert len(batch) == 500
+    assert len(batch.safe_table) <= 5
+    assert batch.to_snapshots() == snapshots
+    assert DisputeSnapshotBatch.from_snapshots([]).to_snapshots() == []
+
+
+def test_batch_validation_matches_scalar_checks() -> None:
+    snapshots = [
+        _snapshot(),
+        _snapshot(round=-1),
+        _snapshot(safe="", payout_id=-1),
+        _snapshot(dispute_id=""),
+    ]
+    batch = DisputeSnapshotBatch.from_snapshots(snapshots)
+
+    assert batch.canonical_mask().tolist() == [True, False, False, False]
+    with pytest.raises(ValueError, match="row 1: round must be non-negative"):
+        batch.ensure_canonical()
+    with pytest.raises(ValueError, match="safe is required"):
+        snapshots[2].ensure_canonical()
+    with pytest.raises(ValueError, match="row 0: safe is required"):
+        DisputeSnapshotBatch.from_snapshots(snapshots[2:]).ensure_canonical()
+
+    DisputeSnapshotBatch.from_snapshots([_snapshot()] * 3).ensure_canonical()
+
+
+def test_batch_rejects_integers_outside_int64() -> None:
+    with pytest.raises(OverflowError):
+        DisputeSnapshotBatch.from_snapshots([_snapshot(payout_id=2**64)])
+
+
+def test_batch_expands_interned_pubkeys() -> None:
+    batch = DisputeSnapshotBatch.from_snapshots([_snapshot(), _snapshot(payout_id=8)])
+
+    safes = batch.safe_pubkeys()
+    assert safes.shape == (2, 32)
+    assert safes.dtype == np.uint8
+    assert bytes(safes[0]) == bytes(Pubkey.from_string(SAFE))
+    assert bytes(batch.dispute_pubkeys()[1]) == bytes(Pubkey.from_string(DISPUTE))
+
+    with pytest.raises(ValueError, match="not a base58 pubkey"):
+        DisputeSnapshotBatch.from_snapshots([_snapshot(safe="safe-1")]).safe_pubkeys()
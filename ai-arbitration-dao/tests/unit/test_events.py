@@ -0,0 +1,190 @@
+import asyncio
+import base64
+import struct
+from collections.abc import AsyncIterator
+
+import pytest
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.solana.accounts import AccountDecodeError
+from ai_arbitration_dao.solana.events import (
+    EVENT_TYPES,
+    PayoutQueued,
+    RulingRecorded,
+    TransactionEvent,
+    TransactionLogs,
+    aiter_transaction_events,
+    decode_event,
+    event_discriminator,
+    iter_log_events,
+    iter_transaction_events,
+)
+
+PROGRAM = str(Pubkey(bytes([7]) * 32))
+OTHER = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+SAFE = bytes([1]) * 32
+DISPUTE = bytes([2]) * 32
+
+
+def _data_line(name: str, body: bytes) -> str:
+    return "Program data: " + base64.b64encode(event_discriminator(name) + body).decode()
+
+
+def _ruling_recorded(round: int = 1, *, is_final: bool = False) -> str:
+    return _data_line(
+        "RulingRecorded",
+        SAFE + struct.pack("<Q", 9) + DISPUTE + bytes([round, 1, int(is_final)]),
+    )
+
+
+def _invoke(program: str, depth: int, *body: str, failed: bool = False) -> list[str]:
+    end = (
+        f"Program {program} failed: custom program error: 0x1"
+        if failed
+        else f"Program {program} success"
+    )
+    return [
+        f"Program {program} invoke [{depth}]",
+        *body,
+        f"Program {program} consumed 1200 of 200000 compute units",
+        end,
+    ]
+
+
+def test_event_types_cover_safe_treasury_events() -> None:
+    assert sorted(event.__name__ for event in EVENT_TYPES.values()) == [
+        "CustodyExited",
+        "PayoutCancelled",
+        "PayoutChallenged",
+        "PayoutDenied",
+        "PayoutQueued",
+        "PayoutReleased",
+        "RulingAppealed",
+        "RulingFinalized",
+        "RulingRecorded",
+    ]
+    assert RulingRecorded.DISCRIMINATOR == event_discriminator("RulingRecorded")
+
+
+def test_decode_event_reads_typed_fields() -> None:
+    event = decode_event(_ruling_recorded(2, is_final=True).removeprefix("Program data: "))
+
+    assert isinstance(event, RulingRecorded)
+    assert event.safe == str(Pubkey(SAFE))
+    assert event.dispute_id == str(Pubkey(DISPUTE))
+    assert (event.payout_id, event.round, event.outcome, event.is_final) == (9, 2, 1, True)
+
+    queued_body = (
+        SAFE
+        + struct.pack("<QB", 3, 1)
+        + b"\x01"
+        + bytes([5]) * 32
+        + bytes([6]) * 32
+        + struct.pack("<Qq", 500, -1)
+        + bytes([8]) * 32
+    )
+    queued = decode_event(_data_line("PayoutQueued", queued_body).removeprefix("Program data: "))
+    assert isinstance(queued, PayoutQueued)
+    assert queued.mint == str(Pubkey(bytes([5]) * 32))
+    assert queued.as_dict()["policy_hash"] == (bytes([8]) * 32).hex()
+    assert (queued.amount, queued.dispute_deadline) == (500, -1)
+
+
+def test_decode_event_skips_unknown_and_rejects_malformed_payloads() -> None:
+    unknown = base64.b64encode(event_discriminator("TreasuryPolicySet") + bytes(40)).decode()
+    assert decode_event(unknown) is None
+
+    with pytest.raises(AccountDecodeError, match="base64"):
+        decode_event("not base64!")
+    truncated = _ruling_recorded()[len("Program data: ") :]
+    truncated_payload = base64.b64encode(base64.b64decode(truncated)[:-1]).decode()
+    with pytest.raises(AccountDecodeError, match="RulingRecorded event data is truncated"):
+        decode_event(truncated_payload)
+
+
+def test_iter_log_events_attributes_data_to_the_invoking_program() -> None:
+    logs = _invoke(
+        PROGRAM,
+        1,
+        "Program log: Instruction: RecordRuling",
+        *_invoke(OTHER, 2, _ruling_recorded(5), "Program log: Instruction: Transfer"),
+        _ruling_recorded(1),
+        "Program return: " + PROGRAM + " AQ==",
+    ) + _invoke(OTHER, 1, _ruling_recorded(6))
+
+    events = list(iter_log_events(logs, PROGRAM))
+
+    assert [event.round for event in events if isinstance(event, RulingRecorded)] == [1]
+
+
+def test_iter_transaction_events_skips_failed_transactions() -> None:
+    transactions = [
+        TransactionLogs("sig-a", _invoke(PROGRAM, 1, _ruling_recorded(1)), slot=10),
+        TransactionLogs(
+            "sig-b", _invoke(PROGRAM, 1, _ruling_recorded(2), failed=True), failed=True
+        ),
+        TransactionLogs("sig-c", _invoke(PROGRAM, 1, _ruling_recorded(3), _ruling_recorded(4))),
+    ]
+
+    events = list(iter_transaction_events(transactions, PROGRAM))
+
+    assert [(event.signature, event.slot) for event in events] == [
+        ("sig-a", 10),
+        ("sig-c", None),
+        ("sig-c", None),
+    ]
+    assert [event.event.as_dict()["round"] for event in events] == [1, 3, 4]
+
+
+def test_aiter_transaction_events_streams_live_feed() -> None:
+    async def feed() -> AsyncIterator[TransactionLogs]:
+        for index in range(3):
+            await asyncio.sleep(0)
+            yield TransactionLogs(f"sig-{index}", _invoke(PROGRAM, 1, _ruling_recorded(index)))
+
+    async def collect() -> list[TransactionEvent]:
+        return [event async for event in aiter_transaction_events(feed(), PROGRAM)]
+
+    events = asyncio.run(collect())
+
+    assert [event.signature for event in events] == ["sig-0", "sig-1", "sig-2"]
+
+
+def _truncated_ruling_recorded() -> str:
+    payload = base64.b64decode(_ruling_recorded().removeprefix("Program data: "))
+    return "Program data: " + base64.b64encode(payload[:-1]).decode()
+
+
+def test_iter_log_events_reports_and_skips_undecodable_payloads() -> None:
+    logs = _invoke(
+        PROGRAM, 1, _truncated_ruling_recorded(), "Program data: not base64!", _ruling_recorded(2)
+    )
+    errors: list[AccountDecodeError] = []
+
+    events = list(iter_log_events(logs, PROGRAM, on_error=errors.append))
+
+    assert [event.round for event in events if isinstance(event, RulingRecorded)] == [2]
+    assert [str(error) for error in errors] == [
+        "RulingRecorded event data is truncated",
+        "program data is not valid base64",
+    ]
+    assert len(list(iter_log_events(logs, PROGRAM))) == 1
+
+
+def test_aiter_transaction_events_survives_truncated_payloads() -> None:
+    async def feed() -> AsyncIterator[TransactionLogs]:
+        yield TransactionLogs("sig-bad", _invoke(PROGRAM, 1, _truncated_ruling_recorded()))
+        yield TransactionLogs("sig-good", _invoke(PROGRAM, 1, _ruling_recorded(1)))
+
+    errors: list[AccountDecodeError] = []
+
+    async def collect() -> list[TransactionEvent]:
+        return [
+            event
+            async for event in aiter_transaction_events(feed(), PROGRAM, on_error=errors.append)
+        ]
+
+    events = asyncio.run(collect())
+
+    assert [event.signature for event in events] == ["sig-good"]
+    assert len(errors) == 1
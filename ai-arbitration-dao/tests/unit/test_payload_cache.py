@@ -0,0 +1,110 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from ai_arbitration_dao.domain import (
+    DisputeSnapshot,
+    RulingOutcome,
+    RulingPayloadCache,
+    compile_ruling_payload,
+)
+from ai_arbitration_dao.observability.metrics import CacheMetrics, cache_metrics_snapshot
+from ai_arbitration_dao.orchestration.pipeline import run_deterministic_pipeline
+
+
+def _snapshot(round: int = 0) -> DisputeSnapshot:
+    return DisputeSnapshot(
+        safe="safe-1",
+        payout_id=3,
+        dispute_id="dispute-1",
+        round=round,
+        outcome=RulingOutcome.DENY,
+    )
+
+
+def _cache(**kwargs: object) -> RulingPayloadCache:
+    return RulingPayloadCache(metrics=CacheMetrics("test"), **kwargs)  # type: ignore[arg-type]
+
+
+def test_cache_returns_identical_payloads_and_counts_hits() -> None:
+    cache = _cache()
+
+    first = cache.compile(_snapshot(), is_final=True)
+    second = cache.compile(_snapshot(), is_final=True)
+    non_final = cache.compile(_snapshot(), is_final=False)
+
+    assert first is second
+    assert first == compile_ruling_payload(_snapshot(), is_final=True)
+    assert non_final == compile_ruling_payload(_snapshot(), is_final=False)
+    assert cache.metrics.snapshot() == {"hits": 1, "misses": 2, "evictions": 0}
+
+
+def test_cache_evicts_least_recently_used_entry() -> None:
+    cache = _cache(maxsize=2)
+
+    cache.compile(_snapshot(0))
+    cache.compile(_snapshot(1))
+    cache.compile(_snapshot(0))
+    cache.compile(_snapshot(2))
+
+    assert len(cache) == 2
+    cache.compile(_snapshot(0))
+    cache.compile(_snapshot(1))
+    assert cache.metrics.snapshot() == {"hits": 2, "misses": 4, "evictions": 2}
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    now = [0.0]
+    cache = _cache(ttl_seconds=5.0, clock=lambda: now[0])
+
+    cache.compile(_snapshot())
+    now[0] = 4.0
+    cache.compile(_snapshot())
+    now[0] = 9.5
+    cache.compile(_snapshot())
+
+    assert cache.metrics.snapshot()["hits"] == 1
+    assert cache.metrics.snapshot()["misses"] == 2
+
+
+def test_cache_bypasses_equal_values_of_other_types() -> None:
+    cache = _cache()
+    cache.compile(_snapshot(), is_final=True)
+
+    payload = cache.compile(_snapshot(), is_final=1)  # type: ignore[arg-type]
+
+    assert payload == compile_ruling_payload(_snapshot(), is_final=1)  # type: ignore[arg-type]
+    assert '"is_final":1' in payload.serialized
+    assert len(cache) == 1
+
+
+def test_cache_is_shared_safely_across_tasks_and_threads() -> None:
+    cache = _cache(maxsize=8)
+    snapshots = [_snapshot(index % 4) for index in range(200)]
+
+    async def compile_all() -> list[object]:
+        return await asyncio.gather(
+            *(asyncio.to_thread(cache.compile, snapshot) for snapshot in snapshots)
+        )
+
+    from_tasks = asyncio.run(compile_all())
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        from_threads = list(pool.map(cache.compile, snapshots))
+
+    expected = [compile_ruling_payload(snapshot) for snapshot in snapshots]
+    assert from_tasks == expected
+    assert from_threads == expected
+    counts = cache.metrics.snapshot()
+    assert counts["hits"] + counts["misses"] == 400
+    assert len(cache) == 4
+
+
+def test_pipeline_uses_shared_payload_cache_metrics() -> None:
+    before = cache_metrics_snapshot().get("ruling_payload", {"hits": 0, "misses": 0})
+
+    run_deterministic_pipeline(_snapshot(7), is_final=False)
+    state = run_deterministic_pipeline(_snapshot(7), is_final=False)
+
+    after = cache_metrics_snapshot()["ruling_payload"]
+    assert state.payload == compile_ruling_payload(_snapshot(7))
+    assert after["hits"] + after["misses"] == before["hits"] + before["misses"] + 2
+    assert after["hits"] >= before["hits"] + 1
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.solana import pda
+from ai_arbitration_dao.solana.pda import (
+    PdaCache,
+    challenge_seeds,
+    native_vault_seeds,
+    payout_seeds,
+    safe_policy_seeds,
+)
+
+PROGRAM_ID = "9yMpZraAc4pFvg4DXTT3rhvUvdh2xGQUdiNLQ1bwEhCD"
+AUTHORITY = str(Pubkey(bytes([1]) * 32))
+
+
+def test_find_program_address_matches_solders() -> None:
+    cache = PdaCache()
+
+    address, bump = cache.find_program_address(safe_policy_seeds(AUTHORITY), PROGRAM_ID)
+
+    expected = Pubkey.find_program_address(
+        [b"safe_policy", bytes(Pubkey.from_string(AUTHORITY))], Pubkey.from_string(PROGRAM_ID)
+    )
+    assert (address, bump) == (str(expected[0]), expected[1])
+
+
+def test_cache_derives_each_address_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[object] = []
+    original = Pubkey.find_program_address
+
+    class CountingPubkey:
+        from_string = staticmethod(Pubkey.from_string)
+
+        @staticmethod
+        def find_program_address(seeds: list[bytes], program_id: Pubkey) -> tuple[Pubkey, int]:
+            calls.append(seeds)
+            return original(seeds, program_id)
+
+    monkeypatch.setattr(pda, "Pubkey", CountingPubkey)
+    cache = PdaCache()
+    safe = cache.find_program_address(safe_policy_seeds(AUTHORITY), PROGRAM_ID)[0]
+    payouts = [(payout_seeds(safe, index), PROGRAM_ID) for index in range(5)]
+
+    first = cache.derive_many(payouts + payouts)
+    second = cache.derive_many(payouts)
+
+    assert first[:5] == first[5:] == second
+    assert len(calls) == 6
+
+
+def test_cache_persists_to_disk(tmp_path: Path) -> None:
+    path = tmp_path / "pda-cache.json"
+    cache = PdaCache(path)
+    derived = cache.derive_many(
+        [
+            (native_vault_seeds(AUTHORITY), PROGRAM_ID),
+            (challenge_seeds(AUTHORITY), PROGRAM_ID),
+        ]
+    )
+
+    assert cache.save() is True
+    assert cache.save() is False
+
+    reloaded = PdaCache(path)
+    assert len(reloaded) == 2
+    assert reloaded.find_program_address(native_vault_seeds(AUTHORITY), PROGRAM_ID) == derived[0]
+
+
+def test_rejects_oversized_seeds() -> None:
+    with pytest.raises(ValueError, match="at most 32 bytes"):
+        PdaCache().find_program_address((b"x" * 33,), PROGRAM_ID)
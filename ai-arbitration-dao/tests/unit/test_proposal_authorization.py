@@ -338,3 +338,16 @@ def test_authorize_ruling_write_rejects_missing_round_binding() -> None:
     assert status == CommandStatus.FAILED
     assert error is not None
     assert "round is required" in error.lower()
+
+
+def test_authorize_ruling_write_rejects_rebinding_a_recorded_proposal() -> None:
+    store = ProposalStore()
+    store.add_proposal(
+        ProposalProof("prop-1", EXECUTED_GOVERNANCE_PROOF_TYPE, True, "dispute-a", 0)
+    )
+    proof = {"proposal_id": "prop-1", "executed": True, "dispute_id": "dispute-b", "round": 3}
+
+    status, error = authorize_ruling_write(store, proof, "dispute-b", 3)
+
+    assert status == CommandStatus.FAILED
+    assert "recorded for dispute dispute-a" in str(error)
@@ -0,0 +1,38 @@
+import pytest
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.solana.pubkeys import (
+    NormalizedPubkey,
+    normalize_pubkey,
+    normalize_pubkeys,
+    resolve_pubkey,
+)
+
+KEY = Pubkey(bytes([5]) * 32)
+
+
+def test_normalize_pubkey_strips_validates_and_caches() -> None:
+    assert normalize_pubkey(f"  {KEY}\n", field_name="voter") == str(KEY)
+    assert resolve_pubkey(str(KEY), field_name="voter") == NormalizedPubkey(str(KEY), bytes(KEY))
+    assert resolve_pubkey(str(KEY), field_name="voter") is resolve_pubkey(
+        f" {KEY}", field_name="creator"
+    )
+
+    with pytest.raises(ValueError, match="^voter is required$"):
+        normalize_pubkey("   ", field_name="voter")
+    with pytest.raises(ValueError, match="^voter must be a valid Solana public key$"):
+        normalize_pubkey("not-a-key", field_name="voter")
+
+
+def test_normalize_pubkeys_reports_errors_by_index() -> None:
+    other = Pubkey(bytes([6]) * 32)
+
+    result = normalize_pubkeys([str(KEY), "0OIl", "", str(other), str(KEY)], field_name="voter")
+
+    assert result.errors == {
+        1: "voter[1] must be a valid Solana public key",
+        2: "voter[2] is required",
+    }
+    assert result.values[1] is None and result.values[2] is None
+    assert result.values[3] == NormalizedPubkey(str(other), bytes(other))
+    assert result.addresses == [str(KEY), str(other), str(KEY)]
@@ -0,0 +1,212 @@
+import asyncio
+from argparse import Namespace
+from collections.abc import Sequence
+
+import pytest
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.commands.execute_ruling_proposal import run_execute_ruling_proposal
+from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.observability.metrics import CacheMetrics
+from ai_arbitration_dao.orchestration.proposal_authorization import (
+    ProposalProof,
+    ProposalStore,
+    fetch_proposal_proofs,
+    record_onchain_proposals,
+)
+from ai_arbitration_dao.solana.account_loader import RawAccount
+from ai_arbitration_dao.solana.realms_proposals import (
+    PROPOSAL_STATE_EXECUTABLE,
+    PROPOSAL_STATE_EXECUTED,
+    REALMS_GOVERNANCE_PROGRAM_ID,
+    GovernanceProposalProof,
+    InvalidProposalProofError,
+    ProposalStateCache,
+    default_proposal_state_cache,
+    fetch_governance_proposals,
+    parse_governance_proposal_proof,
+)
+from ai_arbitration_dao.types import CommandStatus
+
+GOVERNANCE = Pubkey(bytes([7]) * 32)
+OTHER_GOVERNANCE = Pubkey(bytes([8]) * 32)
+VOTING = 2
+
+
+def _proposal_id(index: int) -> str:
+    return str(Pubkey(bytes([index]) * 32))
+
+
+def _proposal_data(
+    state: int, *, account_type: int = 14, size: int = 120, governance: Pubkey = GOVERNANCE
+) -> bytes:
+    data = bytearray(size)
+    data[0] = account_type
+    data[1:33] = bytes(governance)
+    data[65] = state
+    return bytes(data)
+
+
+class FakeLoader:
+    def __init__(self, accounts: dict[str, RawAccount]) -> None:
+        self.accounts = accounts
+        self.requests: list[list[str]] = []
+
+    async def load_accounts(self, addresses: Sequence[str]) -> list[RawAccount | None]:
+        self.requests.append(list(addresses))
+        return [self.accounts.get(address) for address in addresses]
+
+
+def _account(state: int, **kwargs: object) -> RawAccount:
+    return RawAccount(REALMS_GOVERNANCE_PROGRAM_ID, _proposal_data(state, **kwargs))
+
+
+def test_parse_governance_proposal_proof_matches_program_rules() -> None:
+    proof = parse_governance_proposal_proof(
+        REALMS_GOVERNANCE_PROGRAM_ID, _proposal_data(PROPOSAL_STATE_EXECUTABLE, size=66)
+    )
+
+    assert proof == GovernanceProposalProof(str(GOVERNANCE), PROPOSAL_STATE_EXECUTABLE)
+    assert proof.passed
+    assert not GovernanceProposalProof(str(GOVERNANCE), VOTING).passed
+    for owner, data in (
+        (str(GOVERNANCE), _proposal_data(PROPOSAL_STATE_EXECUTED)),
+        (REALMS_GOVERNANCE_PROGRAM_ID, _proposal_data(PROPOSAL_STATE_EXECUTED)[:65]),
+        (REALMS_GOVERNANCE_PROGRAM_ID, _proposal_data(PROPOSAL_STATE_EXECUTED, account_type=6)),
+    ):
+        with pytest.raises(InvalidProposalProofError):
+            parse_governance_proposal_proof(owner, data)
+
+
+def test_fetch_proposal_proofs_uses_one_load_for_many_proposals() -> None:
+    accounts = {_proposal_id(index): _account(PROPOSAL_STATE_EXECUTED) for index in range(1, 6)}
+    accounts[_proposal_id(6)] = _account(VOTING)
+    accounts[_proposal_id(7)] = _account(PROPOSAL_STATE_EXECUTED, account_type=6)
+    loader = FakeLoader(accounts)
+    requested = [_proposal_id(index) for index in range(1, 9)]
+
+    proofs = asyncio.run(
+        fetch_proposal_proofs(loader, requested + requested[:2], governance=str(GOVERNANCE))
+    )
+
+    assert loader.requests == [requested]
+    assert sorted(proofs) == sorted(requested[:6])
+    assert proofs[_proposal_id(1)].executed
+    assert not proofs[_proposal_id(6)].executed
+
+
+def test_cache_keeps_executed_states_and_rechecks_executable_ones() -> None:
+    now = [0.0]
+    cache = ProposalStateCache(
+        recheck_seconds=10.0, clock=lambda: now[0], metrics=CacheMetrics("t")
+    )
+    executed, executable, voting = _proposal_id(1), _proposal_id(2), _proposal_id(3)
+    loader = FakeLoader(
+        {
+            executed: _account(PROPOSAL_STATE_EXECUTED),
+            executable: _account(PROPOSAL_STATE_EXECUTABLE),
+            voting: _account(VOTING),
+        }
+    )
+    ids = [executed, executable, voting]
+
+    asyncio.run(fetch_governance_proposals(loader, ids, cache=cache))
+    asyncio.run(fetch_governance_proposals(loader, ids, cache=cache))
+    now[0] = 10.0
+    proofs = asyncio.run(fetch_governance_proposals(loader, ids, cache=cache))
+
+    assert loader.requests == [ids, [voting], [executable, voting]]
+    assert {proposal_id: proof.state for proposal_id, proof in proofs.items()} == {
+        executed: PROPOSAL_STATE_EXECUTED,
+        executable: PROPOSAL_STATE_EXECUTABLE,
+        voting: VOTING,
+    }
+
+
+def test_record_onchain_proposals_adds_and_promotes_without_downgrading() -> None:
+    store = ProposalStore()
+    store.add_proposal(ProposalProof("known", "executed-governance-proposal", False, "d", 0))
+    store.add_proposal(ProposalProof("done", "executed-governance-proposal", True))
+
+    record_onchain_proposals(
+        store,
+        [
+            ProposalProof("known", "executed-governance-proposal", True),
+            ProposalProof("done", "executed-governance-proposal", False),
+            ProposalProof("new", "executed-governance-proposal", False),
+        ],
+    )
+
+    assert store.get_proposal("known") == ProposalProof(
+        "known", "executed-governance-proposal", True, "d", 0
+    )
+    assert store.get_proposal("done") == ProposalProof("done", "executed-governance-proposal", True)
+    assert store.get_proposal("new") == ProposalProof("new", "executed-governance-proposal", False)
+
+
+def _args(proposal_id: str, **overrides: object) -> Namespace:
+    base = {
+        "proposal_id": proposal_id,
+        "already_ruled": False,
+        "dispute_id": "dispute-1",
+        "round": 0,
+        "proposal_proof": None,
+        "governance_address": str(GOVERNANCE),
+    }
+    base.update(overrides)
+    return Namespace(**base)
+
+
+def test_execute_reads_executed_state_from_the_proposal_account() -> None:
+    default_proposal_state_cache().clear()
+    passed, voting, missing = _proposal_id(11), _proposal_id(12), _proposal_id(13)
+    loader = FakeLoader({passed: _account(PROPOSAL_STATE_EXECUTED), voting: _account(VOTING)})
+    settings = AppSettings()
+
+    executed = run_execute_ruling_proposal(_args(passed), settings, loader=loader)
+    rejected = run_execute_ruling_proposal(_args(voting), settings, loader=loader)
+    unknown = run_execute_ruling_proposal(_args(missing), settings, loader=loader)
+    invalid = run_execute_ruling_proposal(_args("prop-123"), settings, loader=loader)
+
+    assert executed.status == CommandStatus.EXECUTED
+    assert rejected.status == CommandStatus.FAILED
+    assert "not executed" in str(rejected.details["reason"])
+    assert unknown.status == CommandStatus.FAILED
+    assert "not a Realms ProposalV2 account" in str(unknown.details["reason"])
+    assert invalid.details["reason"] == "proposal_id must be a valid Solana public key"
+    assert loader.requests == [[passed], [voting], [missing]]
+
+
+def test_fetch_proposal_proofs_rejects_proposals_of_another_governance() -> None:
+    ours, theirs = _proposal_id(21), _proposal_id(22)
+    loader = FakeLoader(
+        {
+            ours: _account(PROPOSAL_STATE_EXECUTED),
+            theirs: _account(PROPOSAL_STATE_EXECUTED, governance=OTHER_GOVERNANCE),
+        }
+    )
+
+    proofs = asyncio.run(fetch_proposal_proofs(loader, [ours, theirs], governance=str(GOVERNANCE)))
+
+    assert sorted(proofs) == [ours]
+
+
+def test_execute_rejects_passed_proposal_of_another_governance() -> None:
+    default_proposal_state_cache().clear()
+    foreign = _proposal_id(23)
+    loader = FakeLoader({foreign: _account(PROPOSAL_STATE_EXECUTED, governance=OTHER_GOVERNANCE)})
+    settings = AppSettings()
+
+    result = run_execute_ruling_proposal(_args(foreign), settings, loader=loader)
+    unbound = run_execute_ruling_proposal(
+        _args(foreign, governance_address=None), settings, loader=loader
+    )
+
+    assert result.status == CommandStatus.FAILED
+    assert result.details["reason"] == (
+        f"proposal not found: {foreign} is not a Realms ProposalV2 account "
+        f"of governance {GOVERNANCE}"
+    )
+    assert unbound.status == CommandStatus.FAILED
+    assert unbound.details["reason"] == "governance_address is required"
+    assert loader.requests == [[foreign]]
@@ -1,9 +1,22 @@
+import struct
 from argparse import Namespace
+from pathlib import Path
+
+from solders.pubkey import Pubkey
 
 from ai_arbitration_dao.commands.reconcile_agent_runtime import run_reconcile_agent_runtime
 from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.domain import RulingOutcome, create_audit_artifact
+from ai_arbitration_dao.orchestration.round_safety import RoundSafetyStore
+from ai_arbitration_dao.solana.account_loader import RawAccount
+from ai_arbitration_dao.solana.accounts import CHALLENGE_DISCRIMINATOR
+from ai_arbitration_dao.storage.audit_log import open_audit_log
 from ai_arbitration_dao.types import CommandStatus
 
+DISPUTE_A = str(Pubkey(bytes([1]) * 32))
+DISPUTE_B = str(Pubkey(bytes([2]) * 32))
+DISPUTE_C = str(Pubkey(bytes([3]) * 32))
+
 
 def _settings() -> AppSettings:
     return AppSettings()
@@ -52,3 +65,107 @@ def test_reconcile_agent_runtime_rejects_boolean_round() -> None:
 
     assert result.status == CommandStatus.FAILED
     assert result.details["error"] == "round must be an integer"
+
+
+def _challenge(round: int, ruling_recorded_for_round: int) -> RawAccount:
+    data = (
+        CHALLENGE_DISCRIMINATOR
+        + bytes([9]) * 64
+        + struct.pack("<QBqq", 1_000, round, 10, 20)
+        + b"\x00"
+        + bytes([ruling_recorded_for_round, 255])
+    )
+    return RawAccount(_settings().safe_treasury_program_id, data)
+
+
+class FakeProgramLoader:
+    def __init__(self, accounts: list[tuple[str, RawAccount]]) -> None:
+        self.accounts = accounts
+        self.scans: list[tuple[str, bytes]] = []
+
+    async def load_program_accounts(
+        self, program_id: str, discriminator: bytes
+    ) -> list[tuple[str, RawAccount]]:
+        self.scans.append((program_id, discriminator))
+        return self.accounts
+
+
+def test_reconcile_all_reports_only_diverged_rounds() -> None:
+    store = RoundSafetyStore()
+    store.record_ruling(DISPUTE_A, 0, "hash-a")
+    store.record_ruling(DISPUTE_C, 0, "hash-c")
+    loader = FakeProgramLoader(
+        [
+            (DISPUTE_A, _challenge(round=0, ruling_recorded_for_round=1)),
+            (DISPUTE_B, _challenge(round=1, ruling_recorded_for_round=1)),
+        ]
+    )
+
+    result = run_reconcile_agent_runtime(
+        Namespace(all=True), _settings(), loader=loader, store=store
+    )
+
+    assert result.status == CommandStatus.PENDING
+    assert result.details["scanned"] == 2
+    assert result.details["diverged"] == [
+        {
+            "dispute_id": DISPUTE_B,
+            "round": 0,
+            "local_status": "pending",
+            "chain_status": "executed",
+            "reconciled_status": "executed",
+        },
+        {
+            "dispute_id": DISPUTE_C,
+            "round": 0,
+            "local_status": "executed",
+            "chain_status": None,
+            "reconciled_status": "executed",
+            "error": "challenge account not found",
+        },
+    ]
+    assert loader.scans == [(_settings().safe_treasury_program_id, CHALLENGE_DISCRIMINATOR)]
+
+
+def test_reconcile_all_in_sync_is_executed() -> None:
+    store = RoundSafetyStore()
+    store.record_ruling(DISPUTE_A, 0, "hash-a")
+    loader = FakeProgramLoader([(DISPUTE_A, _challenge(round=1, ruling_recorded_for_round=1))])
+
+    result = run_reconcile_agent_runtime(
+        Namespace(all=True), _settings(), loader=loader, store=store
+    )
+
+    assert result.status == CommandStatus.EXECUTED
+    assert result.details["diverged"] == []
+
+
+def test_reconcile_all_reads_local_state_from_the_audit_log(tmp_path: Path) -> None:
+    settings = AppSettings(audit_log_path=str(tmp_path))
+    open_audit_log(settings.audit_log_path).append(
+        create_audit_artifact(
+            proposal_id="prop-1",
+            tx_signature="sig-1",
+            payload_hash="a" * 64,
+            dispute_id=DISPUTE_A,
+            round=0,
+            outcome=RulingOutcome.ALLOW,
+        )
+    )
+    loader = FakeProgramLoader([(DISPUTE_A, _challenge(round=1, ruling_recorded_for_round=1))])
+
+    result = run_reconcile_agent_runtime(Namespace(all=True), settings, loader=loader)
+
+    assert result.status == CommandStatus.EXECUTED
+    assert result.details["scanned"] == 1
+    assert result.details["diverged"] == []
+
+
+def test_reconcile_all_fails_without_local_state() -> None:
+    loader = FakeProgramLoader([(DISPUTE_A, _challenge(round=1, ruling_recorded_for_round=1))])
+
+    result = run_reconcile_agent_runtime(Namespace(all=True), _settings(), loader=loader)
+
+    assert result.status == CommandStatus.FAILED
+    assert "AUDIT_LOG_PATH" in str(result.details["error"])
+    assert loader.scans == []
@@ -1,7 +1,12 @@
 from argparse import Namespace
+from collections.abc import Sequence
+
+from solders.pubkey import Pubkey
 
 from ai_arbitration_dao.commands.bind_resolver import run_bind_resolver
 from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.solana.account_loader import RawAccount
+from ai_arbitration_dao.solana.accounts import SAFE_POLICY_DISCRIMINATOR, SAFE_POLICY_SIZE
 from ai_arbitration_dao.types import CommandStatus
 
 VALID_GOVERNANCE_ADDRESS = "11111111111111111111111111111111"
@@ -47,3 +52,111 @@ def test_resolver_binding_fails_on_invalid_pubkey() -> None:
 
     assert result.status == CommandStatus.FAILED
     assert "valid Solana public key" in str(result.details["error"])
+
+
+SAFE_A = str(Pubkey(bytes([1]) * 32))
+SAFE_B = str(Pubkey(bytes([2]) * 32))
+SAFE_C = str(Pubkey(bytes([3]) * 32))
+
+
+def _safe_policy(resolver: str) -> RawAccount:
+    data = (
+        SAFE_POLICY_DISCRIMINATOR
+        + bytes([9]) * 32
+        + bytes(Pubkey.from_string(resolver))
+        + bytes(SAFE_POLICY_SIZE - 64)
+    )
+    return RawAccount(_settings().safe_treasury_program_id, data)
+
+
+class FakeLoader:
+    def __init__(self, accounts: dict[str, RawAccount]) -> None:
+        self.accounts = accounts
+        self.requests: list[list[str]] = []
+        self.scans: list[tuple[str, bytes]] = []
+
+    async def load_accounts(self, addresses: Sequence[str]) -> list[RawAccount | None]:
+        self.requests.append(list(addresses))
+        return [self.accounts.get(address) for address in addresses]
+
+    async def load_program_accounts(
+        self, program_id: str, discriminator: bytes
+    ) -> list[tuple[str, RawAccount]]:
+        self.scans.append((program_id, discriminator))
+        return list(self.accounts.items())
+
+
+def test_bulk_resolver_binding_reports_every_mismatch() -> None:
+    loader = FakeLoader(
+        {
+            SAFE_A: _safe_policy(VALID_GOVERNANCE_ADDRESS),
+            SAFE_B: _safe_policy(VALID_RESOLVER_ADDRESS),
+        }
+    )
+    args = Namespace(governance_address=VALID_GOVERNANCE_ADDRESS, safes=[SAFE_A, SAFE_B, SAFE_C])
+
+    result = run_bind_resolver(args, _settings(), loader=loader)
+
+    assert result.status == CommandStatus.FAILED
+    assert result.details["checked"] == 3
+    assert result.details["mismatches"] == [
+        {
+            "safe": SAFE_B,
+            "error": "resolver mismatch",
+            "actual_resolver_address": VALID_RESOLVER_ADDRESS,
+        },
+        {"safe": SAFE_C, "error": "safe policy account not found"},
+    ]
+    assert loader.requests == [[SAFE_A, SAFE_B, SAFE_C]]
+
+
+def test_bulk_resolver_binding_scans_all_safe_policies() -> None:
+    loader = FakeLoader(
+        {
+            SAFE_A: _safe_policy(VALID_GOVERNANCE_ADDRESS),
+            SAFE_B: _safe_policy(VALID_GOVERNANCE_ADDRESS),
+        }
+    )
+    args = Namespace(governance_address=VALID_GOVERNANCE_ADDRESS, all=True)
+
+    result = run_bind_resolver(args, _settings(), loader=loader)
+
+    assert result.status == CommandStatus.EXECUTED
+    assert result.details["checked"] == 2
+    assert loader.scans == [(_settings().safe_treasury_program_id, SAFE_POLICY_DISCRIMINATOR)]
+
+
+def test_bulk_resolver_binding_coerces_all_from_batch_strings() -> None:
+    loader = FakeLoader({SAFE_A: _safe_policy(VALID_GOVERNANCE_ADDRESS)})
+
+    scanned = run_bind_resolver(
+        Namespace(governance_address=VALID_GOVERNANCE_ADDRESS, all="true"),
+        _settings(),
+        loader=loader,
+    )
+    rejected = run_bind_resolver(
+        Namespace(governance_address=VALID_GOVERNANCE_ADDRESS, all="everything"),
+        _settings(),
+        loader=loader,
+    )
+
+    assert scanned.status == CommandStatus.EXECUTED
+    assert scanned.details["checked"] == 1
+    assert rejected.status == CommandStatus.FAILED
+    assert rejected.details["error"] == "all must be a boolean value"
+
+
+def test_bulk_resolver_binding_reports_every_invalid_safe() -> None:
+    loader = FakeLoader({})
+    args = Namespace(
+        governance_address=VALID_GOVERNANCE_ADDRESS, safes=[SAFE_A, "not-a-key", "  ", SAFE_B]
+    )
+
+    result = run_bind_resolver(args, _settings(), loader=loader)
+
+    assert result.status == CommandStatus.FAILED
+    assert result.details["invalid_safes"] == [
+        {"index": 1, "error": "safe[1] must be a valid Solana public key"},
+        {"index": 2, "error": "safe[2] is required"},
+    ]
+    assert loader.requests == []
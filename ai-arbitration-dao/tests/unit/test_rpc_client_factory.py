@@ -0,0 +1,71 @@
+import asyncio
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from _rpc_stub import RpcStandIn, serving
+
+from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.solana.rpc_client import RpcClientFactory
+
+
+class _CountingRpc(RpcStandIn):
+    def __init__(self) -> None:
+        super().__init__()
+        self.active = 0
+        self.max_active = 0
+
+    def respond(self, request: Any) -> Any:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return {"jsonrpc": "2.0", "result": 4242, "id": request["id"]}
+
+
+@pytest.fixture
+def rpc_server() -> Iterator[_CountingRpc]:
+    with serving(_CountingRpc()) as (server,):
+        yield server
+
+
+def test_factory_shares_one_client_per_url(rpc_server: _CountingRpc) -> None:
+    async def scenario() -> None:
+        async with RpcClientFactory(AppSettings(solana_rpc_url=rpc_server.url)) as factory:
+            client = factory.create()
+            assert factory.create() is client
+            assert factory.create(rpc_server.url) is client
+            assert factory.create("http://127.0.0.1:1") is not client
+            assert (await client.get_slot()).value == 4242
+
+    asyncio.run(scenario())
+
+
+def test_factory_bounds_concurrency_and_reuses_connections(rpc_server: _CountingRpc) -> None:
+    settings = AppSettings(solana_rpc_url=rpc_server.url, rpc_max_concurrency=3)
+
+    async def scenario() -> list[int]:
+        async with RpcClientFactory(settings) as factory:
+            slots = await asyncio.gather(*(factory.create().get_slot() for _ in range(24)))
+            return [slot.value for slot in slots]
+
+    assert asyncio.run(scenario()) == [4242] * 24
+    assert rpc_server.max_active <= 3
+    assert len(rpc_server.connections) <= 3
+
+
+def test_factory_close_releases_clients(rpc_server: _CountingRpc) -> None:
+    async def scenario() -> None:
+        factory = RpcClientFactory(AppSettings(solana_rpc_url=rpc_server.url))
+        async with factory:
+            first = factory.create()
+            await first.get_slot()
+        second = factory.create()
+        assert second is not first
+        assert (await second.get_slot()).value == 4242
+        await factory.close()
+
+    asyncio.run(scenario())
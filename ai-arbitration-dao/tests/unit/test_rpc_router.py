@@ -0,0 +1,188 @@
+import asyncio
+import json
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from _rpc_stub import RpcStandIn, serving
+from solders.pubkey import Pubkey
+
+from ai_arbitration_dao.config import AppSettings, RpcEndpointRole, RpcEndpointSettings
+from ai_arbitration_dao.solana.rpc_client import RoutedAsyncClient, RpcClientFactory
+from ai_arbitration_dao.solana.rpc_router import LatencyWindow, RoutedEndpoint, RpcRouter
+
+READ = frozenset({RpcEndpointRole.READ})
+BOTH = frozenset(RpcEndpointRole)
+
+
+class _RoutedRpc(RpcStandIn):
+    def __init__(self, name: str, *, slot: int = 1000) -> None:
+        super().__init__()
+        self.name = name
+        self.slot = slot
+        self.delay_seconds = 0.0
+
+    def respond(self, request: Any) -> Any:
+        if request["method"] == "getSlot":
+            result: Any = self.slot
+        else:
+            time.sleep(self.delay_seconds)
+            result = {"context": {"slot": self.slot}, "value": len(self.name)}
+        return {"jsonrpc": "2.0", "result": result, "id": request["id"]}
+
+
+@pytest.fixture
+def rpc_servers() -> Iterator[tuple[_RoutedRpc, ...]]:
+    with serving(_RoutedRpc("a"), _RoutedRpc("bb")) as servers:
+        yield servers
+
+
+@dataclass
+class _Body:
+    method: str
+
+    def to_json(self) -> str:
+        return json.dumps({"jsonrpc": "2.0", "id": 1, "method": self.method, "params": []})
+
+
+def _endpoint(
+    name: str,
+    calls: list[str],
+    *,
+    roles: frozenset[RpcEndpointRole] = BOTH,
+    delay: float = 0.0,
+    latency: float | None = None,
+    fail: bool = False,
+) -> RoutedEndpoint:
+    async def send(body: Any) -> str:
+        if "getSlot" in body.to_json():
+            return json.dumps({"jsonrpc": "2.0", "result": 1, "id": 0})
+        calls.append(name)
+        await asyncio.sleep(delay)
+        if fail:
+            raise ConnectionError(f"{name} is down")
+        return name
+
+    window = LatencyWindow()
+    for _ in range(10 if latency is not None else 0):
+        window.record(latency or 0.0)
+    return RoutedEndpoint(url=name, roles=roles, send=send, latency=window)
+
+
+def test_latency_window_reports_rolling_percentiles() -> None:
+    window = LatencyWindow(size=20)
+    assert window.p50 is None
+    for value in range(1, 41):
+        window.record(value / 1000)
+
+    assert len(window) == 20
+    assert window.p50 == 0.031
+    assert window.p95 == 0.04
+
+
+def test_reads_go_to_lowest_p50_and_hedge_past_its_p95() -> None:
+    calls: list[str] = []
+    backup = _endpoint("backup", calls, latency=0.2)
+    primary = _endpoint("primary", calls, latency=0.01, delay=1.0)
+    router = RpcRouter([backup, primary], hedge_reads=True)
+
+    async def scenario() -> tuple[str, float]:
+        started = time.monotonic()
+        winner = await router.request(_Body("getBalance"))
+        return winner, time.monotonic() - started
+
+    winner, elapsed = asyncio.run(scenario())
+
+    assert [endpoint.url for endpoint in router.ranked(RpcEndpointRole.READ)] == [
+        "primary",
+        "backup",
+    ]
+    assert winner == "backup"
+    assert calls == ["primary", "backup"]
+    assert elapsed < 0.5
+
+
+def test_failed_read_fails_over_and_sends_are_not_hedged() -> None:
+    calls: list[str] = []
+    down = _endpoint("down", calls, roles=READ, latency=0.001, fail=True)
+    sender = _endpoint("sender", calls, latency=0.05)
+    router = RpcRouter([down, sender])
+
+    assert asyncio.run(router.request(_Body("getAccountInfo"))) == "sender"
+    assert calls == ["down", "sender"]
+    assert down.failures == 1
+
+    calls.clear()
+    assert asyncio.run(router.request(_Body("sendTransaction"))) == "sender"
+    assert calls == ["sender"]
+
+    with pytest.raises(ValueError, match="send role"):
+        RpcRouter([down])
+
+
+def test_check_slots_ejects_lagging_and_silent_endpoints() -> None:
+    async def send_slot(slot: int | None) -> Any:
+        async def send(body: Any) -> str:
+            if slot is None:
+                raise ConnectionError("down")
+            return json.dumps({"jsonrpc": "2.0", "result": slot, "id": 0})
+
+        return send
+
+    async def scenario() -> RpcRouter:
+        endpoints = [
+            RoutedEndpoint(url=url, roles=BOTH, send=await send_slot(slot), latency=LatencyWindow())
+            for url, slot in (("tip", 5000), ("near", 4990), ("lagging", 4000), ("down", None))
+        ]
+        router = RpcRouter(endpoints, max_slot_lag=50)
+        await router.check_slots()
+        return router
+
+    router = asyncio.run(scenario())
+
+    assert [(e["url"], e["slot"], e["ejected"]) for e in router.snapshot()] == [
+        ("tip", 5000, False),
+        ("near", 4990, False),
+        ("lagging", 4000, True),
+        ("down", None, True),
+    ]
+    assert [endpoint.url for endpoint in router.ranked(RpcEndpointRole.READ)][2:] == [
+        "lagging",
+        "down",
+    ]
+
+
+def test_factory_routes_reads_across_http_endpoints(
+    rpc_servers: tuple[_RoutedRpc, ...],
+) -> None:
+    lagging, healthy = rpc_servers
+    lagging.slot = 10
+    settings = AppSettings(
+        solana_rpc_endpoints=[
+            RpcEndpointSettings(url=lagging.url),
+            RpcEndpointSettings(url=healthy.url, roles=READ),
+        ]
+    )
+    pubkey = Pubkey(bytes([3]) * 32)
+
+    async def scenario() -> list[int]:
+        async with RpcClientFactory(settings) as factory:
+            client = factory.create()
+            assert isinstance(client, RoutedAsyncClient)
+            assert factory.create() is client
+            await client.router.check_slots()
+            balances = [(await client.get_balance(pubkey)).value for _ in range(5)]
+            lagging.slot = healthy.slot
+            await client.router.check_slots()
+            for endpoint, seconds in zip(client.router.endpoints, (0.05, 0.01), strict=True):
+                for _ in range(20):
+                    endpoint.latency.record(seconds)
+            healthy.delay_seconds = 1.0
+            balances.append((await client.get_balance(pubkey)).value)
+            return balances
+
+    # Ejected while lagging; once caught up, it wins the hedge against a stalled primary.
+    assert asyncio.run(scenario()) == [2, 2, 2, 2, 2, 1]
+    assert [post["method"] for post in lagging.posts].count("getBalance") == 1
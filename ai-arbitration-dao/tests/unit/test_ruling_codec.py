@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from ai_arbitration_dao.solana.instruction_codecs.ruling import (
+    RECORD_RULING_SIZE,
+    RecordRulingPayload,
+    decode_many,
+    decode_many_array,
+    encode_many,
+)
+
+
+def _reference_bytes(payload: RecordRulingPayload) -> bytes:
+    return b"".join(
+        (
+            int(payload.payout_id).to_bytes(8, byteorder="little", signed=False),
+            int(payload.round).to_bytes(1, byteorder="little", signed=False),
+            int(payload.outcome).to_bytes(1, byteorder="little", signed=False),
+            bytes([1 if payload.is_final else 0]),
+        )
+    )
+
+
+def _random_payloads(count: int) -> list[RecordRulingPayload]:
+    rng = random.Random(17)
+    return [
+        RecordRulingPayload(
+            payout_id=rng.choice([0, 2**64 - 1, rng.randrange(2**64)]),
+            round=rng.randrange(256),
+            outcome=rng.randrange(2),
+            is_final=rng.random() < 0.5,
+        )
+        for _ in range(count)
+    ]
+
+
+def test_to_bytes_matches_reference_encoding_and_round_trips() -> None:
+    for payload in _random_payloads(500):
+        encoded = payload.to_bytes()
+        assert encoded == _reference_bytes(payload)
+        assert RecordRulingPayload.from_bytes(memoryview(encoded)) == payload
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"payout_id": -1},
+        {"payout_id": 2**64},
+        {"round": 256},
+        {"outcome": -1},
+    ],
+)
+def test_to_bytes_keeps_overflow_semantics(fields: dict[str, int]) -> None:
+    payload = RecordRulingPayload(
+        **{"payout_id": 1, "round": 0, "outcome": 0, "is_final": False, **fields}
+    )
+    with pytest.raises(OverflowError):
+        _reference_bytes(payload)
+    with pytest.raises(OverflowError):
+        payload.to_bytes()
+    with pytest.raises(OverflowError):
+        encode_many([payload])
+
+
+def test_encode_many_and_decode_many_round_trip_in_one_buffer() -> None:
+    payloads = _random_payloads(1000)
+
+    buffer = encode_many(payloads)
+
+    assert bytes(buffer) == b"".join(payload.to_bytes() for payload in payloads)
+    assert decode_many(memoryview(buffer)) == payloads
+    assert RecordRulingPayload.from_bytes(buffer, 3 * RECORD_RULING_SIZE) == payloads[3]
+
+
+def test_encode_many_writes_into_preallocated_buffer_at_offset() -> None:
+    payloads = _random_payloads(3)
+    out = bytearray(b"\xff" * (4 + 3 * RECORD_RULING_SIZE))
+
+    assert encode_many(payloads, out, offset=4) is out
+    assert out[:4] == b"\xff" * 4
+    assert decode_many(memoryview(out)[4:]) == payloads
+
+    with pytest.raises(ValueError, match="too small"):
+        encode_many(payloads, bytearray(RECORD_RULING_SIZE))
+
+
+def test_decoders_reject_truncated_buffers() -> None:
+    encoded = encode_many(_random_payloads(2))
+    with pytest.raises(ValueError):
+        RecordRulingPayload.from_bytes(encoded[:-1], RECORD_RULING_SIZE)
+    with pytest.raises(ValueError, match="not a multiple"):
+        decode_many(encoded[:-1])
+
+
+def test_decode_many_array_views_records_as_structured_array() -> None:
+    pytest.importorskip("numpy")
+    payloads = _random_payloads(50)
+
+    records = decode_many_array(bytes(encode_many(payloads)))
+
+    assert records.shape == (50,)
+    assert records["payout_id"].tolist() == [payload.payout_id for payload in payloads]
+    assert records["round"].tolist() == [payload.round for payload in payloads]
+    assert records["is_final"].tolist() == [payload.is_final for payload in payloads]
@@ -1,7 +1,37 @@
+import hashlib
+import json
+import random
+
 import pytest
 
 from ai_arbitration_dao.domain.dispute_snapshot import DisputeSnapshot, RulingOutcome
-from ai_arbitration_dao.domain.ruling_payload import compile_ruling_payload
+from ai_arbitration_dao.domain.ruling_payload import (
+    compile_ruling_payload,
+    compile_ruling_payloads,
+)
+
+# Quotes, backslashes, control characters, non-ASCII, astral and lone-surrogate code points.
+_SPECIAL_CHARACTERS = '"\\/\b\f\n\r\t\x00\x1f\x7f\u00e9\u2028\u4e2d\U0001f600\ud800'
+
+
+def _reference(snapshot: DisputeSnapshot, is_final: bool) -> str:
+    payload_data = {**snapshot.canonical_fields(), "is_final": is_final}
+    return json.dumps(payload_data, sort_keys=True, separators=(",", ":"))
+
+
+def _random_text(rng: random.Random) -> str:
+    alphabet = "abcXYZ019-_:" + _SPECIAL_CHARACTERS
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 24)))
+
+
+def _random_snapshot(rng: random.Random) -> DisputeSnapshot:
+    return DisputeSnapshot(
+        safe=_random_text(rng),
+        payout_id=rng.choice([0, 1, 2**63 - 1, 2**64, rng.randrange(10**30)]),
+        dispute_id=_random_text(rng),
+        round=rng.randrange(256),
+        outcome=rng.choice(list(RulingOutcome)),
+    )
 
 
 def test_payload_is_deterministic_for_identical_input() -> None:
@@ -70,3 +100,40 @@ def test_payload_rejects_negative_round() -> None:
 
     with pytest.raises(ValueError, match="round must be non-negative"):
         compile_ruling_payload(snapshot, is_final=False)
+
+
+def test_canonical_encoder_matches_json_dumps_for_random_snapshots() -> None:
+    rng = random.Random(20240611)
+
+    for _ in range(5000):
+        snapshot = _random_snapshot(rng)
+        is_final = rng.random() < 0.5
+
+        payload = compile_ruling_payload(snapshot, is_final=is_final)
+
+        expected = _reference(snapshot, is_final)
+        assert payload.serialized == expected
+        assert payload.payload_hash == hashlib.sha256(expected.encode("utf-8")).hexdigest()
+
+
+def test_canonical_encoder_falls_back_for_non_schema_types() -> None:
+    snapshot = DisputeSnapshot(
+        safe="safe111",
+        payout_id=True,
+        dispute_id="dispute-abc",
+        round=0,
+        outcome=RulingOutcome.DENY,
+    )
+
+    payload = compile_ruling_payload(snapshot, is_final=1)  # type: ignore[arg-type]
+
+    assert payload.serialized == _reference(snapshot, 1)  # type: ignore[arg-type]
+
+
+def test_batch_compilation_matches_single_payloads() -> None:
+    rng = random.Random(7)
+    snapshots = [_random_snapshot(rng) for _ in range(200)]
+
+    payloads = compile_ruling_payloads(snapshots, is_final=True)
+
+    assert payloads == [compile_ruling_payload(item, is_final=True) for item in snapshots]
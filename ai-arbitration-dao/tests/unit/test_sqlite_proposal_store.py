@@ -0,0 +1,195 @@
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from ai_arbitration_dao.commands.execute_ruling_proposal import run_execute_ruling_proposal
+from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.orchestration.proposal_authorization import (
+    EXECUTED_GOVERNANCE_PROOF_TYPE,
+    ProposalProof,
+    authorize_ruling_write,
+)
+from ai_arbitration_dao.storage.proposal_store import (
+    ProposalBindingConflictError,
+    SqliteProposalStore,
+)
+from ai_arbitration_dao.types import CommandStatus
+
+
+def _proof(proposal_id: str, *, executed: bool = True, round: int = 0) -> ProposalProof:
+    return ProposalProof(
+        proposal_id=proposal_id,
+        proof_type=EXECUTED_GOVERNANCE_PROOF_TYPE,
+        executed=executed,
+        dispute_id=f"dispute-{proposal_id}",
+        round=round,
+    )
+
+
+def test_store_persists_proposals_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "proposals.db"
+    store = SqliteProposalStore(path)
+    store.add_proposal(_proof("prop-1", executed=False))
+    store.close()
+
+    reopened = SqliteProposalStore(path)
+    stored = reopened.get_proposal("prop-1")
+
+    assert stored == _proof("prop-1", executed=False)
+    assert reopened.get_proposal("missing") is None
+
+
+def test_store_uses_wal_journal_mode(tmp_path: Path) -> None:
+    store = SqliteProposalStore(tmp_path / "proposals.db")
+
+    mode = store._connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert mode == "wal"
+
+
+def test_mark_executed_updates_durable_record(tmp_path: Path) -> None:
+    path = tmp_path / "proposals.db"
+    store = SqliteProposalStore(path)
+    store.add_proposal(_proof("prop-1", executed=False))
+    assert store.get_proposal("prop-1") is not None
+
+    assert store.mark_executed("prop-1") is True
+    assert store.mark_executed("missing") is False
+
+    stored = SqliteProposalStore(path).get_proposal("prop-1")
+    assert stored is not None
+    assert stored.executed is True
+
+
+def test_bulk_add_and_get(tmp_path: Path) -> None:
+    store = SqliteProposalStore(tmp_path / "proposals.db", cache_size=10)
+    proofs = [_proof(f"prop-{index}") for index in range(1200)]
+
+    store.add_proposals(proofs)
+    found = store.get_proposals([proof.proposal_id for proof in proofs] + ["missing"])
+
+    assert len(found) == 1200
+    assert found["prop-777"] == proofs[777]
+    assert "missing" not in found
+
+
+def test_cache_is_bounded(tmp_path: Path) -> None:
+    store = SqliteProposalStore(tmp_path / "proposals.db", cache_size=3)
+
+    store.add_proposals(_proof(f"prop-{index}") for index in range(10))
+    store.get_proposal("prop-0")
+
+    assert list(store._cache) == ["prop-8", "prop-9", "prop-0"]
+
+
+def test_secondary_index_lookups(tmp_path: Path) -> None:
+    store = SqliteProposalStore(tmp_path / "proposals.db")
+    store.add_proposals(
+        [
+            ProposalProof("prop-a", EXECUTED_GOVERNANCE_PROOF_TYPE, True, "dispute-1", 0),
+            ProposalProof("prop-b", EXECUTED_GOVERNANCE_PROOF_TYPE, False, "dispute-1", 0),
+            ProposalProof("prop-c", EXECUTED_GOVERNANCE_PROOF_TYPE, False, "dispute-1", 1),
+        ]
+    )
+
+    by_dispute = store.proposals_for_dispute("dispute-1", 0)
+    pending = store.proposals_by_execution(executed=False)
+
+    assert [proof.proposal_id for proof in by_dispute] == ["prop-a", "prop-b"]
+    assert [proof.proposal_id for proof in pending] == ["prop-b", "prop-c"]
+    plan = store._connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM proposals WHERE dispute_id = ? AND round = ?",
+        ("dispute-1", 0),
+    ).fetchall()
+    assert any("proposals_dispute_round" in str(row) for row in plan)
+
+
+def test_writers_sharing_the_database_cannot_rebind_a_proposal(tmp_path: Path) -> None:
+    path = tmp_path / "proposals.db"
+    first, second = SqliteProposalStore(path), SqliteProposalStore(path)
+    first.add_proposal(_proof("prop-1", executed=False))
+
+    rebound = ProposalProof("prop-1", EXECUTED_GOVERNANCE_PROOF_TYPE, True, "dispute-other", 0)
+    with pytest.raises(ProposalBindingConflictError, match="prop-1"):
+        second.add_proposals([_proof("prop-2"), rebound])
+    second.add_proposal(ProposalProof("prop-1", EXECUTED_GOVERNANCE_PROOF_TYPE, True))
+
+    assert second.get_proposal("prop-2") is None
+    assert second.get_proposal("prop-1") == _proof("prop-1")
+    assert SqliteProposalStore(path).get_proposal("prop-1") == _proof("prop-1")
+    second.add_proposal(_proof("prop-1", executed=False))
+    assert second.get_proposal("prop-1") == _proof("prop-1")
+
+
+def test_authorize_ruling_write_against_durable_store(tmp_path: Path) -> None:
+    store = SqliteProposalStore(tmp_path / "proposals.db")
+    store.add_proposal(_proof("prop-1", executed=False))
+    proof = {
+        "proposal_id": "prop-1",
+        "executed": True,
+        "dispute_id": "dispute-prop-1",
+        "round": 0,
+    }
+
+    status, error = authorize_ruling_write(store, proof, "dispute-prop-1", 0)
+    assert status == CommandStatus.FAILED
+    assert "not marked as executed" in str(error)
+
+    store.mark_executed("prop-1")
+    status, error = authorize_ruling_write(store, proof, "dispute-prop-1", 0)
+    assert status == CommandStatus.PENDING
+    assert error is None
+
+
+def _execute_args(proposal_id: str, dispute_id: str, round: int) -> Namespace:
+    return Namespace(
+        proposal_id=proposal_id,
+        already_ruled=False,
+        dispute_id=dispute_id,
+        round=round,
+        proposal_proof={
+            "proposal_id": proposal_id,
+            "executed": True,
+            "dispute_id": dispute_id,
+            "round": round,
+        },
+    )
+
+
+def test_execute_command_authorizes_only_against_recorded_history(tmp_path: Path) -> None:
+    settings = AppSettings(proposal_store_path=str(tmp_path / "proposals.db"))
+    history = SqliteProposalStore(settings.proposal_store_path)
+
+    unknown = run_execute_ruling_proposal(_execute_args("prop-9", "dispute-9", 2), settings)
+    assert unknown.status == CommandStatus.FAILED
+    assert "proposal not found" in str(unknown.details["reason"])
+    assert history.get_proposal("prop-9") is None
+
+    history.add_proposal(
+        ProposalProof("prop-9", EXECUTED_GOVERNANCE_PROOF_TYPE, True, "dispute-9", 2)
+    )
+    recorded = run_execute_ruling_proposal(_execute_args("prop-9", "dispute-9", 2), settings)
+    assert recorded.status == CommandStatus.EXECUTED
+
+    history.add_proposal(
+        ProposalProof("prop-10", EXECUTED_GOVERNANCE_PROOF_TYPE, False, "dispute-10", 0)
+    )
+    rejected = run_execute_ruling_proposal(_execute_args("prop-10", "dispute-10", 0), settings)
+    assert rejected.status == CommandStatus.FAILED
+    assert "not marked as executed" in str(rejected.details["reason"])
+
+
+def test_execute_command_rejects_proposal_recorded_for_another_dispute(tmp_path: Path) -> None:
+    settings = AppSettings(proposal_store_path=str(tmp_path / "proposals.db"))
+    SqliteProposalStore(settings.proposal_store_path).add_proposal(
+        ProposalProof("prop-1", EXECUTED_GOVERNANCE_PROOF_TYPE, True, "dispute-a", 0)
+    )
+
+    cross_dispute = run_execute_ruling_proposal(_execute_args("prop-1", "dispute-b", 3), settings)
+    cross_round = run_execute_ruling_proposal(_execute_args("prop-1", "dispute-a", 3), settings)
+
+    assert cross_dispute.status == CommandStatus.FAILED
+    assert "recorded for dispute dispute-a" in str(cross_dispute.details["reason"])
+    assert cross_round.status == CommandStatus.FAILED
+    assert "recorded for round 0" in str(cross_round.details["reason"])
@@ -1,29 +1,190 @@
+import struct
 from argparse import Namespace
+from collections.abc import Sequence
+
+from solders.pubkey import Pubkey
 
 from ai_arbitration_dao.commands.verify_ruling_status import run_verify_ruling_status
 from ai_arbitration_dao.config import AppSettings
+from ai_arbitration_dao.solana.account_loader import RawAccount
+from ai_arbitration_dao.solana.accounts import (
+    CHALLENGE_DISCRIMINATOR,
+    PAYOUT_DISCRIMINATOR,
+    SAFE_POLICY_SIZE,
+    decode_payout,
+)
 from ai_arbitration_dao.types import CommandStatus
 
+DISPUTE = str(Pubkey(bytes([1]) * 32))
+PAYOUT = str(Pubkey(bytes([2]) * 32))
+SAFE = bytes([3]) * 32
+
 
 def _settings() -> AppSettings:
     return AppSettings()
 
 
+def _challenge_data(
+    payout: str = PAYOUT,
+    *,
+    round: int = 0,
+    current_outcome: int | None = None,
+    ruling_recorded_for_round: int = 0,
+) -> bytes:
+    outcome = b"\x00" if current_outcome is None else bytes([1, current_outcome])
+    return (
+        CHALLENGE_DISCRIMINATOR
+        + bytes(Pubkey.from_string(payout))
+        + bytes([4]) * 32
+        + struct.pack("<QBqq", 1_000, round, 10, 20)
+        + outcome
+        + bytes([ruling_recorded_for_round, 255])
+    )
+
+
+def _payout_data(
+    challenge: str | None = DISPUTE,
+    *,
+    status: int = 1,
+    dispute_round: int = 0,
+    finalized: bool = False,
+    final_outcome: int | None = None,
+    mint: bytes | None = None,
+) -> bytes:
+    return (
+        PAYOUT_DISCRIMINATOR
+        + struct.pack("<QQ", 7, 7)
+        + SAFE
+        + b"\x01"
+        + (b"\x00" if mint is None else b"\x01" + mint)
+        + bytes([5]) * 32
+        + struct.pack("<Q", 50)
+        + b"\x01"
+        + bytes([6]) * 32
+        + struct.pack("<Bq", status, 99)
+        + bytes(SAFE_POLICY_SIZE)
+        + (b"\x00" if challenge is None else b"\x01" + bytes(Pubkey.from_string(challenge)))
+        + bytes([dispute_round, int(finalized)])
+        + (b"\x00" if final_outcome is None else bytes([1, final_outcome]))
+        + b"\xfe"
+    )
+
+
+class FakeLoader:
+    def __init__(self, accounts: dict[str, bytes]) -> None:
+        owner = _settings().safe_treasury_program_id
+        self.accounts = {address: RawAccount(owner, data) for address, data in accounts.items()}
+        self.requests: list[list[str]] = []
+
+    async def load_accounts(self, addresses: Sequence[str]) -> list[RawAccount | None]:
+        self.requests.append(list(addresses))
+        return [self.accounts.get(address) for address in addresses]
+
+
 def _args(**overrides: object) -> Namespace:
     base = {
-        "dispute_id": "dispute-1",
+        "dispute_id": DISPUTE,
         "round": 0,
-        "expected_status": "executed",
+        "expected_status": None,
     }
     base.update(overrides)
     return Namespace(**base)
 
 
-def test_verify_ruling_status_succeeds_for_valid_input() -> None:
-    result = run_verify_ruling_status(_args(), _settings())
+def test_verify_ruling_status_reports_recorded_ruling() -> None:
+    loader = FakeLoader(
+        {
+            DISPUTE: _challenge_data(current_outcome=1, ruling_recorded_for_round=1),
+            PAYOUT: _payout_data(),
+        }
+    )
+
+    result = run_verify_ruling_status(_args(), _settings(), loader=loader)
 
     assert result.status == CommandStatus.EXECUTED
     assert result.details["verified_status"] == "executed"
+    assert result.details["current_outcome"] == "Deny"
+    assert result.details["payout_status"] == "challenged"
+    assert loader.requests == [[DISPUTE], [PAYOUT]]
+
+
+def test_verify_ruling_status_reports_pending_round() -> None:
+    loader = FakeLoader({DISPUTE: _challenge_data(), PAYOUT: _payout_data()})
+
+    result = run_verify_ruling_status(_args(), _settings(), loader=loader)
+
+    assert result.status == CommandStatus.PENDING
+    assert result.details["current_outcome"] is None
+
+
+def test_verify_ruling_status_reports_finalized_dispute() -> None:
+    loader = FakeLoader(
+        {
+            DISPUTE: _challenge_data(current_outcome=0, ruling_recorded_for_round=1),
+            PAYOUT: _payout_data(status=0, finalized=True, final_outcome=0),
+        }
+    )
+
+    result = run_verify_ruling_status(_args(round=1), _settings(), loader=loader)
+
+    assert result.status == CommandStatus.ALREADY_RULED
+    assert result.details["final_outcome"] == "Allow"
+
+
+def test_verify_ruling_status_flags_expected_status_mismatch() -> None:
+    loader = FakeLoader({DISPUTE: _challenge_data(), PAYOUT: _payout_data()})
+
+    result = run_verify_ruling_status(_args(expected_status="executed"), _settings(), loader=loader)
+
+    assert result.status == CommandStatus.FAILED
+    assert result.details["error"] == "status mismatch: expected executed, found pending"
+
+
+def test_verify_ruling_status_fails_for_missing_or_foreign_accounts() -> None:
+    loader = FakeLoader({PAYOUT: _payout_data()})
+    missing = run_verify_ruling_status(_args(), _settings(), loader=loader)
+
+    foreign = FakeLoader({DISPUTE: _challenge_data(), PAYOUT: _payout_data()})
+    foreign.accounts[DISPUTE] = RawAccount(str(Pubkey.default()), _challenge_data())
+    not_owned = run_verify_ruling_status(_args(), _settings(), loader=foreign)
+
+    assert missing.details["error"] == "challenge account not found"
+    assert not_owned.status == CommandStatus.FAILED
+    assert "not owned by the safe-treasury program" in not_owned.details["error"]
+
+
+def test_verify_ruling_status_checks_many_pairs_in_bulk() -> None:
+    disputes = [str(Pubkey(bytes([10 + index]) * 32)) for index in range(3)]
+    payouts = [str(Pubkey(bytes([20 + index]) * 32)) for index in range(3)]
+    accounts: dict[str, bytes] = {}
+    for index, (dispute, payout) in enumerate(zip(disputes, payouts, strict=True)):
+        accounts[dispute] = _challenge_data(payout, ruling_recorded_for_round=index)
+        accounts[payout] = _payout_data(dispute, mint=bytes([9]) * 32)
+    loader = FakeLoader(accounts)
+
+    result = run_verify_ruling_status(
+        Namespace(disputes=[f"{dispute}:1" for dispute in disputes], expected_status=None),
+        _settings(),
+        loader=loader,
+    )
+
+    assert result.status == CommandStatus.PENDING
+    assert [entry["status"] for entry in result.details["rulings"]] == [
+        "pending",
+        "pending",
+        "executed",
+    ]
+    assert loader.requests == [disputes, payouts]
+
+
+def test_decode_payout_handles_optional_fields() -> None:
+    with_mint = decode_payout(_payout_data(mint=bytes([9]) * 32, final_outcome=1))
+    without_challenge = decode_payout(_payout_data(None))
+
+    assert with_mint.challenge == DISPUTE
+    assert with_mint.final_outcome == 1
+    assert without_challenge.challenge is None
+    assert without_challenge.bump == 0xFE
 
 
 def test_verify_ruling_status_rejects_invalid_expected_status() -> None:
@@ -40,6 +201,13 @@ def test_verify_ruling_status_rejects_empty_dispute_id() -> None:
     assert result.details["error"] == "dispute_id is required"
 
 
+def test_verify_ruling_status_rejects_invalid_dispute_pair() -> None:
+    result = run_verify_ruling_status(Namespace(disputes=[DISPUTE]), _settings())
+
+    assert result.status == CommandStatus.FAILED
+    assert result.details["error"] == "disputes must use the form DISPUTE_ID:ROUND"
+
+
 def test_verify_ruling_status_rejects_negative_round() -> None:
     result = run_verify_ruling_status(_args(round=-1), _settings())
 